@@ -0,0 +1,148 @@
+"""
+Compare export time of the 'tight' and 'fast' export layouts for every plot type.
+
+'tight' crops each file with bbox_inches="tight", so savefig draws the figure
+once to measure it and again to write it (TimePlot adds a tight_layout pass
+on top). 'fast' measures the crop without drawing and skips tight_layout, so
+the figure is drawn a single time. For each plot type the script renders the
+same chart with both layouts, alternating between them so drift in machine
+load affects both alike, and reports the median render-and-export time, its
+interquartile range and the number of figure draws. A saving is only marked
+as consistent when the slowest quartile of 'fast' beats the fastest quartile
+of 'tight'.
+
+Usage:
+    python scripts/benchmark_export_layout.py
+    python scripts/benchmark_export_layout.py --repeat 50 --format png svg
+"""
+
+import argparse
+import tempfile
+import time
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+
+from shirin.plot.core import (
+    AccuracyPlotOptions,
+    BarPlotOptions,
+    CountPlotOptions,
+    HistogramOptions,
+    LinePlotOptions,
+    NormalizedCountPlotOptions,
+    PiePlotOptions,
+    PlotExporter,
+    TimePlotOptions,
+    create_plot,
+)
+from shirin.plot.core.renderer import AggRenderer
+
+
+LAYOUTS = ("tight", "fast")
+
+
+def build_cases(rows: int) -> dict:
+    """One representative chart per plot type, keyed by a display name."""
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "category": rng.choice(["a", "b", "c", "d", "e"], rows),
+        "group": rng.choice(["x", "y", "z"], rows),
+        "value": rng.integers(0, 100, rows),
+        "score": rng.random(rows),
+        "date": pd.Timestamp("2020-01-01") + pd.to_timedelta(rng.integers(0, 800, rows), unit="D"),
+    })
+    palette = {"x": "#1f77b4", "y": "#ff7f0e", "z": "#2ca02c"}
+    totals = df.groupby(["category", "group"], as_index=False)["value"].sum()
+    return {
+        "count": ("count", CountPlotOptions(df=df, axis_column="category", hue="group")),
+        "count_stacked": ("count", CountPlotOptions(
+            df=df, axis_column="category", hue="group", stacked=True,
+            stacked_labels="standard", palette=palette,
+        )),
+        "normalized_count": ("normalized_count", NormalizedCountPlotOptions(
+            df=df, axis_column="category", hue="group", palette=palette,
+        )),
+        "bar": ("bar", BarPlotOptions(df=totals, axis_column="category", value="value", hue="group")),
+        "histogram": ("histogram", HistogramOptions(df=df, x="value", hue="group", bins=20)),
+        "line": ("line", LinePlotOptions(df=df.head(200), x="value", y="score", hue="group")),
+        "pie": ("pie", PiePlotOptions(
+            df=df["group"].value_counts().to_frame("count"), col="count", palette=palette,
+        )),
+        "time": ("time", TimePlotOptions(df=df, x="date", group_by="month")),
+        "accuracy": ("accuracy", AccuracyPlotOptions(
+            df=pd.DataFrame({"model": ["m1", "m2", "m3"], "accuracy": [0.9, 0.7, 0.8]}),
+            axis_column="model", value_column="accuracy", plot_legend=False,
+        )),
+    }
+
+
+def export_once(plot_type: str, options, exporter: PlotExporter, layout: str) -> tuple[float, int]:
+    """Render and export one chart; return (seconds, figure draws)."""
+    start = time.perf_counter()
+    plot = create_plot(plot_type, options, AggRenderer(auto_layout=layout == "tight"))
+    plot.render()
+    # Count every draw, including the measuring draw savefig does internally.
+    draws = 0
+    draw = plot.figure.draw
+
+    def counting_draw(renderer):
+        nonlocal draws
+        draws += 1
+        return draw(renderer)
+
+    plot.figure.draw = counting_draw
+    exporter.export_only(plot_type, plot.figure)
+    elapsed = time.perf_counter() - start
+    plot.close()
+    return elapsed, draws
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30, help="Exports per plot type and layout")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows of sample data")
+    parser.add_argument("--format", nargs="+", default=["png"], help="Export format(s)")
+    args = parser.parse_args()
+
+    cases = build_cases(args.rows)
+    rows = []
+    with tempfile.TemporaryDirectory() as output_dir:
+        exporters = {
+            layout: PlotExporter(output_dir=output_dir, format=args.format, auto_show=False, layout=layout)
+            for layout in LAYOUTS
+        }
+        for name, (plot_type, options) in cases.items():
+            runs: dict = {layout: [] for layout in LAYOUTS}
+            # Warm-up run so font caches etc. don't count against the first layout.
+            for layout in LAYOUTS:
+                export_once(plot_type, options, exporters[layout], layout)
+            for _ in range(args.repeat):
+                for layout in LAYOUTS:
+                    runs[layout].append(export_once(plot_type, options, exporters[layout], layout))
+
+            row = {"plot": name}
+            quartiles = {}
+            for layout in LAYOUTS:
+                times = np.array([elapsed for elapsed, _ in runs[layout]]) * 1000
+                quartiles[layout] = np.percentile(times, [25, 50, 75])
+                row[f"{layout}_ms"] = quartiles[layout][1]
+                row[f"{layout}_iqr_ms"] = quartiles[layout][2] - quartiles[layout][0]
+                row[f"{layout}_draws"] = runs[layout][0][1]
+            row["saved_ms"] = row["tight_ms"] - row["fast_ms"]
+            row["saved_pct"] = 100 * row["saved_ms"] / row["tight_ms"]
+            row["consistent"] = bool(quartiles["fast"][2] < quartiles["tight"][0])
+            rows.append(row)
+
+    result = pd.DataFrame(rows).set_index("plot")
+    print(result.round(1).to_string())
+    print(f"\nMedian saving per chart: {result['saved_ms'].median():.1f} ms "
+          f"({result['saved_pct'].median():.0f}%); "
+          f"consistent for {int(result['consistent'].sum())} of {len(result)} plot types")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Measure how long common shirin entry points take to import in a fresh interpreter.
+
+Each statement runs in a new Python process several times; the fastest run is
+reported together with the heavy libraries the statement pulled in. Use
+--max-seconds to fail (exit code 1) when any statement is slower, e.g. in CI.
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --repeat 10 --max-seconds 1.5
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+
+
+STATEMENTS = [
+    "import shirin",
+    "import shirin.plot",
+    "from shirin.plot import PlotGraphs",
+    "import shirin.plot.batch",
+    "import shirin.sql",
+    "import shirin.assets.fake_data",
+]
+
+HEAVY_MODULES = ["pandas", "matplotlib.pyplot", "seaborn", "sqlalchemy"]
+
+
+def time_statement(statement: str, repeat: int) -> float:
+    """Fastest wall time (seconds) of ``statement`` in a fresh interpreter."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", statement], check=True)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def loaded_modules(statement: str) -> list[str]:
+    check = f"{statement}\nimport sys\nprint(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per statement")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail above this import time")
+    args = parser.parse_args()
+
+    baseline = time_statement("pass", args.repeat)
+    print(f"{'statement':40s} {'seconds':>8s}  loads")
+    print(f"{'(interpreter start-up)':40s} {baseline:8.3f}")
+    too_slow = []
+    for statement in STATEMENTS:
+        elapsed = time_statement(statement, args.repeat)
+        print(f"{statement:40s} {elapsed:8.3f}  {', '.join(loaded_modules(statement)) or '-'}")
+        if args.max_seconds is not None and elapsed > args.max_seconds:
+            too_slow.append(statement)
+
+    if too_slow:
+        print(f"\nSlower than {args.max_seconds}s: {', '.join(too_slow)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
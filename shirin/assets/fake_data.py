@@ -142,13 +142,31 @@ def generate_time_series(
 
     return pd.DataFrame(rows)
 
-df_accuracy = pd.DataFrame({
-    'run_name': ['medium', 'nano', 'small'],
-    'accuracy': [0.99, 0.71, 0.85],
-})
-
-# Existing fake datasets
-df, df_documents_by_year = generate_fake_data()
-# Time-series fake dataset for testing `timeplot` grouping by day/month/year
-# Use larger yearly_growth by default to produce more extreme increasing totals
-df_time = generate_time_series(yearly_growth=0.5)
\ No newline at end of file
+def _create_accuracy_dataframe() -> DataFrame:
+    return pd.DataFrame({
+        'run_name': ['medium', 'nano', 'small'],
+        'accuracy': [0.99, 0.71, 0.85],
+    })
+
+
+def _create_datasets(name: str) -> None:
+    if name in ('df', 'df_documents_by_year'):
+        # Existing fake datasets
+        globals()['df'], globals()['df_documents_by_year'] = generate_fake_data()
+    elif name == 'df_time':
+        # Time-series fake dataset for testing `timeplot` grouping by day/month/year
+        # Use larger yearly_growth by default to produce more extreme increasing totals
+        globals()['df_time'] = generate_time_series(yearly_growth=0.5)
+    else:
+        globals()['df_accuracy'] = _create_accuracy_dataframe()
+
+
+_DATASETS = ('df', 'df_documents_by_year', 'df_time', 'df_accuracy')
+
+
+def __getattr__(name: str):
+    # The datasets (160k+ rows) are generated on first access, not on import.
+    if name not in _DATASETS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    _create_datasets(name)
+    return globals()[name]
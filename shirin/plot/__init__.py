@@ -1,15 +1,34 @@
-import pandas as pd
+import importlib
+from typing import TYPE_CHECKING, Any, List
 
-from .all_plots import PlotGraphs
-from .config import Colors, Palette, LabelMapping
-from .config.matplotlib import configure_matplotlib
+if TYPE_CHECKING:
+    from .all_plots import PlotGraphs
+    from .config import Colors, Palette, LabelMapping
+    from .core import FigurePool, RenderCache, TransformCache
 
+# Nothing is imported (and no matplotlib or pandas options are set) until a
+# name is first used; the base style is applied when plotting starts.
+_LAZY_ATTRIBUTES = {
+    'PlotGraphs': '.all_plots',
+    'TransformCache': '.core',
+    'RenderCache': '.core',
+    'FigurePool': '.core',
+    'Colors': '.config',
+    'Palette': '.config',
+    'LabelMapping': '.config',
+}
 
-pd.set_option("display.max_colwidth", None)
-pd.set_option("display.width", 0)
 
-# Apply base matplotlib style (grid, spines, sizes, etc.) without a custom font.
-configure_matplotlib()
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
 
 
-__all__ = ['PlotGraphs', 'Colors', 'Palette', 'LabelMapping']
\ No newline at end of file
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_LAZY_ATTRIBUTES])
+
+
+__all__ = ['PlotGraphs', 'TransformCache', 'RenderCache', 'FigurePool', 'Colors', 'Palette', 'LabelMapping']
@@ -1,12 +1,21 @@
 import os
 import pandas as pd
-from typing import Any, Dict, Optional, Union
-import matplotlib.pyplot as plt
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 from .config import OrderTypeInput, StackedLabelTypeInput, FigureSizeInput, FillMissingValuesInput, TimeGroupByInput
-from .config.matplotlib import configure_matplotlib
+from .config.matplotlib import configure_matplotlib, ensure_matplotlib_configured
+from .config.pandas import ensure_pandas_display_configured
 from .core import (
+    AbstractPlot,
+    BasePlotOptions,
+    FigurePool,
     PlotExporter,
+    RenderCache,
+    RenderStats,
+    SeabornRenderer,
+    TransformCache,
     CountPlotOptions,
     BarPlotOptions,
     HistogramOptions,
@@ -17,6 +26,10 @@ from .core import (
     AccuracyPlotOptions,
     create_plot,
 )
+from .core.instrumentation import measure_stage, stats_to_frame, trace_memory
+from .core.render_cache import render_key
+from .core.renderer import AggRenderer
+from .batch import BatchResult, PlotBatch, PlotJob, render_jobs
 from .common.file_operations import calculate_value_counts
 from .common.resolve_palette import resolve_palette
 from .config.colors import Colors
@@ -30,16 +43,47 @@ class PlotGraphs:
     **bar plots**, **histograms**, **line plots**, and **pie charts**. All plots can be automatically
     exported to files with customizable settings.
 
+    Importing `shirin.plot` changes no global settings. The first `PlotGraphs` applies the
+    package's matplotlib style to the rcParams that are still at their matplotlibrc values
+    (rcParams you set beforehand are kept) and sets the pandas display options once.
+
     Args:
         export: Whether to automatically export plots to files. *Default: `True`*.
         output_dir: Directory where exported plots will be saved. *Default: `'./plot_output/'`*.
         prefix: Optional prefix to add to all exported filenames. *Default: `None`*.
-        format: File format for exported plots. **Options:** `'png'`, `'svg'`. *Default: `'png'`*.
+        format: File format for exported plots, or a list of formats (e.g. `['png', 'svg']`) to write
+            each plot in all of them from a single render. **Options:** `'png'`, `'svg'`, `'pdf'`.
+            *Default: `'png'`*.
         font: Font to use for all text. **Options:** `'satoshi'`, `None` (matplotlib default).
             *Default: `None`*.
         palette: A :class:`Palette` subclass with column-name attributes. When a plot uses
             `hue=col`, the matching palette is resolved automatically.
         label_mapping: A :class:`LabelMapping` subclass. Same resolution logic as `palette`.
+        instrument: Whether to record per-stage timings and memory for every plot.
+            Results are collected in `render_stats`. *Default: `False`*.
+        transform_cache: A :class:`TransformCache` reused across plots. Re-rendering the same
+            data with only cosmetic changes (labels, palette, legend) then skips preprocessing
+            and aggregation. *Default: `None`* (no caching).
+        figure_pool: A :class:`FigurePool` that recycles figures of the same size instead of
+            creating a new one per plot. Not used with `background_export`. *Default: `None`*.
+        keep_plots: Keep the figure and intermediate data of the most recent plot open in
+            `last_plot`. By default figures are closed (or returned to `figure_pool`) and
+            intermediates released once the plot is exported and shown. *Default: `False`*.
+        background_export: Save files on background threads while the next plot is being
+            built. Plots are drawn on standalone figures that pyplot doesn't track; in Jupyter
+            they are displayed from a PNG encoded before queueing. Call `flush()` (or use
+            `PlotGraphs` as a context manager) to wait for all files and raise an
+            `ExportError` if any failed. *Default: `False`*.
+        max_pending_exports: With `background_export`, how many figures may wait to be saved
+            before plotting blocks. *Default: `8`*.
+        render_cache: A :class:`RenderCache`. When exporting, a chart whose plot type, options,
+            data, matplotlib style and library versions match a cached file is copied from
+            the cache instead of being rendered. Ignored with `keep_plots`. *Default: `None`*.
+        export_layout: **Options:** `'tight'` draws every figure twice: once to measure the crop
+            and once to write it. `'fast'` measures the crop without drawing and skips the extra
+            `tight_layout` pass of time plots, so each file is drawn once. The crop may differ
+            by a few pixels, and the single draw doesn't make exports measurably faster for
+            most plot types (see `scripts/benchmark_export_layout.py`). *Default: `'tight'`*.
 
     Example:
         >>> plot = PlotGraphs(export=True, output_dir='./charts/', prefix='analysis')
@@ -47,6 +91,9 @@ class PlotGraphs:
 
         >>> plot = PlotGraphs(font='satoshi')
         >>> plot.countplot_x(df, x='category', output_name='category_counts')
+
+        >>> with PlotGraphs(export=True, background_export=True) as plot:
+        ...     plot.countplot_x(df, x='category', output_name='category_counts')
     """
 
     def __init__(
@@ -54,26 +101,214 @@ class PlotGraphs:
         export: bool = False,
         output_dir: str = os.path.expanduser("./plot_output/"),
         prefix: Optional[str] = None,
-        format: str = 'png',
+        format: Union[str, List[str]] = 'png',
         font: Optional[str] = None,
         palette: Optional[type[Palette]] = None,
         label_mapping: Optional[type[LabelMapping]] = None,
+        instrument: bool = False,
+        transform_cache: Optional[TransformCache] = None,
+        figure_pool: Optional[FigurePool] = None,
+        keep_plots: bool = False,
+        background_export: bool = False,
+        max_pending_exports: int = 8,
+        render_cache: Optional[RenderCache] = None,
+        export_layout: str = 'tight',
     ) -> None:
         if font is not None:
             configure_matplotlib(font=font)
+        ensure_matplotlib_configured()
+        ensure_pandas_display_configured()
 
         self._exporter = PlotExporter(
             enabled=export,
             output_dir=output_dir,
             prefix=prefix,
             format=format,
-            auto_show=True
+            auto_show=True,
+            background=background_export,
+            max_pending=max_pending_exports,
+            layout=export_layout,
         )
         self._palette = palette
         self._label_mapping = label_mapping
+        self._instrument = instrument
+        self._transform_cache = transform_cache
+        self._font = font
+        self._batch: Optional[PlotBatch] = None
+        self._renderer: SeabornRenderer
+        if background_export:
+            # Export threads save and release the figures, so they must never
+            # be registered with pyplot, whose figure manager isn't thread-safe.
+            self._renderer = AggRenderer(auto_layout=export_layout != 'fast')
+        else:
+            self._renderer = SeabornRenderer(
+                figure_pool=figure_pool,
+                auto_layout=export_layout != 'fast',
+            )
+        self._keep_plots = keep_plots
+        self._render_cache = render_cache
+        self.last_plot: Optional[AbstractPlot] = None
+        self.render_stats: List[RenderStats] = []
+
+    def _render_and_export(self, plot_type: str, options: BasePlotOptions, output_name: str) -> None:
+        if self._batch is not None:
+            self._batch.jobs.append(PlotJob(plot_type, options, output_name))
+            return
+
+        cache_key = None
+        if self._render_cache is not None and self._exporter.enabled and not self._keep_plots:
+            cache_key = render_key(plot_type, options, self._exporter.settings_key)
+            if cache_key is not None and self._restore_cached(plot_type, cache_key, output_name):
+                return
+
+        plot = create_plot(plot_type, options, self._renderer)
+        plot.render(instrument=self._instrument, cache=self._transform_cache)
+
+        # Time saving and displaying separately so savefig cost is visible.
+        stats = plot.render_stats
+        release = None if self._keep_plots else plot.close
+        on_saved = None
+        if cache_key is not None:
+            on_saved = partial(self._store_rendered, cache_key)
+        with trace_memory(stats is not None):
+            self._exporter.export_and_show(
+                output_name, plot.figure, on_complete=release, on_saved=on_saved, stats=stats
+            )
+        if stats is not None:
+            stats.name = output_name
+            self.render_stats.append(stats)
+
+        if self._keep_plots:
+            if self.last_plot is not None:
+                if self._exporter.background:
+                    self._exporter.flush()
+                self.last_plot.close()
+            self.last_plot = plot
+
+    def _restore_cached(self, plot_type: str, cache_key: str, output_name: str) -> bool:
+        stats = RenderStats(plot_type=plot_type, name=output_name) if self._instrument else None
+        with trace_memory(stats is not None):
+            with measure_stage(stats, 'render_cache'):
+                hit = all(
+                    self._render_cache.restore(  # type: ignore[union-attr]
+                        cache_key, format, self._exporter._create_filepath(output_name, format)
+                    )
+                    for format in self._exporter.formats
+                )
+        if not hit:
+            return False
+        if self._exporter.display_format is not None:
+            self._exporter.show_file(
+                self._exporter._create_filepath(output_name, self._exporter.display_format)
+            )
+        if stats is not None:
+            self.render_stats.append(stats)
+        return True
+
+    def _store_rendered(self, cache_key: str, filepath: str) -> None:
+        format = os.path.splitext(filepath)[1][1:]
+        self._render_cache.store(cache_key, format, filepath)  # type: ignore[union-attr]
+
+    def flush(self) -> None:
+        """Wait until all background exports are written.
+
+        Raises:
+            ExportError: If any export failed since the last flush.
+        """
+        self._exporter.flush()
+
+    def __enter__(self) -> 'PlotGraphs':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._exporter.__exit__(exc_type, exc_value, traceback)
+
+    def render_stats_frame(self) -> pd.DataFrame:
+        """Return the collected `render_stats` as one row per plot and stage."""
+        return stats_to_frame(self.render_stats)
+
+    @contextmanager
+    def batch(
+        self,
+        max_workers: Optional[int] = None,
+        executor: str = 'process',
+    ) -> Iterator[PlotBatch]:
+        """Collect plot calls and render them in parallel when the block exits.
+
+        Inside the block, plot methods only record their request. On exit all
+        plots are rendered on a pool of `max_workers` processes and exported with
+        the usual `prefix`/`output_name`/`format` naming; nothing is displayed.
+        Repeated output names get `_2`, `_3`, ... suffixes in call order. A failing
+        plot is reported in `batch.results` and does not stop the others.
 
-    def _export_graph(self, output_name: str) -> None:
-        self._exporter.export_and_show(output_name)
+        Args:
+            max_workers: Number of workers. `1` renders in the current process.
+                *Default: `None`* (one per CPU).
+            executor: **Options:** `'process'` (process pool) or `'thread'` (thread pool in
+                this process; plots are drawn without pyplot so they don't interfere).
+                *Default: `'process'`*.
+
+        Example:
+            >>> plot = PlotGraphs(export=True, output_dir='./charts/')
+            >>> with plot.batch(max_workers=4) as batch:
+            ...     plot.countplot_x(df, x='category', output_name='categories')
+            ...     plot.timeplot(df, x='date', output_name='events')
+            >>> [result.output_name for result in batch.errors]
+        """
+        if self._batch is not None:
+            raise RuntimeError("batch() blocks cannot be nested")
+
+        batch = PlotBatch(max_workers=max_workers, executor=executor)
+        self._batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch = None
+
+        batch.results = render_jobs(
+            batch.jobs,
+            self._exporter,
+            max_workers=max_workers,
+            font=self._font,
+            instrument=self._instrument,
+            executor=executor,
+        )
+        self.render_stats.extend(
+            result.render_stats for result in batch.results if result.render_stats is not None
+        )
+
+    def render_many(
+        self,
+        specs: List[Dict[str, Any]],
+        max_workers: Optional[int] = None,
+        executor: str = 'process',
+    ) -> List[BatchResult]:
+        """Render several plots in parallel from a list of specs.
+
+        Each spec is a dict with a `'plot'` key naming a `PlotGraphs` method
+        (e.g. `'countplot_x'`) and that method's keyword arguments.
+
+        Args:
+            specs: Plot specifications.
+            max_workers: Number of workers. *Default: `None`* (one per CPU).
+            executor: `'process'` or `'thread'`, see :meth:`batch`. *Default: `'process'`*.
+
+        Returns:
+            One :class:`BatchResult` per spec, in order.
+
+        Example:
+            >>> plot = PlotGraphs(export=True)
+            >>> plot.render_many([
+            ...     {'plot': 'countplot_x', 'df': df, 'x': 'category'},
+            ...     {'plot': 'timeplot', 'df': df, 'x': 'date', 'group_by': 'month'},
+            ... ])
+        """
+        with self.batch(max_workers=max_workers, executor=executor) as batch:
+            for spec in specs:
+                spec = dict(spec)
+                method = getattr(self, spec.pop('plot'))
+                method(**spec)
+        return batch.results
 
 
     @resolve_palette
@@ -149,8 +384,7 @@ class PlotGraphs:
                 suffix=suffix,
             )
 
-            plot = create_plot('normalized_count', options)
-            plot.render()
+            plot_type = 'normalized_count'
         else:
             options = CountPlotOptions(
                 df=df,
@@ -174,9 +408,8 @@ class PlotGraphs:
                 suffix=suffix,
             )
 
-            plot = create_plot('count', options)
-            plot.render()
-        self._export_graph(output_name)
+            plot_type = 'count'
+        self._render_and_export(plot_type, options, output_name)
 
 
     @resolve_palette
@@ -252,8 +485,7 @@ class PlotGraphs:
                 suffix=suffix,
             )
 
-            plot = create_plot('normalized_count', options)
-            plot.render()
+            plot_type = 'normalized_count'
         else:
             options = CountPlotOptions(
                 df=df,
@@ -277,9 +509,8 @@ class PlotGraphs:
                 suffix=suffix,
             )
 
-            plot = create_plot('count', options)
-            plot.render()
-        self._export_graph(output_name)
+            plot_type = 'count'
+        self._render_and_export(plot_type, options, output_name)
 
 
     @resolve_palette
@@ -316,9 +547,7 @@ class PlotGraphs:
             legend_offset=legend_offset,
             ncol=ncol
         )
-        plot = create_plot('histogram', options)
-        plot.render()
-        self._export_graph(output_name)
+        self._render_and_export('histogram', options, output_name)
 
     @resolve_palette
     def pie(
@@ -343,9 +572,7 @@ class PlotGraphs:
             value_datalabel=value_datalabel,
             donut=donut
         )
-        plot = create_plot('pie', options)
-        plot.render()
-        self._export_graph(output_name)
+        self._render_and_export('pie', options, output_name)
 
 
     @resolve_palette
@@ -382,9 +609,7 @@ class PlotGraphs:
             rotation=rotation,
             fill_missing_values=fill_missing_values
         )
-        plot = create_plot('line', options)
-        plot.render()
-        self._export_graph(output_name)
+        self._render_and_export('line', options, output_name)
 
     @resolve_palette
     def barplot_x(
@@ -456,9 +681,7 @@ class PlotGraphs:
             suffix=suffix,
         )
 
-        plot = create_plot('bar', options)
-        plot.render()
-        self._export_graph(output_name)
+        self._render_and_export('bar', options, output_name)
 
     @resolve_palette
     def barplot_y(
@@ -530,9 +753,7 @@ class PlotGraphs:
             suffix=suffix,
         )
 
-        plot = create_plot('bar', options)
-        plot.render()
-        self._export_graph(output_name)
+        self._render_and_export('bar', options, output_name)
 
 
     def timeplot(
@@ -582,9 +803,7 @@ class PlotGraphs:
             cumulative=cumulative,
             rotation=rotation,
         )
-        plot = create_plot('time', options)
-        plot.render()
-        self._export_graph(output_name)
+        self._render_and_export('time', options, output_name)
 
     def accuracy(
         self,
@@ -656,6 +875,4 @@ class PlotGraphs:
             suffix=suffix,
         )
 
-        plot = create_plot('accuracy', options)
-        plot.render()
-        self._export_graph(output_name)
+        self._render_and_export('accuracy', options, output_name)
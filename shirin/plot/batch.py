@@ -0,0 +1,194 @@
+import copy
+import time
+import traceback
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+import matplotlib
+
+from .config.matplotlib import configure_matplotlib, ensure_matplotlib_configured
+from .core import BasePlotOptions, PlotExporter, RenderStats, create_plot
+from .core.renderer import AggRenderer
+from .shared_frame import FramePublisher, SharedFrame
+
+
+@dataclass
+class PlotJob:
+    """One deferred plot: what ``PlotGraphs`` would have rendered and exported.
+
+    When sent to a worker process, ``options.df`` is replaced by ``frame``, a
+    handle to the published DataFrame, so the data isn't pickled per job.
+    """
+    plot_type: str
+    options: BasePlotOptions
+    output_name: str
+    frame: Optional[SharedFrame] = None
+
+
+@dataclass
+class BatchResult:
+    """Outcome of one plot in a batch.
+
+    ``path`` is the exported file (``None`` when exporting is disabled or the
+    plot failed) and ``error`` the formatted traceback of a failed plot.
+    """
+    plot_type: str
+    output_name: str
+    path: Optional[str] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+    render_stats: Optional[RenderStats] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class PlotBatch:
+    """Plot requests collected inside ``PlotGraphs.batch()``.
+
+    ``results`` is filled in submission order when the ``with`` block exits.
+    """
+    max_workers: Optional[int] = None
+    executor: str = 'process'
+    jobs: List[PlotJob] = field(default_factory=list)
+    results: List[BatchResult] = field(default_factory=list)
+
+    @property
+    def errors(self) -> List[BatchResult]:
+        return [result for result in self.results if not result.ok]
+
+
+def unique_output_names(names: Iterable[str]) -> List[str]:
+    """Suffix repeated names with ``_2``, ``_3``, ... in submission order.
+
+    Several plots in a batch often keep a method's default ``output_name``;
+    without this they would overwrite each other in arbitrary order.
+    """
+    names = list(names)
+    taken = set(names)
+    used = set()
+    suffixes: Dict[str, int] = {}
+    unique = []
+    for name in names:
+        candidate = name
+        if name in used:
+            suffix = suffixes.get(name, 1)
+            while candidate in taken:
+                suffix += 1
+                candidate = f"{name}_{suffix}"
+            suffixes[name] = suffix
+            taken.add(candidate)
+        used.add(name)
+        unique.append(candidate)
+    return unique
+
+
+def _init_worker(font: Optional[str]) -> None:
+    matplotlib.use('Agg')
+    if font is not None:
+        configure_matplotlib(font=font)
+    ensure_matplotlib_configured()
+
+
+def _render_job(job: PlotJob, exporter: PlotExporter, instrument: bool) -> BatchResult:
+    result = BatchResult(plot_type=job.plot_type, output_name=job.output_name)
+    start = time.perf_counter()
+    plot = None
+    try:
+        options = job.options
+        if job.frame is not None:
+            options = copy.copy(options)
+            options.df = job.frame.load(options.data_columns())
+        # Batches never display, so plots skip pyplot entirely.
+        renderer = AggRenderer(auto_layout=exporter.layout != 'fast')
+        plot = create_plot(job.plot_type, options, renderer)
+        plot.render(instrument=instrument)
+        result.path = exporter.export_only(job.output_name, plot.figure)
+        result.render_stats = plot.render_stats
+        if result.render_stats is not None:
+            result.render_stats.name = job.output_name
+    except Exception:
+        result.error = traceback.format_exc()
+    finally:
+        if plot is not None:
+            plot.close()
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def render_jobs(
+    jobs: List[PlotJob],
+    exporter: PlotExporter,
+    max_workers: Optional[int] = None,
+    font: Optional[str] = None,
+    instrument: bool = False,
+    executor: str = 'process',
+) -> List[BatchResult]:
+    """Render and export ``jobs``, returning one result per job in order.
+
+    Jobs run on a pool of ``max_workers`` workers (CPU count when ``None``);
+    ``max_workers=1`` renders in the current process. ``executor`` picks a
+    process pool (``'process'``) or a thread pool (``'thread'``); threads
+    avoid pickling and start-up costs but share the GIL. A failing plot is
+    reported in its result and does not stop the others.
+
+    For process pools each distinct input DataFrame is published once as a
+    memory-mapped Arrow file that workers attach to, reading only the
+    columns their options use.
+    """
+    if max_workers is not None and max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if executor not in ('process', 'thread'):
+        raise ValueError(f"Invalid executor '{executor}'. Valid options are: ('process', 'thread').")
+
+    names = unique_output_names(job.output_name for job in jobs)
+    jobs = [copy.copy(job) for job in jobs]
+    for job, name in zip(jobs, names):
+        job.output_name = name
+
+    # Workers never display and save synchronously; the batch only writes files.
+    exporter = PlotExporter(
+        enabled=exporter.enabled,
+        output_dir=exporter.output_dir,
+        prefix=exporter.prefix,
+        format=exporter.formats,
+        auto_show=False,
+        layout=exporter.layout,
+    )
+
+    if max_workers == 1 or len(jobs) <= 1:
+        return [_render_job(job, exporter, instrument) for job in jobs]
+
+    with ExitStack() as stack:
+        pool: Executor
+        if executor == 'thread':
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=max_workers))
+        else:
+            publisher = stack.enter_context(FramePublisher())
+            pool = stack.enter_context(ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_worker,
+                initargs=(font,),
+            ))
+            for job in jobs:
+                job.frame = publisher.publish(job.options.df)
+                if job.frame is not None:
+                    job.options = copy.copy(job.options)
+                    job.options.df = None  # type: ignore[assignment]
+        futures = [pool.submit(_render_job, job, exporter, instrument) for job in jobs]
+        results = []
+        for job, future in zip(jobs, futures):
+            try:
+                results.append(future.result())
+            except Exception:
+                # Pickling failures and crashed workers end up here.
+                results.append(BatchResult(
+                    plot_type=job.plot_type,
+                    output_name=job.output_name,
+                    error=traceback.format_exc(),
+                ))
+        return results
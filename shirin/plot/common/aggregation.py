@@ -0,0 +1,28 @@
+from typing import Optional
+
+import pandas as pd
+
+
+COUNT_COLUMN = '__count__'
+
+
+def aggregate_counts(
+    df: pd.DataFrame,
+    axis_column: str,
+    hue: Optional[str] = None
+) -> pd.DataFrame:
+    """Count rows per axis category (and hue level) in a single pass.
+
+    Returns one row per observed combination with the count stored in
+    ``COUNT_COLUMN``. Groups keep their order of first appearance so that
+    unordered plots and legends match what seaborn would derive from the
+    raw rows. Categorical keys are grouped on their codes and come back as
+    plain labels, so the renderer never sees unused categories.
+    """
+    keys = [axis_column] if hue is None else [axis_column, hue]
+    counts = df.groupby(keys, sort=False, observed=True).size()
+    counts = counts.reset_index(name=COUNT_COLUMN)
+    for key in keys:
+        if isinstance(counts[key].dtype, pd.CategoricalDtype):
+            counts[key] = counts[key].astype(object)
+    return counts
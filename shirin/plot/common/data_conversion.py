@@ -1,5 +1,5 @@
 import pandas as pd
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 
 def convert_dict_keys_to_string(d: Optional[dict]) -> Optional[dict]:
@@ -17,14 +17,64 @@ def convert_palette_to_strings(palette: Dict[Any, str]) -> Dict[str, str]:
     return {str(k): str(v) for k, v in palette.items()}
 
 
+def project_columns(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Select only ``columns`` so later steps never touch (or copy) the rest of ``df``.
+
+    The selection is already a new frame; the shallow copy just detaches it from
+    ``df`` so derived columns can be assigned without chained-assignment warnings.
+    """
+    return df[list(dict.fromkeys(columns))].copy(deep=False)
+
+
+# Shallow copies below: assigning a column replaces it in the copy without
+# writing into (or duplicating) the caller's arrays.
 def ensure_column_is_string(df: pd.DataFrame, col: str) -> pd.DataFrame:
-    df = df.copy()
+    df = df.copy(deep=False)
     df[col] = df[col].astype(str)
     return df
 
 
+def ensure_column_is_categorical(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """Encode ``col`` as a Categorical whose categories are its string labels.
+
+    Rows are factorized to integer codes and only the unique values go through
+    ``astype(str)``, so the labels are exactly what ``ensure_column_is_string``
+    would produce (and therefore match string-keyed palettes and label maps)
+    without allocating one Python string per row. Categories keep the order in
+    which values first appear.
+    """
+    series = df[col]
+    codes, uniques = pd.factorize(series)
+    labels = [str(label) for label in pd.Index(uniques).astype(str)]
+
+    # factorize folds every missing value into one sentinel, but astype(str)
+    # tells None, nan, NaT and <NA> apart, so label the missing rows directly.
+    missing = codes < 0
+    needs_reorder = bool(missing.any())
+    if needs_reorder:
+        missing_codes, missing_labels = pd.factorize(series[missing].astype(str))
+        codes = codes.copy()
+        codes[missing] = missing_codes + len(labels)
+        labels.extend(str(label) for label in missing_labels)
+
+    # Distinct values can share a label (e.g. 1 and '1'); merge them.
+    label_codes, unique_labels = pd.factorize(pd.Index(labels, dtype=object))
+    if len(unique_labels) < len(labels):
+        codes = label_codes[codes]
+        labels = list(unique_labels)
+        needs_reorder = True
+
+    if needs_reorder:
+        codes, first_seen = pd.factorize(codes)
+        labels = [labels[code] for code in first_seen]
+
+    df = df.copy(deep=False)
+    df[col] = pd.Categorical.from_codes(codes, categories=labels)
+    return df
+
+
 def ensure_column_is_int(df: pd.DataFrame, col: str) -> pd.DataFrame:
-    df = df.copy()
+    df = df.copy(deep=False)
     df[col] = df[col].astype(int)
     return df
 
@@ -36,7 +86,7 @@ def fill_missing_values_in_data(
     hue: Optional[str],
     fill_method: str
 ) -> pd.DataFrame:
-    df = df.copy()
+    df = df.copy(deep=False)
     
     if fill_method == 'shift':
         if hue is not None:
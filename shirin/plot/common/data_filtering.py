@@ -1,6 +1,17 @@
+from typing import Optional
+
 import pandas as pd
 
 
-def filter_top_n_categories(df: pd.DataFrame, y: str, top_n: int) -> pd.DataFrame:
-    top_categories = df[y].value_counts().nlargest(top_n).index
-    return df[df[y].isin(top_categories)].copy()
+def filter_top_n_categories(
+    df: pd.DataFrame,
+    y: str,
+    top_n: int,
+    value_column: Optional[str] = None
+) -> pd.DataFrame:
+    if value_column:
+        totals = df.groupby(y, observed=True)[value_column].sum()
+    else:
+        totals = df[y].value_counts()
+    top_categories = totals.nlargest(top_n).index
+    return df[df[y].isin(top_categories)]
@@ -1,7 +1,6 @@
 import os
 from typing import Optional
 
-import matplotlib.pyplot as plt
 import pandas as pd
 
 
@@ -32,4 +31,6 @@ def create_filepath(
 
 
 def save_plot(filepath: str, format: str) -> None:
+    import matplotlib.pyplot as plt
+
     plt.savefig(filepath, bbox_inches="tight", dpi=300, format=format)
@@ -1,4 +1,4 @@
-import matplotlib.pyplot as plt
+from matplotlib.axes import Axes
 from matplotlib.container import BarContainer
 from matplotlib.patches import Patch
 from typing import Dict, List, Optional
@@ -19,6 +19,7 @@ def _calculate_label_offset(
 
 
 def _format_labels(
+    ax: Axes,
     patches: List[Patch],
     label_offset: float,
     formatting: str,
@@ -40,17 +41,18 @@ def _format_labels(
                 text = f'{percentage:,.1f}%'.replace(',', '.')
             if suffix is not None and suffix.strip() != '':
                 text = f"{text} {suffix.strip()}"
-            _add_text(patch, dimension + label_offset, text, orientation)
+            _add_text(ax, patch, dimension + label_offset, text, orientation)
 
 
 def _add_text(
+    ax: Axes,
     patch: Patch,
     position: float,
     text: str,
     orientation: str,
 ) -> None:
     if orientation == 'vertical':
-        plt.text(
+        ax.text(
             patch.get_x() + patch.get_width() / 2.0,
             position,
             text,
@@ -60,7 +62,7 @@ def _add_text(
             color=TextColors.LIGHT_GREY,
         )
     elif orientation == 'horizontal':
-        plt.text(
+        ax.text(
             position,
             patch.get_y() + patch.get_height() / 2.0,
             text,
@@ -80,7 +82,7 @@ def format_datalabels(
 ) -> None:
     patches: List[Patch] = plot.patches
     label_offset = _calculate_label_offset(patches, label_offset, orientation)
-    _format_labels(patches, label_offset, formatting, orientation, suffix=suffix)
+    _format_labels(plot, patches, label_offset, formatting, orientation, suffix=suffix)
 
 
 def _format_stacked_percentage(value_percentage: float, suffix: Optional[str]) -> str:
@@ -100,7 +102,7 @@ def format_datalabels_stacked(
 ) -> None:
     max_count = pivot_data.sum(axis=1).max()
     threshold = 0.04 * max_count
-    ax = plt.gca()
+    ax = plot
 
     for index, row_values in enumerate(pivot_data.values):
         total = row_values.sum()
@@ -146,7 +148,7 @@ def format_datalabels_stacked_normalized(
     suffix: Optional[str] = None,
 ) -> None:
     threshold = 0.04
-    ax = plt.gca()
+    ax = plot
 
     for index, row_values in enumerate(pivot_data.values):
         cumulative_sum = 0
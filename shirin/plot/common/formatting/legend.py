@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 from typing import Any, Optional, Dict, Tuple, TYPE_CHECKING
 
 from ...config import TextColors, FontSizes
@@ -8,17 +7,15 @@ if TYPE_CHECKING:
     from matplotlib.axes import Axes
 
 
-plt.rcParams['legend.fontsize'] = FontSizes.LEGEND
-
-
 def format_legend(
+    ax: 'Axes',
     label_map: Optional[Dict[Any, str]], 
     ncol: int = 2, 
     bbox_to_anchor: Tuple[float, float] = (0, 1.08)
 ) -> None:
 
     # Get the current legend to access its handles and texts
-    current_legend = plt.gca().get_legend()
+    current_legend = ax.get_legend()
     if current_legend is None:
         return
     
@@ -31,7 +28,7 @@ def format_legend(
         legend_labels = None
 
     # Configure the legend
-    legend = plt.legend(
+    legend = ax.legend(
         handles,
         legend_labels, 
         title='', 
@@ -58,7 +55,7 @@ def format_optional_legend(
 ) -> None:
     if hue is not None:
         if plot_legend:
-            format_legend(label_map, ncol=ncol, bbox_to_anchor=(-0.01, legend_offset))
+            format_legend(plot, label_map, ncol=ncol, bbox_to_anchor=(-0.01, legend_offset))
         else:
             legend = plot.get_legend()
             if legend is not None:
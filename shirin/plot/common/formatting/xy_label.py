@@ -1,8 +1,6 @@
-import matplotlib.pyplot as plt
 from ...config import TextColors, FontSizes
 from matplotlib.axes import Axes
 
-plt.rcParams['axes.labelsize'] = FontSizes.XYLABEL
 
 def format_xy_labels(
     plot: Axes, 
@@ -12,7 +10,7 @@ def format_xy_labels(
     y_offset: float = 0.5, 
     y_labelpad: int = 20
 ) -> None:
-    plt.xlabel(
+    plot.set_xlabel(
         xlabel, 
         ha='center', 
         x=0.5, 
@@ -20,7 +18,7 @@ def format_xy_labels(
         fontsize=FontSizes.XYLABEL, 
         color=TextColors.BLACK
     )
-    plt.ylabel(
+    plot.set_ylabel(
         ylabel, 
         y=y_offset, 
         labelpad=y_labelpad, 
@@ -19,7 +19,7 @@ def prepare_stacked_data(
         df_pivot = df.pivot(index=category_col, columns=hue, values=value_col).fillna(0)
     else:
         # For countplots: count occurrences
-        df_subset = df[[hue, category_col]].copy()
+        df_subset = df[[hue, category_col]]
         value_counts = df_subset.value_counts()
         value_counts_frame = value_counts.to_frame(name="count").reset_index()
         df_pivot = value_counts_frame.pivot(index=category_col, columns=hue, values="count").fillna(0).astype(int)
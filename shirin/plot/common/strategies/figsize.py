@@ -23,12 +23,11 @@ class DynamicSizeStrategy(FigureSizeStrategy):
         column: str,
         orientation: str
     ) -> tuple[float, float]:
+        n_categories = df[column].nunique()
         if orientation == 'vertical':
-            n_categories = len(df[column].value_counts())
             width = (n_categories * 1) + 1
             height = FigureSize.STANDARD_HEIGHT
         else:
-            n_categories = len(df[column].value_counts())
             width = FigureSize.WIDTH
             height = (n_categories / 2) + 1
         return (width, height)
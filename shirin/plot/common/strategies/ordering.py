@@ -26,7 +26,7 @@ class FrequencyOrderingStrategy(OrderingStrategy):
         value_column: Optional[str] = None
     ) -> Optional[Any]:
         if value_column:
-            return df.groupby(column)[value_column].sum().sort_values(ascending=False).index  # type: ignore
+            return df.groupby(column, observed=True)[value_column].sum().sort_values(ascending=False).index  # type: ignore
         else:
             return df[column].value_counts().sort_values(ascending=False).index
 
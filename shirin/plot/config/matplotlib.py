@@ -1,14 +1,14 @@
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional
 
-import matplotlib.font_manager as fm
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 
 from .formatting import FontSizes, FigureSize
 
 FONT_FAMILY_SATOSHI = "Satoshi Shirin"
 
 _fonts_registered = False
+_configured = False
 
 
 def _register_fonts() -> None:
@@ -19,11 +19,49 @@ def _register_fonts() -> None:
     fonts_dir = Path(__file__).resolve().parent.parent.parent / "assets" / "fonts" / "patched"
     if not fonts_dir.exists():
         return
+    import matplotlib.font_manager as fm
+
     for font_path in fonts_dir.glob("*.ttf"):
         fm.fontManager.addfont(str(font_path))
     _fonts_registered = True
 
 
+def _base_style() -> Dict[str, Any]:
+    # mpl.rcParams['savefig.dpi'] = 300
+    # mpl.rcParams['savefig.format'] = 'png'
+    linestyle_grid = 'dotted'
+    color_grid = 'lightgrey'
+    linewidth_grid = 0.5
+
+    color_axis = 'black'
+    linewidth_axis = 0.5
+
+    return {
+        'figure.figsize': [FigureSize.WIDTH, FigureSize.HEIGHT],
+
+        'axes.grid': False,
+        'grid.color': color_grid,
+        'grid.linestyle': linestyle_grid,
+        'grid.linewidth': linewidth_grid,
+
+        'axes.spines.top': False,
+        'axes.spines.right': False,
+        'axes.spines.bottom': False,
+        'axes.spines.left': False,
+        'axes.edgecolor': color_axis,
+        'axes.linewidth': linewidth_axis,
+
+        'legend.framealpha': 0.0,
+
+        'font.size': FontSizes.TEXT,
+        'axes.titlesize': FontSizes.TITLE,
+        'xtick.labelsize': FontSizes.TICKS,
+        'ytick.labelsize': FontSizes.TICKS,
+        'axes.labelsize': FontSizes.XYLABEL,
+        'legend.fontsize': FontSizes.LEGEND,
+    }
+
+
 def configure_matplotlib(font: Optional[str] = None) -> None:
     """Configure matplotlib defaults.
 
@@ -31,42 +69,34 @@ def configure_matplotlib(font: Optional[str] = None) -> None:
         font: Font to use for all text. Pass ``'satoshi'`` to use the bundled
             Satoshi Shirin font. ``None`` keeps the matplotlib default.
     """
+    global _configured
     if font is not None:
         font_lower = font.lower()
         if font_lower == "satoshi":
             _register_fonts()
-            plt.rcParams['font.family'] = FONT_FAMILY_SATOSHI
+            mpl.rcParams['font.family'] = FONT_FAMILY_SATOSHI
         else:
             raise ValueError(
                 f"Unknown font {font!r}. Supported values: 'satoshi', None."
             )
 
-    # plt.rcParams['savefig.dpi'] = 300
-    # plt.rcParams['savefig.format'] = 'png'
-    plt.rcParams['figure.figsize'] = [FigureSize.WIDTH, FigureSize.HEIGHT]
-
-    linestyle_grid = 'dotted'
-    color_grid = 'lightgrey'
-    linewidth_grid = 0.5
-
-    plt.rcParams['axes.grid'] = False
-    plt.rcParams['grid.color'] = color_grid
-    plt.rcParams['grid.linestyle'] = linestyle_grid
-    plt.rcParams['grid.linewidth'] = linewidth_grid
-
-    color_axis = 'black'
-    linewidth_axis = 0.5
+    mpl.rcParams.update(_base_style())
+    _configured = True
 
-    plt.rcParams['axes.spines.top'] = False
-    plt.rcParams['axes.spines.right'] = False
-    plt.rcParams['axes.spines.bottom'] = False
-    plt.rcParams['axes.spines.left'] = False
-    plt.rcParams['axes.edgecolor'] = color_axis
-    plt.rcParams['axes.linewidth'] = linewidth_axis
 
-    plt.rcParams['legend.framealpha'] = 0.0
+def ensure_matplotlib_configured() -> None:
+    """Apply the base style unless ``configure_matplotlib()`` already ran.
 
-    plt.rcParams['font.size'] = FontSizes.TEXT
-    plt.rcParams['axes.titlesize'] = FontSizes.TITLE
-    plt.rcParams['xtick.labelsize'] = FontSizes.TICKS
-    plt.rcParams['ytick.labelsize'] = FontSizes.TICKS
+    Called when the first ``PlotGraphs`` or figure is created, so importing
+    the package doesn't touch matplotlib's global state. rcParams the user
+    changed before that point (i.e. that differ from the matplotlibrc values)
+    are kept; call ``configure_matplotlib()`` to apply the full style.
+    """
+    global _configured
+    if _configured:
+        return
+    mpl.rcParams.update({
+        key: value for key, value in _base_style().items()
+        if mpl.rcParams[key] == mpl.rcParamsOrig[key]
+    })
+    _configured = True
@@ -0,0 +1,21 @@
+import pandas as pd
+
+_configured = False
+
+
+def configure_pandas_display() -> None:
+    """Print DataFrames with full cell contents, wrapped to the available width."""
+    pd.set_option("display.max_colwidth", None)
+    pd.set_option("display.width", 0)
+
+
+def ensure_pandas_display_configured() -> None:
+    """Run ``configure_pandas_display()`` once per process.
+
+    Called by the first ``PlotGraphs``; importing the package leaves the
+    pandas options alone, and options changed after that call are kept.
+    """
+    global _configured
+    if not _configured:
+        configure_pandas_display()
+        _configured = True
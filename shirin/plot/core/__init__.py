@@ -1,5 +1,9 @@
 from .base_plot import AbstractPlot
-from .exporter import PlotExporter
+from .cache import TransformCache
+from .figures import FigurePool
+from .render_cache import RenderCache
+from .exporter import ExportError, PlotExporter
+from .instrumentation import RenderStats, StageStats
 from .factory import PlotFactory, PlotRegistry, create_plot, register_plot
 from .options import (
     BasePlotOptions,
@@ -24,6 +28,12 @@ from . import registration
 __all__ = [
     'AbstractPlot',
     'PlotExporter',
+    'ExportError',
+    'FigurePool',
+    'RenderStats',
+    'StageStats',
+    'TransformCache',
+    'RenderCache',
     'PlotRenderer',
     'SeabornRenderer',
     'PlotFactory',
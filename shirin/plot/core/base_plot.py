@@ -1,13 +1,21 @@
 from abc import ABC, abstractmethod
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 import pandas as pd
 
+from .cache import CacheEntry, TransformCache, fingerprint_frame, make_cache_key
+from .instrumentation import RenderStats, count_rows, measure_stage, trace_memory
 from .options import BasePlotOptions
 from .renderer import PlotRenderer, SeabornRenderer
 
 
 class AbstractPlot(ABC):
+    # Attributes set by transform that draw/format_plot read; a cached
+    # transform result restores them instead of re-running transform.
+    _transform_state: ClassVar[tuple[str, ...]] = ()
+    # Other per-render data (e.g. unlabeled pivots) dropped by release_data.
+    _intermediates: ClassVar[tuple[str, ...]] = ()
+
     def __init__(
         self,
         options: BasePlotOptions,
@@ -16,19 +24,89 @@ class AbstractPlot(ABC):
         self.options = options
         self.renderer = renderer or SeabornRenderer()
         self.plot_object: Optional[Any] = None
+        self.figure: Optional[Any] = None
+        self.ax: Optional[Any] = None
+        self.render_stats: Optional[RenderStats] = None
         self._preprocessed_df: Optional[pd.DataFrame] = None
     
-    def render(self) -> Any:
-        self.options.validate()
-        
-        self._preprocessed_df = self.preprocess()
-        transformed_data = self.transform(self._preprocessed_df)
-        self.plot_object = self.draw(transformed_data)
-        self.format_plot(self.plot_object)
-        self.finalize(self.plot_object)
+    def render(self, instrument: bool = False, cache: Optional[TransformCache] = None) -> Any:
+        """Run the plot pipeline.
+
+        With ``instrument=True`` wall time, CPU time, tracemalloc peak and row
+        counts are recorded for every stage into ``self.render_stats``.
+        With a ``cache``, preprocess/transform are skipped when the same data
+        was already transformed with the same data-affecting options.
+        """
+        stats = RenderStats(plot_type=type(self).__name__) if instrument else None
+        self.render_stats = stats
+
+        with trace_memory(instrument):
+            with measure_stage(stats, 'validate', self.options.df):
+                self.options.validate()
+            
+            cache_key = None
+            entry = None
+            if cache is not None:
+                with measure_stage(stats, 'cache_lookup', self.options.df):
+                    cache_key = self._cache_key()
+                    if cache_key is not None:
+                        entry = cache.get(cache_key)
+            
+            if entry is not None:
+                self._preprocessed_df = entry.preprocessed
+                transformed_data = entry.transformed
+                for name, value in entry.state.items():
+                    setattr(self, name, value)
+            else:
+                with measure_stage(stats, 'preprocess', self.options.df) as stage:
+                    self._preprocessed_df = self.preprocess()
+                    stage.rows_out = count_rows(self._preprocessed_df)
+                
+                with measure_stage(stats, 'transform', self._preprocessed_df) as stage:
+                    transformed_data = self.transform(self._preprocessed_df)
+                    stage.rows_out = count_rows(transformed_data)
+                
+                if cache is not None and cache_key is not None:
+                    cache.put(cache_key, CacheEntry(
+                        preprocessed=self._preprocessed_df,
+                        transformed=transformed_data,
+                        state={name: getattr(self, name) for name in self._transform_state},
+                    ))
+            
+            with measure_stage(stats, 'draw', transformed_data):
+                self.plot_object = self.draw(transformed_data)
+            
+            with measure_stage(stats, 'format_plot'):
+                self.format_plot(self.plot_object)
+            
+            with measure_stage(stats, 'finalize'):
+                self.finalize(self.plot_object)
         
         return self.plot_object
     
+    def close(self, keep_data: bool = False) -> None:
+        """Hand the figure back to the renderer (closed or pooled).
+
+        Intermediate frames are released too unless ``keep_data`` is set.
+        """
+        if self.figure is not None:
+            self.renderer.release_figure(self.figure)
+        self.figure = None
+        self.ax = None
+        self.plot_object = None
+        if not keep_data:
+            self.release_data()
+    
+    def release_data(self) -> None:
+        for name in ('_preprocessed_df', *self._transform_state, *self._intermediates):
+            setattr(self, name, None)
+    
+    def _cache_key(self) -> Optional[str]:
+        fingerprint = fingerprint_frame(self.options.df, self.options.data_columns())
+        if fingerprint is None:
+            return None
+        return make_cache_key(type(self).__name__, self.options.data_key(), fingerprint)
+    
     @abstractmethod
     def preprocess(self) -> pd.DataFrame:
         pass
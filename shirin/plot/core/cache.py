@@ -0,0 +1,229 @@
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+import pandas as pd
+
+
+DEFAULT_MAX_BYTES = 256 * 1024 ** 2
+DEFAULT_MAX_DISK_BYTES = 1024 ** 3
+
+_DISK_SUFFIXES = ('pre.parquet', 'out.parquet', 'state.pkl')
+
+
+def fingerprint_frame(df: pd.DataFrame, columns: Iterable[str]) -> Optional[str]:
+    """Content hash of ``columns`` of ``df`` (values, dtypes and index).
+
+    Returns ``None`` when the data can't be hashed (e.g. unhashable cell
+    values), in which case callers should skip caching.
+    """
+    columns = list(dict.fromkeys(columns))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((columns, [str(df[c].dtype) for c in columns], len(df))).encode())
+    try:
+        hashed = pd.util.hash_pandas_object(df[columns], index=True)
+    except (TypeError, ValueError):
+        return None
+    digest.update(hashed.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def make_cache_key(plot_type: str, data_key: Hashable, fingerprint: str) -> str:
+    return hashlib.blake2b(
+        repr((plot_type, data_key, fingerprint)).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _nbytes(value: Any) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    return 0
+
+
+@dataclass
+class CacheEntry:
+    """Output of preprocess/transform plus the plot attributes transform set."""
+    preprocessed: pd.DataFrame
+    transformed: Any
+    state: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            _nbytes(self.preprocessed)
+            + _nbytes(self.transformed)
+            + sum(_nbytes(value) for value in self.state.values())
+        )
+
+
+class TransformCache:
+    """LRU cache of preprocess/transform results, bounded by memory.
+
+    Entries are keyed by plot type, the data-affecting options and a
+    fingerprint of the input columns, so cosmetic re-renders (labels,
+    palette, legend) reuse the previous result. With ``directory`` set,
+    entries evicted from memory (and entries from earlier sessions) are
+    kept on disk as Parquet. ``max_disk_bytes`` caps that directory (1 GiB
+    by default, ``None`` for no limit), evicting the least recently used
+    entries first; unreadable entries are deleted and count as misses.
+
+    Cached frames are shared between renders and must be treated as
+    read-only by the draw/format stages.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: Optional[str] = None,
+        max_disk_bytes: Optional[int] = DEFAULT_MAX_DISK_BYTES,
+    ):
+        if max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        if max_disk_bytes is not None and max_disk_bytes < 0:
+            raise ValueError("max_disk_bytes cannot be negative")
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(self._sizes.values())
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._store(key, entry)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        return None
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        self._store(key, entry)
+        self._write_disk(key, entry)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                if name.endswith(('.parquet', '.pkl', '.tmp')):
+                    os.remove(os.path.join(self.directory, name))
+
+    def _store(self, key: str, entry: CacheEntry) -> None:
+        size = entry.nbytes
+        if size > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        while self.memory_bytes > self.max_bytes:
+            evicted, _ = self._entries.popitem(last=False)
+            del self._sizes[evicted]
+
+    def _disk_path(self, key: str, suffix: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f'{key}.{suffix}')
+
+    def _write_disk(self, key: str, entry: CacheEntry) -> None:
+        if self.directory is None or not isinstance(entry.transformed, pd.DataFrame):
+            return
+        try:
+            # The state file goes last: its presence marks a complete entry.
+            self._replace(key, 'pre.parquet', entry.preprocessed.to_parquet)
+            self._replace(key, 'out.parquet', entry.transformed.to_parquet)
+            self._replace(key, 'state.pkl', lambda path: _dump_pickle(entry.state, path))
+        except Exception:
+            # Not every frame survives Parquet (mixed object columns, ...);
+            # such entries just stay memory-only.
+            self._remove_disk(key)
+            return
+        self._evict_disk()
+
+    def _replace(self, key: str, suffix: str, write: Callable[[str], Any]) -> None:
+        # Write under a temporary name so readers never see partial files.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, self._disk_path(key, suffix))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _remove_disk(self, key: str) -> None:
+        for suffix in ('state.pkl', 'pre.parquet', 'out.parquet'):
+            try:
+                os.remove(self._disk_path(key, suffix))  # type: ignore[arg-type]
+            except FileNotFoundError:
+                pass
+
+    def _read_disk(self, key: str) -> Optional[CacheEntry]:
+        state_path = self._disk_path(key, 'state.pkl')
+        if state_path is None or not os.path.exists(state_path):
+            return None
+        try:
+            with open(state_path, 'rb') as f:
+                state = pickle.load(f)
+            entry = CacheEntry(
+                preprocessed=pd.read_parquet(self._disk_path(key, 'pre.parquet')),
+                transformed=pd.read_parquet(self._disk_path(key, 'out.parquet')),
+                state=state,
+            )
+        except Exception:
+            # Truncated or corrupt files (e.g. from an interrupted session)
+            # are dropped rather than failing the render.
+            self._remove_disk(key)
+            return None
+        # Mark as recently used for eviction.
+        os.utime(state_path)
+        return entry
+
+    def _evict_disk(self) -> None:
+        if self.directory is None or self.max_disk_bytes is None:
+            return
+        entries: Dict[str, list] = {}
+        for item in os.scandir(self.directory):
+            key, _, suffix = item.name.partition('.')
+            if suffix not in _DISK_SUFFIXES:
+                continue
+            stat = item.stat()
+            used = entries.setdefault(key, [0.0, 0])
+            if suffix == 'state.pkl':
+                used[0] = stat.st_mtime
+            used[1] += stat.st_size
+        total = sum(size for _, size in entries.values())
+        for key, (_, size) in sorted(entries.items(), key=lambda item: item[1][0]):
+            if total <= self.max_disk_bytes:
+                break
+            self._remove_disk(key)
+            total -= size
+
+
+def _dump_pickle(value: Any, path: str) -> None:
+    with open(path, 'wb') as f:
+        pickle.dump(value, f)
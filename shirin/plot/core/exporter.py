@@ -1,57 +1,435 @@
+import io
 import os
-from typing import Optional
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
 
-import matplotlib.pyplot as plt
+import matplotlib as mpl
+import numpy as np
+from matplotlib.transforms import Bbox
+
+from .instrumentation import RenderStats, measure_stage
+
+
+class ExportError(RuntimeError):
+    """Raised by ``PlotExporter.flush`` when background exports failed."""
+
+    def __init__(self, failures: List[Tuple[str, BaseException]]):
+        self.failures = failures
+        paths = ', '.join(path for path, _ in failures)
+        super().__init__(f"{len(failures)} export(s) failed: {paths}")
+
+
+def _notebook_display() -> Optional[Callable[[Any], None]]:
+    """IPython's ``display`` when running in a Jupyter kernel, else ``None``."""
+    try:
+        from IPython import get_ipython
+        from IPython.display import display
+    except ImportError:
+        return None
+    shell = get_ipython()
+    if shell is None or getattr(shell, 'kernel', None) is None:
+        return None
+    return display
+
+
+def _current_figure() -> Any:
+    import matplotlib.pyplot as plt
+
+    return plt.gcf()
+
+
+def _png_width(data: bytes) -> int:
+    # Width field of the IHDR chunk, which always comes first.
+    return int.from_bytes(data[16:20], 'big')
 
 
 class PlotExporter:
-    SUPPORTED_FORMATS = ['png', 'svg']
-    
+    """Saves (and optionally shows) rendered figures.
+
+    ``format`` is one format or a list of them; every export then writes one
+    file per format from a single layout pass of the figure.
+
+    Files are cropped to their content. With ``layout='tight'`` savefig
+    draws the figure once to measure it and again to write it.
+    ``layout='fast'`` measures the extents without drawing, so every file is
+    drawn exactly once; artists that only settle their position while being
+    drawn (e.g. a ``loc='best'`` legend) may shift the crop by a few pixels.
+    Fewer draws don't reliably mean faster exports: for most plot types the
+    difference is within run-to-run noise, so ``'tight'`` stays the default.
+
+    With ``background=True`` figures are saved on a pool of ``max_workers``
+    threads while the caller continues. Pass standalone figures (see
+    ``AggRenderer``): pyplot's figure manager is not thread-safe, so figures
+    registered with it must not be saved or closed off the main thread. At most ``max_pending`` saves are
+    queued; further exports block until one finishes, which caps the memory
+    held by figures waiting to be saved. ``flush()`` (or leaving a ``with``
+    block) waits for all saves and raises ``ExportError`` if any failed.
+    """
+
+    SUPPORTED_FORMATS = ['png', 'svg', 'pdf']
+    DPI = 300
+    LAYOUTS = ('tight', 'fast')
+
     def __init__(
         self,
         enabled: bool = True,
         output_dir: str = "./plot_output/",
         prefix: Optional[str] = None,
-        format: str = 'png',
-        auto_show: bool = True
+        format: Union[str, Sequence[str]] = 'png',
+        auto_show: bool = True,
+        background: bool = False,
+        max_workers: int = 2,
+        max_pending: int = 8,
+        layout: str = 'tight',
     ):
         self.enabled = enabled
         self.output_dir = os.path.expanduser(output_dir)
         self.prefix = prefix
-        self.format = format.lower()
+        formats = [format] if isinstance(format, str) else list(format)
+        self.formats = list(dict.fromkeys(item.lower() for item in formats))
+        if not self.formats:
+            raise ValueError("At least one format is required.")
+        # The first format names the path returned by export_only.
+        self.format = self.formats[0]
         self.auto_show = auto_show
-        
+        self.background = background
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.layout = layout
+
         self._validate_format()
+        if self.layout not in self.LAYOUTS:
+            raise ValueError(f"Invalid layout '{self.layout}'. Valid options are: {self.LAYOUTS}.")
+        if self.background and (max_workers < 1 or max_pending < 1):
+            raise ValueError("max_workers and max_pending must be at least 1")
         if self.enabled:
             os.makedirs(self.output_dir, exist_ok=True)
-    
+        self._init_queue()
+
+    def _init_queue(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max(self.max_pending, 1))
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._failures: List[Tuple[str, BaseException]] = []
+
+    def __getstate__(self) -> dict:
+        # Queue state is per process; a pickled exporter starts with an empty one.
+        state = self.__dict__.copy()
+        for name in ('_executor', '_slots', '_lock', '_pending', '_failures'):
+            del state[name]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._init_queue()
+
     def _validate_format(self) -> None:
-        if self.format not in self.SUPPORTED_FORMATS:
-            raise ValueError(
-                f"Unsupported format '{self.format}'. "
-                f"Supported formats are {self.SUPPORTED_FORMATS}."
-            )
-    
-    def _create_filepath(self, output_name: str) -> str:
+        for format in self.formats:
+            if format not in self.SUPPORTED_FORMATS:
+                raise ValueError(
+                    f"Unsupported format '{format}'. "
+                    f"Supported formats are {self.SUPPORTED_FORMATS}."
+                )
+
+    @property
+    def settings_key(self) -> tuple:
+        """Everything besides the figure and format that changes the exported file."""
+        return (self.DPI, self.layout)
+
+    @property
+    def display_format(self) -> Optional[str]:
+        """The exported format notebooks can display directly, if any."""
+        for format in ('png', 'svg'):
+            if format in self.formats:
+                return format
+        return None
+
+    def _create_filepath(self, output_name: str, format: Optional[str] = None) -> str:
+        format = format or self.format
         if self.prefix:
-            filename = f"{self.prefix}_{output_name}.{self.format}"
+            filename = f"{self.prefix}_{output_name}.{format}"
         else:
-            filename = f"{output_name}.{self.format}"
+            filename = f"{output_name}.{format}"
         return os.path.join(self.output_dir, filename)
-    
-    def export_and_show(self, output_name: str) -> None:
-        if self.enabled:
-            filepath = self._create_filepath(output_name)
-            plt.savefig(filepath, bbox_inches="tight", dpi=300, format=self.format)
-        
-        if self.auto_show:
-            plt.show()
-    
-    def export_only(self, output_name: str) -> None:
-        if self.enabled:
+
+    def _save(
+        self,
+        figure: Any,
+        filepath: Any,
+        format: Optional[str] = None,
+        bbox_inches: Union[str, Bbox, None] = 'tight',
+    ) -> None:
+        figure.savefig(filepath, bbox_inches=bbox_inches, dpi=self.DPI, format=format or self.format)
+
+    def _tight_bbox(self, figure: Any) -> Bbox:
+        # What bbox_inches='tight' computes, but once instead of per savefig.
+        # 'tight' draws first so artists placed while drawing (e.g. legends
+        # with loc='best') are measured exactly; 'fast' measures text and
+        # artist extents without drawing.
+        dpi = figure.dpi
+        figure.dpi = self.DPI
+        try:
+            if self.layout == 'tight':
+                figure.draw_without_rendering()
+            bbox = figure.get_tightbbox()
+        finally:
+            figure.dpi = dpi
+        return bbox.padded(mpl.rcParams['savefig.pad_inches'])
+
+    def _bbox_inches(self, figure: Any, files: int) -> Union[str, Bbox]:
+        if self.layout == 'tight' and files == 1:
+            return 'tight'
+        return self._tight_bbox(figure)
+
+    def _save_all(
+        self,
+        figure: Any,
+        output_name: str,
+        on_saved: Optional[Callable[[str], None]] = None,
+        keep: Optional[str] = None,
+    ) -> Optional[bytes]:
+        """Write every format of ``figure``; return the encoded ``keep`` format."""
+        if len(self.formats) == 1 and keep is None and self.layout == 'tight':
             filepath = self._create_filepath(output_name)
-            plt.savefig(filepath, bbox_inches="tight", dpi=300, format=self.format)
-    
+            self._save(figure, filepath)
+            if on_saved is not None:
+                on_saved(filepath)
+            return None
+
+        bbox = self._bbox_inches(figure, len(self.formats))
+        kept = None
+        for format in self.formats:
+            filepath = self._create_filepath(output_name, format)
+            if format == keep:
+                buffer = io.BytesIO()
+                self._save(figure, buffer, format, bbox)
+                kept = buffer.getvalue()
+                with open(filepath, 'wb') as file:
+                    file.write(kept)
+            else:
+                self._save(figure, filepath, format, bbox)
+            if on_saved is not None:
+                on_saved(filepath)
+        return kept
+
+    def to_bytes(self, figure: Optional[Any] = None, format: Optional[str] = None) -> bytes:
+        """Encode ``figure`` in memory, with the same settings as a file export.
+
+        ``format`` defaults to the exporter's format; any of
+        ``SUPPORTED_FORMATS`` can be requested. Nothing touches the filesystem.
+        """
+        format = (format or self.format).lower()
+        if format not in self.SUPPORTED_FORMATS:
+            raise ValueError(
+                f"Unsupported format '{format}'. "
+                f"Supported formats are {self.SUPPORTED_FORMATS}."
+            )
+        figure = figure if figure is not None else _current_figure()
+        buffer = io.BytesIO()
+        self._save(figure, buffer, format, self._bbox_inches(figure, 1))
+        return buffer.getvalue()
+
+    @staticmethod
+    def to_rgba_buffer(figure: Optional[Any] = None) -> np.ndarray:
+        """Draw ``figure`` and return its Agg RGBA pixels as a (height, width, 4) array.
+
+        The array is a view on the canvas' own buffer, not a copy, so it is
+        only valid until the figure is drawn again or closed; copy it to keep
+        it. The size follows the figure's ``dpi`` (no tight bounding box).
+        """
+        figure = figure if figure is not None else _current_figure()
+        canvas = figure.canvas
+        if not hasattr(canvas, 'buffer_rgba'):
+            raise TypeError(
+                f"{type(canvas).__name__} has no RGBA buffer; render with an Agg-based canvas "
+                "(e.g. AggRenderer or the Agg backend)."
+            )
+        canvas.draw()
+        return np.asarray(canvas.buffer_rgba())
+
+    def export_and_show(
+        self,
+        output_name: str,
+        figure: Optional[Any] = None,
+        on_complete: Optional[Callable[[], None]] = None,
+        on_saved: Optional[Callable[[str], None]] = None,
+        stats: Optional[RenderStats] = None,
+    ) -> Optional[str]:
+        """Save ``figure`` and display it, timing the ``export`` and ``show`` stages.
+
+        In a Jupyter kernel the figure is displayed from the PNG (or SVG)
+        bytes written for the export instead of being drawn again; with
+        exporting disabled it is encoded once, for display only. That only
+        applies when ``on_complete`` closes the figure, since the notebook
+        would otherwise show the open figure a second time. ``on_complete``
+        runs after displaying (after saving for background exports).
+
+        Background exports never call ``plt.show``, which would draw figures
+        the export threads are saving; in a Jupyter kernel the figure is
+        encoded and displayed before it is queued.
+        """
+        figure = figure if figure is not None else _current_figure()
+        if self.background:
+            with measure_stage(stats, 'show'):
+                display = _notebook_display() if self.auto_show else None
+                if display is not None:
+                    self._display_figure(display, figure)
+            with measure_stage(stats, 'export'):
+                return self.export_only(output_name, figure, on_complete, on_saved)
+
+        display = _notebook_display() if self.auto_show and on_complete is not None else None
+        try:
+            encoded = None
+            with measure_stage(stats, 'export'):
+                if self.enabled:
+                    keep = self.display_format if display is not None else None
+                    encoded = self._save_all(figure, output_name, on_saved, keep)
+            with measure_stage(stats, 'show'):
+                if display is None:
+                    self.show_only()
+                elif encoded is not None:
+                    self._display_encoded(display, encoded, self.display_format, figure.dpi / self.DPI)
+                else:
+                    self._display_figure(display, figure)
+        finally:
+            if on_complete is not None:
+                on_complete()
+        return self._create_filepath(output_name) if self.enabled else None
+
+    def export_only(
+        self,
+        output_name: str,
+        figure: Optional[Any] = None,
+        on_complete: Optional[Callable[[], None]] = None,
+        on_saved: Optional[Callable[[str], None]] = None,
+    ) -> Optional[str]:
+        """Save ``figure`` (pyplot's current figure when omitted) in every format.
+
+        Returns the path of the first format. ``on_saved`` receives each path
+        after a successful save. ``on_complete``
+        runs once the figure is no longer needed, whether or not saving
+        worked; use it to close or recycle the figure. For background exports
+        both run in the export thread.
+        """
+        if not self.enabled:
+            if on_complete is not None:
+                on_complete()
+            return None
+
+        filepath = self._create_filepath(output_name)
+        figure = figure if figure is not None else _current_figure()
+        if not self.background:
+            try:
+                self._save_all(figure, output_name, on_saved)
+            finally:
+                if on_complete is not None:
+                    on_complete()
+            return filepath
+
+        # Backpressure: wait for a free slot before queueing another figure.
+        self._slots.acquire()
+        try:
+            future = self._get_executor().submit(
+                self._save_in_background, figure, output_name, on_complete, on_saved
+            )
+        except BaseException:
+            self._slots.release()
+            raise
+        with self._lock:
+            self._pending.append(future)
+        return filepath
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='shirin-export',
+            )
+        return self._executor
+
+    def _save_in_background(
+        self,
+        figure: Any,
+        output_name: str,
+        on_complete: Optional[Callable[[], None]],
+        on_saved: Optional[Callable[[str], None]],
+    ) -> None:
+        try:
+            self._save_all(figure, output_name, on_saved)
+        except Exception as error:
+            with self._lock:
+                self._failures.append((self._create_filepath(output_name), error))
+        finally:
+            try:
+                if on_complete is not None:
+                    on_complete()
+            finally:
+                self._slots.release()
+
+    def flush(self) -> None:
+        """Wait for queued background exports; raise ``ExportError`` on failures."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        wait(pending)
+        with self._lock:
+            failures, self._failures = self._failures, []
+        if failures:
+            raise ExportError(failures)
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def __enter__(self) -> 'PlotExporter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Don't mask the original error with export failures.
+        try:
+            self.close()
+        except ExportError:
+            pass
+
     def show_only(self) -> None:
         if self.auto_show:
+            import matplotlib.pyplot as plt
+
             plt.show()
+
+    def show_file(self, filepath: str) -> None:
+        """Display an already exported PNG or SVG in a running Jupyter kernel."""
+        format = os.path.splitext(filepath)[1][1:].lower()
+        display = _notebook_display() if self.auto_show else None
+        if display is None or format not in ('png', 'svg'):
+            return
+        with open(filepath, 'rb') as file:
+            self._display_encoded(display, file.read(), format, mpl.rcParams['figure.dpi'] / self.DPI)
+
+    def _display_figure(self, display: Callable[[Any], None], figure: Any) -> None:
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format='png', bbox_inches=self._bbox_inches(figure, 1))
+        self._display_encoded(display, buffer.getvalue(), 'png')
+
+    def _display_encoded(
+        self,
+        display: Callable[[Any], None],
+        data: bytes,
+        format: Optional[str],
+        scale: float = 1.0,
+    ) -> None:
+        from IPython.display import SVG, Image
+
+        if format == 'svg':
+            display(SVG(data=data))
+            return
+        # Exports are encoded at DPI; scale them down to the on-screen size.
+        display(Image(data=data, width=round(_png_width(data) * scale)))
@@ -1,4 +1,5 @@
-from typing import Dict, Type, Optional
+import importlib
+from typing import Dict, Type, Optional, Union
 
 from .base_plot import AbstractPlot
 from .options import BasePlotOptions
@@ -6,14 +7,25 @@ from .renderer import PlotRenderer, SeabornRenderer
 
 
 class PlotRegistry:
+    """Maps plot type names to plot classes.
+
+    A class can be registered as a ``'package.module:ClassName'`` string; the
+    module is then only imported the first time that plot type is created.
+    """
+
     def __init__(self):
-        self._registry: Dict[str, Type[AbstractPlot]] = {}
+        self._registry: Dict[str, Union[Type[AbstractPlot], str]] = {}
     
-    def register(self, plot_type: str, plot_class: Type[AbstractPlot]) -> None:
+    def register(self, plot_type: str, plot_class: Union[Type[AbstractPlot], str]) -> None:
         self._registry[plot_type] = plot_class
     
     def get(self, plot_type: str) -> Optional[Type[AbstractPlot]]:
-        return self._registry.get(plot_type)
+        plot_class = self._registry.get(plot_type)
+        if isinstance(plot_class, str):
+            module_name, _, class_name = plot_class.partition(':')
+            plot_class = getattr(importlib.import_module(module_name), class_name)
+            self._registry[plot_type] = plot_class
+        return plot_class
     
     def list_types(self) -> list[str]:
         return list(self._registry.keys())
@@ -48,7 +60,7 @@ _global_registry = PlotRegistry()
 _global_factory = PlotFactory(_global_registry)
 
 
-def register_plot(plot_type: str, plot_class: Type[AbstractPlot]) -> None:
+def register_plot(plot_type: str, plot_class: Union[Type[AbstractPlot], str]) -> None:
     _global_registry.register(plot_type, plot_class)
 
 
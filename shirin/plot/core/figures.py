@@ -0,0 +1,64 @@
+import threading
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, List
+
+import matplotlib as mpl
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+
+_SUBPLOT_PARAMS = ('left', 'right', 'bottom', 'top', 'wspace', 'hspace')
+
+
+def _size_key(figsize: tuple[float, float]) -> tuple[float, float]:
+    return (round(float(figsize[0]), 3), round(float(figsize[1]), 3))
+
+
+class FigurePool:
+    """Reusable figures for charts of the same size.
+
+    Released figures are removed from pyplot (so they are never shown and
+    don't count towards matplotlib's open-figure warning), cleared, and kept
+    for the next chart with the same ``figsize``. At most ``max_figures`` are
+    kept; further releases are simply closed.
+    """
+
+    def __init__(self, max_figures: int = 8):
+        if max_figures < 0:
+            raise ValueError("max_figures cannot be negative")
+        self.max_figures = max_figures
+        self._idle: Dict[tuple[float, float], List['Figure']] = defaultdict(list)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(figures) for figures in self._idle.values())
+
+    def acquire(self, figsize: tuple[float, float]) -> 'Figure':
+        import matplotlib.pyplot as plt
+
+        with self._lock:
+            idle = self._idle.get(_size_key(figsize))
+            figure = idle.pop() if idle else None
+        if figure is not None:
+            # Re-register with pyplot and make it current, as plt.figure would.
+            return plt.figure(figure)
+        return plt.figure(figsize=figsize)
+
+    def release(self, figure: 'Figure') -> None:
+        import matplotlib.pyplot as plt
+
+        plt.close(figure)
+        if len(self) >= self.max_figures or figure.canvas.manager is None:
+            return
+        figure.clear()
+        # clear() keeps subplots_adjust changes; reset them to the defaults.
+        figure.subplots_adjust(**{
+            name: mpl.rcParams[f'figure.subplot.{name}'] for name in _SUBPLOT_PARAMS
+        })
+        with self._lock:
+            self._idle[_size_key(tuple(figure.get_size_inches()))].append(figure)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._idle.clear()
@@ -0,0 +1,130 @@
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field, fields
+from typing import Any, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+
+@dataclass
+class StageStats:
+    """Timing and memory for one pipeline stage.
+
+    ``peak_memory`` is the tracemalloc peak (bytes) above the memory already
+    allocated when the stage started. When tracemalloc was started by someone
+    else it is never reset, so a stage whose peak stays below an earlier one
+    reports its net allocation instead (a lower bound). Row counts are ``None`` when the stage
+    input/output is not tabular.
+    """
+    name: str
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    peak_memory: Optional[int] = None
+    rows_in: Optional[int] = None
+    rows_out: Optional[int] = None
+
+
+@dataclass
+class RenderStats:
+    """Per-stage measurements collected while rendering (and exporting) one plot."""
+    plot_type: str
+    name: Optional[str] = None
+    stages: List[StageStats] = field(default_factory=list)
+
+    @property
+    def total_wall_time(self) -> float:
+        return sum(stage.wall_time for stage in self.stages)
+
+    @property
+    def total_cpu_time(self) -> float:
+        return sum(stage.cpu_time for stage in self.stages)
+
+    def stage(self, name: str) -> Optional[StageStats]:
+        for stage in self.stages:
+            if stage.name == name:
+                return stage
+        return None
+
+    def to_frame(self) -> pd.DataFrame:
+        stage_columns = [f.name for f in fields(StageStats) if f.name != 'name']
+        rows = [
+            {'plot_type': self.plot_type, 'name': self.name, 'stage': stage.name,
+             **{column: getattr(stage, column) for column in stage_columns}}
+            for stage in self.stages
+        ]
+        return pd.DataFrame(rows, columns=['plot_type', 'name', 'stage', *stage_columns])
+
+
+def stats_to_frame(stats: Iterable[RenderStats]) -> pd.DataFrame:
+    """Stack several RenderStats into one long frame (one row per plot and stage)."""
+    frames = [item.to_frame() for item in stats]
+    if not frames:
+        return RenderStats(plot_type='').to_frame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def count_rows(data: Any) -> Optional[int]:
+    if isinstance(data, (pd.DataFrame, pd.Series)):
+        return len(data)
+    return None
+
+
+# Whether trace_memory started the running tracemalloc session, in which case
+# measure_stage may reset its peak.
+_owns_tracing = False
+
+
+@contextmanager
+def trace_memory(enabled: bool = True) -> Iterator[None]:
+    """Run tracemalloc for the duration of the block unless it is already running."""
+    global _owns_tracing
+    started = enabled and not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+        _owns_tracing = True
+    try:
+        yield
+    finally:
+        if started:
+            _owns_tracing = False
+            tracemalloc.stop()
+
+
+@contextmanager
+def measure_stage(
+    stats: Optional[RenderStats],
+    name: str,
+    data_in: Any = None
+) -> Iterator[StageStats]:
+    """Measure the block as stage ``name`` and append it to ``stats``.
+
+    With ``stats=None`` nothing is measured; the yielded StageStats can still be
+    written to, so callers don't need a separate uninstrumented code path.
+    """
+    stage = StageStats(name=name, rows_in=count_rows(data_in))
+    if stats is None:
+        yield stage
+        return
+
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        # Only reset the peak of our own session; another caller's (e.g. a
+        # profiled notebook) keeps its peak.
+        if _owns_tracing:
+            tracemalloc.reset_peak()
+        memory_before, peak_before = tracemalloc.get_traced_memory()
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    try:
+        yield stage
+    finally:
+        stage.wall_time = time.perf_counter() - wall_start
+        stage.cpu_time = time.process_time() - cpu_start
+        if tracing:
+            memory_after, peak_after = tracemalloc.get_traced_memory()
+            if peak_after > peak_before or _owns_tracing:
+                stage.peak_memory = max(0, peak_after - memory_before)
+            else:
+                stage.peak_memory = max(0, memory_after - memory_before)
+        stats.stages.append(stage)
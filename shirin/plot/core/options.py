@@ -1,5 +1,6 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, Optional, Union
+from enum import Enum
+from typing import Any, ClassVar, Dict, Optional, Union
 
 import pandas as pd
 
@@ -84,8 +85,22 @@ def _validate_str_or_enum_option(
     raise InvalidOptionError(option_name, value, valid_options, expected, type_error=True)
 
 
+def _freeze_option(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return tuple(sorted((str(k), _freeze_option(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_option(v) for v in value)
+    return value
+
+
 @dataclass
 class BasePlotOptions:
+    # Options that change what preprocess/transform produce. Everything else
+    # (labels, colours, legend placement, ...) only affects drawing.
+    DATA_FIELDS: ClassVar[tuple[str, ...]] = ('hue',)
+
     df: pd.DataFrame
     palette: Optional[Union[Dict[Any, str], str]] = None
     label_map: Optional[Dict[Any, str]] = None
@@ -106,9 +121,19 @@ class BasePlotOptions:
         if isinstance(self.label_map, dict):
             self.label_map = convert_dict_keys_to_string(self.label_map)
 
+    def data_columns(self) -> list[str]:
+        """Columns of ``df`` the plot reads; preprocessing projects onto these."""
+        return [self.hue] if self.hue else []
+
+    def data_key(self) -> tuple:
+        """Hashable summary of the options listed in ``DATA_FIELDS``."""
+        return tuple((name, _freeze_option(getattr(self, name))) for name in self.DATA_FIELDS)
+
 
 @dataclass
 class CategoricalPlotOptions(BasePlotOptions):
+    DATA_FIELDS = (*BasePlotOptions.DATA_FIELDS, 'axis_column', 'orientation', 'order_type')
+
     axis_column: str = ''
     orientation: str = 'vertical'
     figsize: FigureSizeInput = 'dynamic'
@@ -146,9 +171,14 @@ class CategoricalPlotOptions(BasePlotOptions):
         if self.stacked and self.hue is None:
             raise ValueError("hue must be provided when stacked=True")
 
+    def data_columns(self) -> list[str]:
+        return [self.axis_column, *super().data_columns()]
+
 
 @dataclass
 class CountPlotOptions(CategoricalPlotOptions):
+    DATA_FIELDS = (*CategoricalPlotOptions.DATA_FIELDS, 'top_n')
+
     top_n: Optional[int] = None
     normalized: bool = False
     show_labels: bool = True
@@ -164,6 +194,8 @@ class CountPlotOptions(CategoricalPlotOptions):
 
 @dataclass
 class BarPlotOptions(CategoricalPlotOptions):
+    DATA_FIELDS = (*CategoricalPlotOptions.DATA_FIELDS, 'value')
+
     value: str = ''
     percentage_labels: bool = False
     suffix: Optional[str] = None
@@ -174,9 +206,14 @@ class BarPlotOptions(CategoricalPlotOptions):
         if not self.value:
             raise ValueError("value column must be specified")
 
+    def data_columns(self) -> list[str]:
+        return [*super().data_columns(), self.value]
+
 
 @dataclass
 class HistogramOptions(BasePlotOptions):
+    DATA_FIELDS = (*BasePlotOptions.DATA_FIELDS, 'x', 'xlimit', 'bins')
+
     x: str = ''
     xlimit: Optional[Union[float, int]] = None
     bins: int = 100
@@ -189,9 +226,14 @@ class HistogramOptions(BasePlotOptions):
         if self.bins <= 0:
             raise ValueError("bins must be positive")
 
+    def data_columns(self) -> list[str]:
+        return [self.x, *super().data_columns()]
+
 
 @dataclass
 class LinePlotOptions(BasePlotOptions):
+    DATA_FIELDS = (*BasePlotOptions.DATA_FIELDS, 'x', 'y', 'fill_missing_values')
+
     x: str = ''
     y: str = ''
     rotation: int = 0
@@ -212,9 +254,14 @@ class LinePlotOptions(BasePlotOptions):
             allow_none=True,
         )
 
+    def data_columns(self) -> list[str]:
+        return [self.x, self.y, *super().data_columns()]
+
 
 @dataclass
 class PiePlotOptions(BasePlotOptions):
+    DATA_FIELDS = ('col',)
+
     col: str = ''
     n_after_comma: int = 0
     value_datalabel: int = 5
@@ -228,9 +275,15 @@ class PiePlotOptions(BasePlotOptions):
         if not isinstance(self.palette, dict):
             raise ValueError("palette must be a dictionary for pie charts")
 
+    def data_columns(self) -> list[str]:
+        # Slice labels come from the index, which projection keeps.
+        return [self.col]
+
 
 @dataclass
 class NormalizedCountPlotOptions(CategoricalPlotOptions):
+    DATA_FIELDS = (*CategoricalPlotOptions.DATA_FIELDS, 'top_n')
+
     top_n: Optional[int] = None
     show_labels: bool = True
     suffix: Optional[str] = None
@@ -248,6 +301,8 @@ class NormalizedCountPlotOptions(CategoricalPlotOptions):
 
 @dataclass
 class AccuracyPlotOptions(CategoricalPlotOptions):
+    DATA_FIELDS = ('axis_column', 'value_column')
+
     value_column: str = ''
     suffix: Optional[str] = None
     reverse_order: bool = False
@@ -274,9 +329,15 @@ class AccuracyPlotOptions(CategoricalPlotOptions):
         )
         super().validate()
 
+    def data_columns(self) -> list[str]:
+        # hue is synthesised in transform and never read from df.
+        return [self.axis_column, self.value_column]
+
 
 @dataclass
 class TimePlotOptions(BasePlotOptions):
+    DATA_FIELDS = ('x', 'group_by', 'cumulative')
+
     x: str = ''
     group_by: TimeGroupByInput = 'day'
     plot_type: str = 'bar'
@@ -300,4 +361,7 @@ class TimePlotOptions(BasePlotOptions):
             option_name='plot_type',
             value=self.plot_type,
             valid_options=VALID_TIME_PLOT_TYPES,
-        )
\ No newline at end of file
+        )
+
+    def data_columns(self) -> list[str]:
+        return [self.x]
@@ -1,16 +1,19 @@
 from .factory import register_plot
-from ..plots import CountPlot, BarPlot, Histogram, LinePlot, PieChart, NormalizedCountPlot, TimePlot, AccuracyPlot
+
+
+# Registered by import path so plot modules load on first use, not on import.
+_PLOTS = __name__.rsplit('.', 2)[0] + '.plots'
 
 
 def register_all_plots() -> None:
-    register_plot('count', CountPlot)
-    register_plot('bar', BarPlot)
-    register_plot('histogram', Histogram)
-    register_plot('line', LinePlot)
-    register_plot('pie', PieChart)
-    register_plot('normalized_count', NormalizedCountPlot)
-    register_plot('time', TimePlot)
-    register_plot('accuracy', AccuracyPlot)
+    register_plot('count', f'{_PLOTS}.countplot:CountPlot')
+    register_plot('bar', f'{_PLOTS}.barplot:BarPlot')
+    register_plot('histogram', f'{_PLOTS}.histogram:Histogram')
+    register_plot('line', f'{_PLOTS}.lineplot:LinePlot')
+    register_plot('pie', f'{_PLOTS}.piechart:PieChart')
+    register_plot('normalized_count', f'{_PLOTS}.normalized_countplot:NormalizedCountPlot')
+    register_plot('time', f'{_PLOTS}.timeplot:TimePlot')
+    register_plot('accuracy', f'{_PLOTS}.accuracy:AccuracyPlot')
 
 
 register_all_plots()
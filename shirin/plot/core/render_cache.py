@@ -0,0 +1,161 @@
+import dataclasses
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from importlib import metadata
+from typing import Any, Optional
+
+import matplotlib as mpl
+
+from .cache import fingerprint_frame
+from .options import BasePlotOptions, _freeze_option
+
+
+DEFAULT_MAX_BYTES = 1024 ** 3
+
+
+def _package_version() -> str:
+    try:
+        return metadata.version('shirin')
+    except metadata.PackageNotFoundError:
+        return 'unknown'
+
+
+def _options_key(options: BasePlotOptions) -> tuple:
+    return tuple(
+        (field.name, repr(_freeze_option(getattr(options, field.name))))
+        for field in dataclasses.fields(options)
+        if field.name != 'df'
+    )
+
+
+# rcParams that only affect interactive use (backend, GUI windows, key
+# bindings), never the saved file; leaving them out lets a notebook and a
+# script share cached charts.
+_NON_OUTPUT_RCPARAMS = frozenset({
+    'backend',
+    'backend_fallback',
+    'interactive',
+    'toolbar',
+    'figure.raise_window',
+    'figure.max_open_warning',
+    'savefig.directory',
+})
+_NON_OUTPUT_RCPARAM_PREFIXES = ('keymap.', 'webagg.', 'tk.', 'macosx.')
+
+
+def _style_key() -> str:
+    return repr(sorted(
+        (key, repr(value)) for key, value in mpl.rcParams.items()
+        if key not in _NON_OUTPUT_RCPARAMS and not key.startswith(_NON_OUTPUT_RCPARAM_PREFIXES)
+    ))
+
+
+def render_key(
+    plot_type: str,
+    options: BasePlotOptions,
+    export_settings: Any = None,
+) -> Optional[str]:
+    """Content address of a rendered chart.
+
+    Combines the plot type, every option except ``df``, a fingerprint of the
+    columns the plot reads, the rcParams that affect output, library versions and
+    ``export_settings`` (format, dpi, ...). Returns ``None`` when the data
+    can't be fingerprinted.
+    """
+    fingerprint = fingerprint_frame(options.df, options.data_columns())
+    if fingerprint is None:
+        return None
+    parts = (
+        plot_type,
+        type(options).__name__,
+        _options_key(options),
+        fingerprint,
+        _style_key(),
+        _package_version(),
+        mpl.__version__,
+        export_settings,
+    )
+    return hashlib.blake2b(repr(parts).encode(), digest_size=20).hexdigest()
+
+
+class RenderCache:
+    """Directory of rendered files addressed by ``render_key``.
+
+    ``max_bytes`` caps the directory size (1 GiB by default, ``None`` for no
+    limit); the least recently used files are evicted first. Artifacts are copied in and out (never hard-linked), so
+    overwriting an exported file can't corrupt the cache.
+    """
+
+    def __init__(self, directory: str, max_bytes: Optional[int] = DEFAULT_MAX_BYTES):
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("max_bytes cannot be negative")
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str, format: str) -> str:
+        return os.path.join(self.directory, f'{key}.{format}')
+
+    def restore(self, key: str, format: str, destination: str) -> bool:
+        """Copy the artifact for ``key`` to ``destination``; False on a miss."""
+        path = self._path(key, format)
+        try:
+            shutil.copyfile(path, destination)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return False
+        # Mark as recently used for eviction.
+        os.utime(path)
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def store(self, key: str, format: str, source: str) -> None:
+        # Write under a temporary name so readers never see partial files.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            shutil.copyfile(source, tmp_path)
+            os.replace(tmp_path, self._path(key, format))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict()
+
+    def size(self) -> int:
+        return sum(size for _, _, size in self._artifacts())
+
+    def clear(self) -> None:
+        for path, _, _ in self._artifacts():
+            os.remove(path)
+
+    def _artifacts(self) -> list:
+        artifacts = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                artifacts.append((entry.path, stat.st_mtime, stat.st_size))
+        return artifacts
+
+    def _evict(self) -> None:
+        if self.max_bytes is None:
+            return
+        with self._lock:
+            artifacts = sorted(self._artifacts(), key=lambda artifact: artifact[1])
+            total = sum(size for _, _, size in artifacts)
+            for path, _, size in artifacts:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total -= size
@@ -1,32 +1,28 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional, Union
 
-import matplotlib.pyplot as plt
 import pandas as pd
-import seaborn as sns
+
+from ..config.matplotlib import ensure_matplotlib_configured
+from .figures import FigurePool
 
 
 class PlotRenderer(ABC):
+    auto_layout = True
+
     @abstractmethod
     def create_figure(self, figsize: tuple[float, float]) -> Any:
         pass
-    
-    @abstractmethod
-    def render_countplot(
-        self,
-        df: pd.DataFrame,
-        x: Optional[str] = None,
-        y: Optional[str] = None,
-        hue: Optional[str] = None,
-        order: Optional[Any] = None,
-        color: Optional[str] = None,
-        palette: Optional[Union[Dict[Any, str], str]] = None
-    ) -> Any:
-        pass
+
+    def release_figure(self, figure: Any) -> None:
+        import matplotlib.pyplot as plt
+
+        plt.close(figure)
     
     @abstractmethod
     def render_barplot(
         self,
+        ax: Any,
         df: pd.DataFrame,
         x: Optional[str] = None,
         y: Optional[str] = None,
@@ -40,6 +36,7 @@ class PlotRenderer(ABC):
     @abstractmethod
     def render_histogram(
         self,
+        ax: Any,
         df: pd.DataFrame,
         x: str,
         bins: int,
@@ -53,6 +50,7 @@ class PlotRenderer(ABC):
     @abstractmethod
     def render_lineplot(
         self,
+        ax: Any,
         df: pd.DataFrame,
         x: str,
         y: str,
@@ -65,6 +63,7 @@ class PlotRenderer(ABC):
     @abstractmethod
     def render_stacked_barplot(
         self,
+        ax: Any,
         df: pd.DataFrame,
         kind: str,
         colors: list[str],
@@ -75,6 +74,7 @@ class PlotRenderer(ABC):
     @abstractmethod
     def render_piechart(
         self,
+        ax: Any,
         values: list[float],
         colors: list[str],
         donut: bool,
@@ -84,40 +84,31 @@ class PlotRenderer(ABC):
     ) -> Any:
         pass
 
-    @abstractmethod
-    def get_current_axes(self) -> Any:
-        pass
-
 
 class SeabornRenderer(PlotRenderer):
+    def __init__(self, figure_pool: Optional[FigurePool] = None, auto_layout: bool = True):
+        self.figure_pool = figure_pool
+        # Whether plots run their own layout pass (TimePlot's tight_layout);
+        # off when the exporter crops to the content anyway.
+        self.auto_layout = auto_layout
+
     def create_figure(self, figsize: tuple[float, float]) -> Any:
+        import matplotlib.pyplot as plt
+
+        ensure_matplotlib_configured()
+        if self.figure_pool is not None:
+            return self.figure_pool.acquire(figsize)
         return plt.figure(figsize=figsize)
-    
-    def render_countplot(
-        self,
-        df: pd.DataFrame,
-        x: Optional[str] = None,
-        y: Optional[str] = None,
-        hue: Optional[str] = None,
-        order: Optional[Any] = None,
-        color: Optional[str] = None,
-        palette: Optional[Union[Dict[Any, str], str]] = None
-    ) -> Any:
-        return sns.countplot(
-            data=df,
-            x=x,
-            y=y,
-            hue=hue,
-            order=order,
-            color=color,
-            palette=palette,
-            alpha=1,
-            edgecolor='none',
-            saturation=1
-        )
+
+    def release_figure(self, figure: Any) -> None:
+        if self.figure_pool is not None:
+            self.figure_pool.release(figure)
+        else:
+            super().release_figure(figure)
     
     def render_barplot(
         self,
+        ax: Any,
         df: pd.DataFrame,
         x: Optional[str] = None,
         y: Optional[str] = None,
@@ -126,6 +117,9 @@ class SeabornRenderer(PlotRenderer):
         color: Optional[str] = None,
         palette: Optional[Union[Dict[Any, str], str]] = None
     ) -> Any:
+        # seaborn is slow to import, so it's only loaded once a plot needs it.
+        import seaborn as sns
+
         return sns.barplot(
             data=df,
             x=x,
@@ -137,11 +131,13 @@ class SeabornRenderer(PlotRenderer):
             alpha=1,
             edgecolor='none',
             saturation=1,
-            errorbar=None
+            errorbar=None,
+            ax=ax,
         )
     
     def render_histogram(
         self,
+        ax: Any,
         df: pd.DataFrame,
         x: str,
         bins: int,
@@ -160,6 +156,8 @@ class SeabornRenderer(PlotRenderer):
         else:
             multiple = 'stack'
         
+        import seaborn as sns
+
         return sns.histplot(
             data=df,
             x=x,
@@ -169,11 +167,13 @@ class SeabornRenderer(PlotRenderer):
             palette=palette,
             multiple=multiple,  # type: ignore
             edgecolor='white',
-            alpha=1
+            alpha=1,
+            ax=ax,
         )
     
     def render_lineplot(
         self,
+        ax: Any,
         df: pd.DataFrame,
         x: str,
         y: str,
@@ -181,6 +181,8 @@ class SeabornRenderer(PlotRenderer):
         color: Optional[str] = None,
         palette: Optional[Union[Dict[Any, str], str]] = None
     ) -> Any:
+        import seaborn as sns
+
         return sns.lineplot(
             data=df,
             x=x,
@@ -190,11 +192,13 @@ class SeabornRenderer(PlotRenderer):
             palette=palette,
             marker='o',
             markersize=4,
-            alpha=1
+            alpha=1,
+            ax=ax,
         )
     
     def render_stacked_barplot(
         self,
+        ax: Any,
         df: pd.DataFrame,
         kind: str,
         colors: list[str],
@@ -205,13 +209,14 @@ class SeabornRenderer(PlotRenderer):
             stacked=True,
             color=colors,
             edgecolor='none',
-            ax=plt.gca(),
+            ax=ax,
             alpha=1,
             width=width
         )
     
     def render_piechart(
         self,
+        ax: Any,
         values: list[float],
         colors: list[str],
         donut: bool,
@@ -219,7 +224,6 @@ class SeabornRenderer(PlotRenderer):
         value_datalabel: int,
         pctdistance: float
     ) -> Any:
-        ax = plt.gca()
         wedgeprops = dict(edgecolor='none', width=0.6 if donut else 1.0)
         result = ax.pie(
             values,
@@ -236,5 +240,26 @@ class SeabornRenderer(PlotRenderer):
         ax.axis('equal')
         return result
 
-    def get_current_axes(self) -> Any:
-        return plt.gca()
+
+class AggRenderer(SeabornRenderer):
+    """Draws on standalone Agg figures that pyplot never tracks.
+
+    Nothing goes through pyplot's global "current figure", so separate plots
+    can be rendered from several threads at once. Figures are not shown in
+    notebooks; export them with ``PlotExporter`` instead.
+    """
+
+    def __init__(self, auto_layout: bool = True):
+        super().__init__(figure_pool=None, auto_layout=auto_layout)
+
+    def create_figure(self, figsize: tuple[float, float]) -> Any:
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        ensure_matplotlib_configured()
+        figure = Figure(figsize=figsize)
+        FigureCanvasAgg(figure)
+        return figure
+
+    def release_figure(self, figure: Any) -> None:
+        figure.clear()
@@ -1,10 +1,39 @@
-from .barplot import BarPlot
-from .countplot import CountPlot
-from .histogram import Histogram
-from .lineplot import LinePlot
-from .piechart import PieChart
-from .normalized_countplot import NormalizedCountPlot
-from .timeplot import TimePlot
-from .accuracy import AccuracyPlot
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .barplot import BarPlot
+    from .countplot import CountPlot
+    from .histogram import Histogram
+    from .lineplot import LinePlot
+    from .piechart import PieChart
+    from .normalized_countplot import NormalizedCountPlot
+    from .timeplot import TimePlot
+    from .accuracy import AccuracyPlot
+
+# Plot modules are imported on first attribute access.
+_PLOT_MODULES = {
+    'CountPlot': '.countplot',
+    'BarPlot': '.barplot',
+    'Histogram': '.histogram',
+    'LinePlot': '.lineplot',
+    'PieChart': '.piechart',
+    'NormalizedCountPlot': '.normalized_countplot',
+    'TimePlot': '.timeplot',
+    'AccuracyPlot': '.accuracy',
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _PLOT_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_PLOT_MODULES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *_PLOT_MODULES])
+
 
 __all__ = ['CountPlot', 'BarPlot', 'Histogram', 'LinePlot', 'PieChart', 'NormalizedCountPlot', 'TimePlot', 'AccuracyPlot']
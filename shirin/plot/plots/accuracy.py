@@ -11,7 +11,7 @@ from ..common.formatting import (
     format_ticks,
     format_xy_labels,
 )
-from ..common.data_conversion import ensure_column_is_string
+from ..common.data_conversion import ensure_column_is_string, project_columns
 from ..common.sorting import apply_label_mapping, create_colors_list
 from ..common.stacked_plots import prepare_stacked_data
 
@@ -33,6 +33,8 @@ class AccuracyPlot(AbstractPlot):
     that reuses the exact same draw/format machinery as ``BarPlot``.
     """
 
+    _intermediates = ('_df_unlabeled',)
+
     def __init__(self, options: AccuracyPlotOptions, renderer=None):
         super().__init__(options, renderer)
         self.options: AccuracyPlotOptions = options
@@ -43,7 +45,8 @@ class AccuracyPlot(AbstractPlot):
     # ------------------------------------------------------------------
 
     def preprocess(self) -> pd.DataFrame:
-        return ensure_column_is_string(self.options.df, self.options.axis_column)
+        df = project_columns(self.options.df, self.options.data_columns())
+        return ensure_column_is_string(df, self.options.axis_column)
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         """Expand accuracy rows into long-format correct/incorrect rows."""
@@ -59,7 +62,8 @@ class AccuracyPlot(AbstractPlot):
         orientation = self.options.orientation
         size_strategy = get_figure_size_strategy(self.options.figsize, orientation)
         figsize = size_strategy.calculate_size(data, self.options.axis_column, orientation)
-        self.renderer.create_figure(figsize)
+        self.figure = self.renderer.create_figure(figsize)
+        self.ax = self.figure.add_subplot()
 
         df_prepared = prepare_stacked_data(
             data,
@@ -86,6 +90,7 @@ class AccuracyPlot(AbstractPlot):
 
         kind = 'barh' if orientation == 'horizontal' else 'bar'
         plot = self.renderer.render_stacked_barplot(
+            ax=self.ax,
             df=df_labeled, kind=kind, colors=colors, width=0.6,
         )
 
@@ -17,8 +17,9 @@ from ..common.formatting import (
 )
 from ..common.data_conversion import (
     convert_palette_to_strings,
-    ensure_column_is_string,
+    ensure_column_is_categorical,
     prepare_legend_label_map,
+    project_columns,
 )
 from ..common.sorting import (
     apply_label_mapping,
@@ -30,6 +31,9 @@ from ..common.stacked_plots import prepare_stacked_data
 
 
 class BarPlot(AbstractPlot):
+    _transform_state = ('_order',)
+    _intermediates = ('_df_unlabeled',)
+
     def __init__(self, options: BarPlotOptions, renderer=None):
         super().__init__(options, renderer)
         self.options: BarPlotOptions = options
@@ -40,11 +44,11 @@ class BarPlot(AbstractPlot):
         self._df_unlabeled: Optional[pd.DataFrame] = None
 
     def preprocess(self) -> pd.DataFrame:
-        df = self.options.df.copy()
-        df = ensure_column_is_string(df, self.options.axis_column)
+        df = project_columns(self.options.df, self.options.data_columns())
+        df = ensure_column_is_categorical(df, self.options.axis_column)
 
         if self.options.hue is not None:
-            df = ensure_column_is_string(df, self.options.hue)
+            df = ensure_column_is_categorical(df, self.options.hue)
 
         return df
 
@@ -56,13 +60,13 @@ class BarPlot(AbstractPlot):
             value_column=self.options.value,
         )
 
+        return df
+
+    def draw(self, data: pd.DataFrame) -> Any:
         palette_strategy = get_palette_strategy(self.options.palette)
         self._color, self._palette = palette_strategy.get_palette()
         self._original_palette = self._palette if isinstance(self._palette, dict) else None
 
-        return df
-
-    def draw(self, data: pd.DataFrame) -> Any:
         size_strategy = get_figure_size_strategy(
             self.options.figsize,
             self.options.orientation,
@@ -72,7 +76,8 @@ class BarPlot(AbstractPlot):
             self.options.axis_column,
             self.options.orientation,
         )
-        self.renderer.create_figure(figsize)
+        self.figure = self.renderer.create_figure(figsize)
+        self.ax = self.figure.add_subplot()
 
         if (
             self.options.stacked
@@ -83,6 +88,7 @@ class BarPlot(AbstractPlot):
 
         if self.options.orientation == 'vertical':
             return self.renderer.render_barplot(
+                ax=self.ax,
                 df=data,
                 x=self.options.axis_column,
                 y=self.options.value,
@@ -93,6 +99,7 @@ class BarPlot(AbstractPlot):
             )
 
         return self.renderer.render_barplot(
+            ax=self.ax,
             df=data,
             x=self.options.value,
             y=self.options.axis_column,
@@ -119,6 +126,7 @@ class BarPlot(AbstractPlot):
         width = 0.8 if self.options.orientation == 'horizontal' else 0.6
 
         plot = self.renderer.render_stacked_barplot(
+            ax=self.ax,
             df=df_labeled,
             kind=kind,
             colors=colors,
@@ -17,9 +17,11 @@ from ..common.formatting import (
 )
 from ..common.data_conversion import (
     convert_palette_to_strings,
-    ensure_column_is_string,
+    ensure_column_is_categorical,
     prepare_legend_label_map,
+    project_columns,
 )
+from ..common.aggregation import COUNT_COLUMN, aggregate_counts
 from ..common.data_filtering import filter_top_n_categories
 from ..common.sorting import (
 
@@ -31,6 +33,9 @@ from ..common.stacked_plots import prepare_stacked_data
 
 
 class CountPlot(AbstractPlot):
+    _transform_state = ('_order', '_counts')
+    _intermediates = ('_df_unlabeled',)
+
     def __init__(self, options: CountPlotOptions, renderer=None):
         super().__init__(options, renderer)
         self.options: CountPlotOptions = options
@@ -39,34 +44,47 @@ class CountPlot(AbstractPlot):
         self._palette: Optional[Any] = None
         self._original_palette: Optional[Dict[Any, str]] = None
         self._df_unlabeled: Optional[pd.DataFrame] = None
+        self._counts: Optional[pd.DataFrame] = None
     
     def preprocess(self) -> pd.DataFrame:
-        df = self.options.df.copy()
-        df = ensure_column_is_string(df, self.options.axis_column)
+        df = project_columns(self.options.df, self.options.data_columns())
+        df = ensure_column_is_categorical(df, self.options.axis_column)
         
-        if self.options.top_n is not None:
-            df = filter_top_n_categories(df, self.options.axis_column, self.options.top_n)
+        # Encode hue with string labels, so it matches normalized palette keys
+        if self.options.hue is not None:
+            df = ensure_column_is_categorical(df, self.options.hue)
         
         return df
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        ordering_strategy = get_ordering_strategy(self.options.order_type)
-        self._order = ordering_strategy.get_order(df, self.options.axis_column)
+        # Count once; top_n, ordering, sizing and labels all read this table
+        counts = aggregate_counts(df, self.options.axis_column, self.options.hue)
         
-        # Convert hue to string if present, so it matches normalized palette keys
-        if self.options.hue is not None:
-            df = ensure_column_is_string(df, self.options.hue)
+        if self.options.top_n is not None:
+            counts = filter_top_n_categories(
+                counts,
+                self.options.axis_column,
+                self.options.top_n,
+                value_column=COUNT_COLUMN
+            )
+        
+        ordering_strategy = get_ordering_strategy(self.options.order_type)
+        self._order = ordering_strategy.get_order(
+            counts,
+            self.options.axis_column,
+            value_column=COUNT_COLUMN
+        )
         
+        self._counts = counts
+        return counts
+    
+    def draw(self, data: pd.DataFrame) -> Any:
+        # Colours are cosmetic, so they are resolved here rather than in
+        # transform; a cached transform result stays valid across palettes.
         palette_strategy = get_palette_strategy(self.options.palette)
         self._color, self._palette = palette_strategy.get_palette()
         self._original_palette = self._palette if isinstance(self._palette, dict) else None
         
-        # Keep original types for palette keys to match data types
-        # Label map for legend will be prepared in format_plot
-        
-        return df
-    
-    def draw(self, data: pd.DataFrame) -> Any:
         size_strategy = get_figure_size_strategy(
             self.options.figsize,
             self.options.orientation
@@ -76,7 +94,8 @@ class CountPlot(AbstractPlot):
             self.options.axis_column,
             self.options.orientation
         )
-        self.renderer.create_figure(figsize)
+        self.figure = self.renderer.create_figure(figsize)
+        self.ax = self.figure.add_subplot()
         
         if (self.options.stacked and 
             self.options.hue is not None and 
@@ -84,17 +103,21 @@ class CountPlot(AbstractPlot):
             return self._draw_stacked(data)
         
         if self.options.orientation == 'vertical':
-            plot = self.renderer.render_countplot(
+            plot = self.renderer.render_barplot(
+                ax=self.ax,
                 df=data,
                 x=self.options.axis_column,
+                y=COUNT_COLUMN,
                 hue=self.options.hue,
                 order=self._order,
                 color=self._color,
                 palette=self._palette
             )
         else:
-            plot = self.renderer.render_countplot(
+            plot = self.renderer.render_barplot(
+                ax=self.ax,
                 df=data,
+                x=COUNT_COLUMN,
                 y=self.options.axis_column,
                 hue=self.options.hue,
                 order=self._order,
@@ -110,8 +133,9 @@ class CountPlot(AbstractPlot):
             self.options.hue,  # type: ignore
             self.options.axis_column,
             self.options.order_type,
+            value_col=COUNT_COLUMN,
             orientation='horizontal' if self.options.orientation == 'horizontal' else 'vertical'
-        )
+        ).astype(int)
         
         df_labeled = apply_label_mapping(df_prepared, self.options.label_map)
         colors = create_colors_list(df_prepared, self._palette)  # type: ignore
@@ -120,6 +144,7 @@ class CountPlot(AbstractPlot):
         width = 0.8 if self.options.orientation == 'horizontal' else 0.6
         
         plot = self.renderer.render_stacked_barplot(
+            ax=self.ax,
             df=df_labeled,
             kind=kind,
             colors=colors,
@@ -134,7 +159,7 @@ class CountPlot(AbstractPlot):
             self.options.plot_legend and 
             self.options.hue is not None):
             self.options.label_map = create_default_label_map(
-                self._preprocessed_df,  # type: ignore
+                self._counts,  # type: ignore
                 self.options.hue
             )
         
@@ -16,13 +16,16 @@ from ..common.sorting import (
     create_default_label_map,
 )
 from ..common.data_conversion import (
+    ensure_column_is_categorical,
     ensure_column_is_int,
-    ensure_column_is_string,
     prepare_legend_label_map,
+    project_columns,
 )
 
 
 class Histogram(AbstractPlot):
+    _transform_state = ('_bins',)
+
     def __init__(self, options: HistogramOptions, renderer=None):
         super().__init__(options, renderer)
         self.options: HistogramOptions = options
@@ -31,27 +34,21 @@ class Histogram(AbstractPlot):
         self._bins: int = 100
     
     def preprocess(self) -> pd.DataFrame:
-        df = self.options.df.copy()
+        df = project_columns(self.options.df, self.options.data_columns())
         
         if self.options.xlimit is not None:
-            df = cast(pd.DataFrame, df[df[self.options.x] <= self.options.xlimit].copy())
+            df = cast(pd.DataFrame, df[df[self.options.x] <= self.options.xlimit])
         
         return df
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
         df = ensure_column_is_int(df, self.options.x)
-        # Convert hue to string if present, so it matches normalized palette keys
+        # Encode hue with string labels, so it matches normalized palette keys
         if self.options.hue is not None:
-            df = ensure_column_is_string(df, self.options.hue)
+            df = ensure_column_is_categorical(df, self.options.hue)
         
         self._bins = self._calculate_bins(df)
         
-        palette_strategy = get_palette_strategy(self.options.palette)
-        self._color, self._palette = palette_strategy.get_palette()
-        
-        # Keep original types for palette keys to match data types
-        # Label map for legend will be prepared in format_plot
-        
         return df
     
     def _calculate_bins(self, df: pd.DataFrame) -> int:
@@ -62,10 +59,15 @@ class Histogram(AbstractPlot):
     
     def draw(self, data: pd.DataFrame) -> Any:
         from ..config import FigureSize
-        self.renderer.create_figure((FigureSize.WIDTH, FigureSize.HEIGHT * 0.7))
+        palette_strategy = get_palette_strategy(self.options.palette)
+        self._color, self._palette = palette_strategy.get_palette()
+        
+        self.figure = self.renderer.create_figure((FigureSize.WIDTH, FigureSize.HEIGHT * 0.7))
+        self.ax = self.figure.add_subplot()
         
 
         plot = self.renderer.render_histogram(
+            ax=self.ax,
             df=data,
             x=self.options.x,
             bins=self._bins,
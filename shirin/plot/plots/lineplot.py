@@ -18,7 +18,8 @@ from ..common.sorting import (
 from ..common.data_conversion import (
     fill_missing_values_in_data,
     prepare_legend_label_map,
-    ensure_column_is_string,
+    ensure_column_is_categorical,
+    project_columns,
 )
 
 
@@ -30,7 +31,7 @@ class LinePlot(AbstractPlot):
         self._palette: Optional[Any] = None
     
     def preprocess(self) -> pd.DataFrame:
-        df = self.options.df.copy()
+        df = project_columns(self.options.df, self.options.data_columns())
         
         if self.options.fill_missing_values is not None:
             df = fill_missing_values_in_data(
@@ -44,10 +45,14 @@ class LinePlot(AbstractPlot):
         return df
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Convert hue to string if present, so it matches normalized palette keys
+        # Encode hue with string labels, so it matches normalized palette keys
         if self.options.hue is not None:
-            df = ensure_column_is_string(df, self.options.hue)
+            df = ensure_column_is_categorical(df, self.options.hue)
         
+        return df
+    
+    def draw(self, data: pd.DataFrame) -> Any:
+        from ..config import FigureSize
         palette_strategy = get_palette_strategy(self.options.palette)
         self._color, self._palette = palette_strategy.get_palette()
         
@@ -55,16 +60,11 @@ class LinePlot(AbstractPlot):
         if self.options.hue is None:
             self._color = 'black'
         
-        # Keep original types for palette keys to match data types
-        # Label map for legend will be prepared in format_plot
-        
-        return df
-    
-    def draw(self, data: pd.DataFrame) -> Any:
-        from ..config import FigureSize
-        self.renderer.create_figure((FigureSize.WIDTH, FigureSize.STANDARD_HEIGHT))
+        self.figure = self.renderer.create_figure((FigureSize.WIDTH, FigureSize.STANDARD_HEIGHT))
+        self.ax = self.figure.add_subplot()
         
         plot = self.renderer.render_lineplot(
+            ax=self.ax,
             df=data,
             x=self.options.x,
             y=self.options.y,
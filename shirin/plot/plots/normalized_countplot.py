@@ -1,4 +1,4 @@
-from typing import Any, Optional, Dict
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
@@ -14,48 +14,49 @@ from ..common.formatting import (
 )
 from ..common.data_conversion import (
     convert_palette_to_strings,
-    ensure_column_is_string,
+    ensure_column_is_categorical,
     convert_dict_keys_to_string,
+    project_columns,
 )
+from ..common.aggregation import COUNT_COLUMN, aggregate_counts
 from ..common.data_filtering import filter_top_n_categories
 from ..common.label_mapping import create_label_map
 from ..common.sorting import sort_pivot_table
 
 
 class NormalizedCountPlot(AbstractPlot):
+    _transform_state = ('_normalized_pivot', '_counts', '_hue_values')
+
     def __init__(self, options: NormalizedCountPlotOptions, renderer=None):
         super().__init__(options, renderer)
         self.options: NormalizedCountPlotOptions = options
         self._palette: Dict[Any, str] = {}
         self._normalized_pivot: Optional[pd.DataFrame] = None
+        self._counts: Optional[pd.DataFrame] = None
+        self._hue_values: List[str] = []
 
     def preprocess(self) -> pd.DataFrame:
-        df = self.options.df.copy()
-
-        df = ensure_column_is_string(df, self.options.axis_column)
-        df = ensure_column_is_string(df, self.options.hue)
-
-        palette = convert_dict_keys_to_string(self.options.palette) or {}
-        unique_hue_values = df[self.options.hue].unique()
-        missing_keys = [val for val in unique_hue_values if val not in palette]
-        if missing_keys:
-            raise ValueError(f"Palette missing keys for hue values: {missing_keys}")
-
-        if self.options.top_n is not None:
-            df = filter_top_n_categories(df, self.options.axis_column, self.options.top_n)
+        df = project_columns(self.options.df, self.options.data_columns())
 
+        df = ensure_column_is_categorical(df, self.options.axis_column)
+        df = ensure_column_is_categorical(df, self.options.hue)
         return df
 
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-
-        self._palette = convert_palette_to_strings(self.options.palette)
-        
-        if self.options.label_map:
-            self.options.label_map = convert_dict_keys_to_string(self.options.label_map)
+        self._hue_values = df[self.options.hue].cat.categories.tolist()
         
-        counts = df.groupby([self.options.axis_column, self.options.hue]).size()
-        normalized_counts = counts / counts.groupby(level=0).sum()
-        normalized_df = normalized_counts.rename("percentage").reset_index()
+        counts = aggregate_counts(df, self.options.axis_column, self.options.hue)
+        if self.options.top_n is not None:
+            counts = filter_top_n_categories(
+                counts,
+                self.options.axis_column,
+                self.options.top_n,
+                value_column=COUNT_COLUMN
+            )
+        self._counts = counts
+
+        totals = counts.groupby(self.options.axis_column)[COUNT_COLUMN].transform('sum')
+        normalized_df = counts.assign(percentage=counts[COUNT_COLUMN] / totals)
         
         normalized_pivot = normalized_df.pivot(
             index=self.options.axis_column,
@@ -74,10 +75,18 @@ class NormalizedCountPlot(AbstractPlot):
             ascending=ascending
         )
         
-        return df
+        return counts
     
     def draw(self, data: pd.DataFrame) -> Any:
+        palette = convert_dict_keys_to_string(self.options.palette) or {}
+        missing_keys = [val for val in self._hue_values if val not in palette]
+        if missing_keys:
+            raise ValueError(f"Palette missing keys for hue values: {missing_keys}")
 
+        self._palette = convert_palette_to_strings(self.options.palette)
+        
+        if self.options.label_map:
+            self.options.label_map = convert_dict_keys_to_string(self.options.label_map)
         
         size_strategy = get_figure_size_strategy(self.options.figsize, self.options.orientation)
         figsize = size_strategy.calculate_size(
@@ -86,7 +95,8 @@ class NormalizedCountPlot(AbstractPlot):
             self.options.orientation
         )
         
-        self.renderer.create_figure(figsize)
+        self.figure = self.renderer.create_figure(figsize)
+        self.ax = self.figure.add_subplot()
         colors = []
         for col in self._normalized_pivot.columns:
             str_col = str(col)
@@ -99,6 +109,7 @@ class NormalizedCountPlot(AbstractPlot):
         width = 0.6 if self.options.orientation == 'vertical' else 0.8
         
         plot = self.renderer.render_stacked_barplot(
+            ax=self.ax,
             df=self._normalized_pivot,  # type: ignore
             kind=plot_kind,
             colors=colors,
@@ -110,7 +121,7 @@ class NormalizedCountPlot(AbstractPlot):
     def format_plot(self, plot: Any) -> None:
         label_map = create_label_map(
             self.options.label_map,
-            self._preprocessed_df[self.options.hue].unique()  # type: ignore
+            self._counts[self.options.hue].unique()  # type: ignore
         )
         
         format_xy_labels(plot, xlabel=self.options.xlabel, ylabel=self.options.ylabel)
@@ -1,18 +1,19 @@
 from typing import Any, Optional, List, cast
 
 import pandas as pd
-import matplotlib.pyplot as plt
 
 from ..core.base_plot import AbstractPlot
 from ..core.options import PiePlotOptions
 from ..common.label_mapping import create_label_map
 from ..common.formatting.text_contrast import get_text_color_for_background
-from ..common.data_conversion import convert_dict_keys_to_string
+from ..common.data_conversion import convert_dict_keys_to_string, project_columns
 from ...stats.number_format import format_thousands
 
 
 
 class PieChart(AbstractPlot):
+    _transform_state = ('_values', '_original_labels')
+
     def __init__(self, options: PiePlotOptions, renderer=None):
         super().__init__(options, renderer)
         self.options: PiePlotOptions = options
@@ -22,14 +23,18 @@ class PieChart(AbstractPlot):
         self._values: Optional[List] = None
     
     def preprocess(self) -> pd.DataFrame:
-        return self.options.df.copy()
+        return project_columns(self.options.df, self.options.data_columns())
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
+        df = df.copy(deep=False)
         df[self.options.col] = df[self.options.col].fillna(0).astype(float)
         self._values = df[self.options.col].tolist()
         self._original_labels = df.index.tolist()
         
+        return df
+    
+    def draw(self, data: pd.DataFrame) -> Any:
+        from ..config import FigureSize
         label_map_to_use = self.options.label_map
         # Keep original types for label_map keys
         # if label_map_to_use:
@@ -49,13 +54,11 @@ class PieChart(AbstractPlot):
         else:
             self._colors = ['#000000'] * len(original_labels)
         
-        return df
-    
-    def draw(self, data: pd.DataFrame) -> Any:
-        from ..config import FigureSize
-        self.renderer.create_figure((FigureSize.PIE, FigureSize.PIE))
+        self.figure = self.renderer.create_figure((FigureSize.PIE, FigureSize.PIE))
+        self.ax = self.figure.add_subplot()
         
         result = self.renderer.render_piechart(
+            ax=self.ax,
             values=self._values,  # type: ignore
             colors=self._colors,  # type: ignore
             donut=self.options.donut,
@@ -66,8 +69,7 @@ class PieChart(AbstractPlot):
         
         self._autotexts = result[2] if len(result) == 3 else []
         
-        ax = plt.gca()
-        return ax
+        return self.ax
     
     def format_plot(self, plot: Any) -> None:
         from ..config import FontSizes, TextColors
@@ -79,7 +81,7 @@ class PieChart(AbstractPlot):
         ]
 
         
-        legend = plt.legend(
+        legend = plot.legend(
             legend_labels,
             loc="lower center",
             bbox_to_anchor=(0.5, 0.98),
@@ -1,8 +1,8 @@
 from typing import Any, Optional
 
 import pandas as pd
-import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.artist import setp
 from matplotlib.ticker import FuncFormatter
 
 from ..core.base_plot import AbstractPlot
@@ -11,11 +11,14 @@ from ..common.formatting import (
     format_ticks,
     format_xy_labels,
 )
+from ..common.data_conversion import project_columns
 from ..common.strategies.palette import get_palette_strategy
 from ..config.colors import Colors, TextColors
 
 
 class TimePlot(AbstractPlot):
+    _transform_state = ('_aggregated_df',)
+
     def __init__(self, options: TimePlotOptions, renderer=None):
         super().__init__(options, renderer)
         self.options: TimePlotOptions = options
@@ -23,7 +26,7 @@ class TimePlot(AbstractPlot):
         self._color: Optional[str] = None
     
     def preprocess(self) -> pd.DataFrame:
-        df = self.options.df.copy()
+        df = project_columns(self.options.df, self.options.data_columns())
         date_col = self.options.x
         
         # Ensure the column is datetime
@@ -37,10 +40,6 @@ class TimePlot(AbstractPlot):
         return df
     
     def transform(self, df: pd.DataFrame) -> pd.DataFrame:
-        # Get color from palette strategy (reuses same logic as other plots)
-        palette_strategy = get_palette_strategy(self.options.palette)
-        self._color, _ = palette_strategy.get_palette()
-        
         group_by = self.options.group_by
         date_col = self.options.x
         
@@ -100,9 +99,14 @@ class TimePlot(AbstractPlot):
     
     def draw(self, data: pd.DataFrame) -> Any:
         from ..config import FigureSize
-        self.renderer.create_figure((FigureSize.WIDTH, FigureSize.STANDARD_HEIGHT))
+        # Get color from palette strategy (reuses same logic as other plots)
+        palette_strategy = get_palette_strategy(self.options.palette)
+        self._color, _ = palette_strategy.get_palette()
+        
+        self.figure = self.renderer.create_figure((FigureSize.WIDTH, FigureSize.STANDARD_HEIGHT))
+        self.ax = self.figure.add_subplot()
         
-        ax = plt.gca()
+        ax = self.ax
         plot_type = getattr(self.options, 'plot_type', 'bar')
 
         if plot_type == 'bar':
@@ -215,6 +219,7 @@ class TimePlot(AbstractPlot):
         else:  # day
             ax.xaxis.set_major_locator(mdates.AutoDateLocator())
             ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-            plt.xticks(rotation=self.options.rotation, ha='right')
+            setp(ax.get_xticklabels(), rotation=self.options.rotation, ha='right')
         
-        plt.tight_layout()
+        if self.renderer.auto_layout:
+            ax.figure.tight_layout()
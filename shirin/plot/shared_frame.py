@@ -0,0 +1,131 @@
+import json
+import os
+import tempfile
+import uuid
+from dataclasses import dataclass
+from typing import List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+# Schema metadata key listing the object columns whose nulls were NaN.
+NAN_COLUMNS_KEY = b'shirin.nan_columns'
+
+
+def shared_memory_dir() -> Optional[str]:
+    """``/dev/shm`` where available, so published frames never touch disk."""
+    return '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+@dataclass(frozen=True)
+class SharedFrame:
+    """Handle to a DataFrame published as an Arrow IPC file.
+
+    The handle is a path, so it pickles in bytes regardless of the frame
+    size. ``load`` memory-maps the file: numeric columns come back as views
+    on the mapping and only the requested columns are materialised.
+    """
+    path: str
+
+    def load(self, columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        with pa.memory_map(self.path) as source:
+            table = pa.ipc.open_file(source).read_all()
+        # With unknown names the whole frame is loaded, so the plot fails
+        # exactly as it would on the original DataFrame.
+        if columns is not None and set(columns) <= set(table.column_names):
+            wanted = set(columns)
+            index_columns = [
+                name for name in (table.schema.pandas_metadata or {}).get('index_columns', [])
+                if isinstance(name, str)
+            ]
+            table = table.select([
+                name for name in table.column_names
+                if name in wanted or name in index_columns
+            ])
+        df = table.to_pandas(split_blocks=True)
+        # Arrow has a single null, which comes back as None in object
+        # columns; restore NaN where the original frame held it.
+        metadata = table.schema.metadata or {}
+        nan_columns = set(json.loads(metadata.get(NAN_COLUMNS_KEY, b'[]')))
+        for name in df.columns:
+            if str(name) in nan_columns and df[name].dtype == object and df[name].hasnans:
+                values = df[name].to_numpy(copy=True)
+                values[pd.isna(values)] = np.nan
+                df[name] = values
+        return df
+
+
+def _null_kind(values: pd.Series) -> Optional[str]:
+    """``'none'`` or ``'nan'`` when every null in ``values`` is that kind.
+
+    Returns ``None`` for columns mixing kinds (or holding ``pd.NA``/``NaT``),
+    which can't be restored from Arrow's single null.
+    """
+    kinds = {
+        'none' if value is None else 'nan' if isinstance(value, float) else None
+        for value in values[values.isna()]
+    }
+    return kinds.pop() if len(kinds) == 1 and None not in kinds else None
+
+
+def publish_frame(df: pd.DataFrame, directory: str) -> Optional[SharedFrame]:
+    """Write ``df`` to ``directory`` as an uncompressed Arrow IPC file.
+
+    Object columns keep their kind of null (``None`` or NaN) through the
+    schema metadata. Returns ``None`` when the frame can't be represented
+    in Arrow (e.g. object columns mixing types or kinds of null); callers
+    then fall back to pickling it.
+    """
+    nan_columns = []
+    for name in df.columns:
+        if df[name].dtype == object and df[name].hasnans:
+            kind = _null_kind(df[name])
+            if kind is None:
+                return None
+            if kind == 'nan':
+                nan_columns.append(str(name))
+    try:
+        table = pa.Table.from_pandas(df)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    if nan_columns:
+        table = table.replace_schema_metadata({
+            **(table.schema.metadata or {}),
+            NAN_COLUMNS_KEY: json.dumps(nan_columns).encode(),
+        })
+
+    path = os.path.join(directory, f'{uuid.uuid4().hex}.arrow')
+    with pa.OSFile(path, 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return SharedFrame(path)
+
+
+class FramePublisher:
+    """Publishes each distinct DataFrame once and removes the files on exit."""
+
+    def __init__(self) -> None:
+        self._tempdir = tempfile.TemporaryDirectory(prefix='shirin-', dir=shared_memory_dir())
+        self._published: dict = {}
+        # Keep the frames alive so their id() can't be reused while publishing.
+        self._frames: List[pd.DataFrame] = []
+
+    def publish(self, df: pd.DataFrame) -> Optional[SharedFrame]:
+        key = id(df)
+        if key not in self._published:
+            self._frames.append(df)
+            self._published[key] = publish_frame(df, self._tempdir.name)
+        return self._published[key]
+
+    def close(self) -> None:
+        self._frames.clear()
+        self._published.clear()
+        self._tempdir.cleanup()
+
+    def __enter__(self) -> 'FramePublisher':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -2,17 +2,32 @@
 
 import os
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Any, Dict, Optional, Sequence, Union
 import pandas as pd
+import pyarrow as pa
 
+from .arrow import table_to_pandas
+from .batch import QueryResult, run_sql_queries
+from .cache import QueryCache, query_key
+from .dataset import load_result, open_result
+from .engine import dispose_engines, get_engine
+from .incremental import read_watermark, run_incremental
+from .ipc import is_ipc_path, load_arrow, save_arrow
+from .parquet import ParquetOptions, write_table_to_parquet
+from .partition import PartitionSpec, run_partitioned
 from .helpers import (
     load_sql_query,
     load_db_config,
     convert_extension_types,
-    execute_query
+    execute_query,
+    fetch_arrow_table,
+    stream_query_to_parquet
 )
 
 
+FETCH_MODES = ('pandas', 'arrow', 'table')
+
+
 try:
     os.add_dll_directory("C:\\Program Files\\IBM\\SQLLIB\\BIN")
 except AttributeError:
@@ -23,23 +38,79 @@ except AttributeError:
 def run_sql_query(
     sql_query: Union[str, Path],
     db_config: Union[Dict[str, str], Path],
-    output_path: Optional[Path] = None
-) -> Optional[pd.DataFrame]:
+    output_path: Optional[Path] = None,
+    batch_size: Optional[int] = None,
+    params: Optional[Sequence[Any]] = None,
+    cache: Optional[QueryCache] = None,
+    fetch: str = 'pandas',
+    partition: Optional[PartitionSpec] = None,
+    incremental: Optional[str] = None,
+    parquet: Optional[ParquetOptions] = None
+) -> Union[pd.DataFrame, pa.Table, None]:
     """Execute SQL query against IBM DB2 database.
 
     Args:
         sql_query: SQL query as string or Path to SQL file.
         db_config: Database configuration dict or Path to JSON config file.
                    Required keys: user, password, host, port, db_name, schema.
+                   Optional pool keys: pool_size, max_overflow,
+                   pool_pre_ping, pool_recycle, pool_timeout (see ``get_engine``).
         output_path: Optional Path to save results as Parquet file.
-                     If None, returns DataFrame.
+                     If None, returns DataFrame. Paths ending in
+                     ``.arrow``, ``.feather`` or ``.ipc`` get an
+                     uncompressed Arrow IPC file instead, which
+                     ``load_arrow`` memory-maps (``save_arrow`` writes
+                     LZ4-compressed ones).
+        batch_size: Stream the result to ``output_path`` in row groups of
+                    this many rows instead of loading it into pandas first;
+                    memory stays flat for any result size. Requires
+                    ``output_path``.
+        params: Optional positional parameters for ``?`` placeholders
+                in the query.
+        cache: Optional QueryCache. Results are looked up by the normalized
+               query, ``params`` and the non-secret connection settings,
+               and stored there after a miss. Not used with batch_size.
+        fetch: How rows are turned into a result:
+               ``'pandas'`` uses ``pd.read_sql`` (object dtypes);
+               ``'arrow'`` builds Arrow record batches straight from the
+               cursor and returns an Arrow-backed DataFrame
+               (``dtype_backend='pyarrow'``, low-cardinality strings as
+               categoricals); ``'table'`` returns the ``pyarrow.Table``
+               itself. With output_path, both Arrow modes write the table
+               to Parquet without converting it.
+        partition: Optional PartitionSpec. The query is split into key
+                   ranges that run concurrently over pooled connections.
+                   ``output_path`` is then a dataset directory receiving
+                   one Parquet file per partition; without it the
+                   partitions are concatenated in memory (row order is
+                   not preserved). Not used with cache.
+        incremental: Name of an increasing timestamp/ID column. Each run
+                     fetches only rows with a key above the highest one
+                     extracted before (kept in ``_watermark.json``) and adds
+                     them as a new file to the dataset directory
+                     ``output_path``. Requires output_path; not used with
+                     cache or partition.
+        parquet: Optional ParquetOptions for the written files: Hive
+                 partition columns (``output_path`` becomes a directory),
+                 row-group size, codec and level, dictionary encoding and
+                 statistics. Dataset directories also get a ``_metadata``
+                 summary. partition_cols can't be combined with partition
+                 or incremental.
 
     Returns:
-        DataFrame with query results if output_path is None,
-        otherwise None (results saved to file).
+        DataFrame (or pyarrow Table for ``fetch='table'``) with query
+        results if output_path is None, otherwise None (results saved
+        to file).
 
     Raises:
-        ValueError: If sql_query or db_config format is invalid.
+        ValueError: If sql_query or db_config format is invalid, fetch is
+                    unknown, batch_size is given without output_path or
+                    with cache, or cache is used with ``fetch='table'``
+                    or partition, or incremental is given without
+                    output_path or with cache or partition, or
+                    parquet.partition_cols is combined with either, or
+                    parquet is given for an Arrow IPC output_path.
+        RuntimeError: If a partition of a partitioned query fails.
         KeyError: If required database config keys are missing.
 
     Examples:
@@ -52,15 +123,113 @@ def run_sql_query(
         ...     Path("db_config.json"),
         ...     output_path=Path("results.parquet")
         ... )
+        >>>
+        >>> # Stream a large extract in batches of 50k rows
+        >>> run_sql_query(query, db_config, output_path=Path("big.parquet"), batch_size=50_000)
+        >>>
+        >>> # Re-running the same query within an hour skips the database
+        >>> cache = QueryCache(ttl=3600, directory="~/.cache/shirin/sql")
+        >>> df = run_sql_query("SELECT * FROM t WHERE year = ?", db_config, params=[2024], cache=cache)
+        >>>
+        >>> # Arrow-backed result, a fraction of the memory of object columns
+        >>> table = run_sql_query("SELECT * FROM big_table", db_config, fetch="table")
+        >>>
+        >>> # Extract a fact table over 16 connections into a dataset directory
+        >>> run_sql_query(
+        ...     "SELECT * FROM facts",
+        ...     db_config,
+        ...     output_path=Path("facts/"),
+        ...     partition=PartitionSpec("fact_id", 0, 100_000_000, num_partitions=64, max_workers=16),
+        ... )
+        >>>
+        >>> # Daily job: append only rows changed since the last run
+        >>> run_sql_query("SELECT * FROM orders", db_config, output_path=Path("orders/"), incremental="updated_at")
+        >>>
+        >>> # Hive-partitioned, zstd-compressed output with 256k-row groups
+        >>> run_sql_query(
+        ...     "SELECT * FROM sales",
+        ...     db_config,
+        ...     output_path=Path("sales/"),
+        ...     parquet=ParquetOptions(partition_cols=["year"], row_group_size=256_000, compression="zstd"),
+        ... )
     """
+    if fetch not in FETCH_MODES:
+        raise ValueError(f"Invalid fetch '{fetch}'. Valid options are: {FETCH_MODES}.")
+    if fetch == 'table' and cache is not None:
+        raise ValueError("cache holds DataFrames; use fetch='arrow' instead of 'table'.")
+    if partition is not None and cache is not None:
+        raise ValueError("cache can't be used with partition.")
+    if incremental is not None and (not output_path or cache is not None or partition is not None):
+        raise ValueError("incremental requires output_path and can't be used with cache or partition.")
+    if parquet is not None and output_path and is_ipc_path(output_path):
+        raise ValueError("parquet options don't apply to Arrow IPC output.")
+    if parquet is not None and parquet.partition_cols and (partition is not None or incremental is not None):
+        raise ValueError("parquet.partition_cols can't be used with partition or incremental.")
+    if batch_size is not None and not output_path:
+        raise ValueError("batch_size requires output_path.")
+    if batch_size is not None and cache is not None:
+        raise ValueError("cache can't be used with batch_size; streamed results are never held in memory.")
+
     query_string = load_sql_query(sql_query)
     config_dict = load_db_config(db_config)
-    df = execute_query(query_string, config_dict)
+
+    if incremental is not None:
+        def write(query: str, query_params: Sequence[Any], path: Path) -> None:
+            run_sql_query(
+                query, config_dict, output_path=path,
+                batch_size=batch_size, params=query_params, fetch=fetch, parquet=parquet,
+            )
+
+        summarize = parquet is None or parquet.write_metadata
+        run_incremental(query_string, params, incremental, output_path, write, summarize)
+        return None
+
+    if partition is not None:
+        return run_partitioned(
+            query_string, config_dict, partition,
+            output_dir=output_path, params=params, batch_size=batch_size, fetch=fetch,
+            parquet=parquet,
+        )
+
+    if batch_size is not None:
+        stream_query_to_parquet(
+            query_string, config_dict, output_path, batch_size, params=params, options=parquet
+        )
+        return None
+
+    if fetch != 'pandas' and cache is None:
+        table = fetch_arrow_table(query_string, config_dict, params)
+        if output_path:
+            _save(table, output_path, parquet)
+            return None
+        return table if fetch == 'table' else table_to_pandas(table)
+
+    def load() -> pd.DataFrame:
+        if fetch == 'arrow':
+            return table_to_pandas(fetch_arrow_table(query_string, config_dict, params))
+        return execute_query(query_string, config_dict, params)
+
+    if cache is None:
+        df = load()
+    else:
+        key = query_key(query_string, config_dict, params, fetch)
+        df = cache.get(key)
+        if df is None:
+            df = load()
+            cache.put(key, df)
 
     if output_path:
         # Convert extension types to avoid PyArrow compatibility issues
         df_to_save = convert_extension_types(df)
-        df_to_save.to_parquet(output_path, index=False)
+        table = pa.Table.from_pandas(df_to_save, preserve_index=False)
+        _save(table, output_path, parquet)
         return None
 
-    return df
\ No newline at end of file
+    return df
+
+
+def _save(table: pa.Table, output_path: Path, parquet: Optional[ParquetOptions]) -> None:
+    if is_ipc_path(output_path):
+        save_arrow(table, output_path)
+    else:
+        write_table_to_parquet(table, output_path, parquet)
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""Fetch query results as Arrow record batches straight from the DBAPI cursor."""
+
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from sqlalchemy.engine import Connection
+
+
+# String columns with at most this share of distinct values are
+# dictionary-encoded.
+DICTIONARY_MAX_RATIO = 0.5
+
+
+def _column_array(values: Sequence[Any]) -> pa.Array:
+    array = pa.array(values, from_pandas=False)
+    if pa.types.is_decimal(array.type):
+        # Match pd.read_sql (coerce_float=True): DECIMAL columns become floats.
+        array = array.cast(pa.float64())
+    return array
+
+
+def rows_to_record_batch(columns: List[str], rows: Sequence[Sequence[Any]]) -> pa.RecordBatch:
+    """Build a record batch from fetched rows, inferring each column's type.
+
+    Args:
+        columns: Column names, in cursor order.
+        rows: Rows as sequences of Python values.
+
+    Returns:
+        RecordBatch; columns that are entirely NULL get Arrow's null type.
+    """
+    if not rows:
+        return pa.RecordBatch.from_pylist([], schema=pa.schema([(name, pa.null()) for name in columns]))
+    values = list(zip(*rows))
+    return pa.RecordBatch.from_arrays([_column_array(column) for column in values], names=columns)
+
+
+def iter_record_batches(
+    connection: Connection,
+    sql_query: str,
+    batch_size: int,
+    params: Optional[Sequence[Any]] = None,
+) -> Iterator[pa.RecordBatch]:
+    """Execute ``sql_query`` and yield its rows in record batches of ``batch_size``.
+
+    Rows are fetched through a server-side cursor where the driver supports
+    it, so only one batch is held in memory at a time. An empty result
+    yields a single empty batch carrying the column names.
+
+    Args:
+        connection: Open SQLAlchemy connection.
+        sql_query: SQL query string, sent to the driver as-is.
+        batch_size: Rows per batch.
+        params: Optional positional parameters for ``?`` placeholders.
+
+    Yields:
+        RecordBatch per fetched chunk of rows.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+    streaming = connection.execution_options(stream_results=True, max_row_buffer=batch_size)
+    if params is None:
+        result = streaming.exec_driver_sql(sql_query)
+    else:
+        result = streaming.exec_driver_sql(sql_query, tuple(params))
+    columns = list(result.keys())
+    empty = True
+    for rows in result.partitions(batch_size):
+        empty = False
+        yield rows_to_record_batch(columns, rows)
+    if empty:
+        yield rows_to_record_batch(columns, [])
+
+
+
+def batches_to_table(batches: Iterable[pa.RecordBatch]) -> pa.Table:
+    """Concatenate record batches whose inferred types may differ.
+
+    Columns that were all NULL in some batches, or integers in one batch and
+    decimals in another, are promoted to a common type.
+
+    Raises:
+        ValueError: If a column's types can't be reconciled.
+    """
+    batches = list(batches)
+    try:
+        schema = pa.unify_schemas([batch.schema for batch in batches], promote_options='permissive')
+        tables = [pa.Table.from_batches([batch]).cast(schema) for batch in batches]
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError) as error:
+        raise ValueError(f"Query result types differ between batches: {error}") from error
+    return pa.concat_tables(tables)
+
+
+def dictionary_encode_strings(table: pa.Table, max_ratio: float = DICTIONARY_MAX_RATIO) -> pa.Table:
+    """Dictionary-encode string columns with few distinct values.
+
+    Args:
+        table: Table to encode.
+        max_ratio: Encode a column when its distinct values are at most this
+                   share of its non-null values.
+
+    Returns:
+        Table with low-cardinality string columns as dictionary arrays.
+    """
+    for index, field in enumerate(table.schema):
+        if not (pa.types.is_string(field.type) or pa.types.is_large_string(field.type)):
+            continue
+        column = table.column(index)
+        values = len(column) - column.null_count
+        if values and pc.count_distinct(column).as_py() <= max_ratio * values:
+            table = table.set_column(index, field.name, column.dictionary_encode())
+    return table
+
+
+def concat_tables(tables: Sequence[pa.Table], dictionary_ratio: Optional[float] = DICTIONARY_MAX_RATIO) -> pa.Table:
+    """Concatenate separately fetched tables, e.g. the partitions of one query.
+
+    Dictionary columns are decoded first, since each table may have encoded
+    a different set of columns, then types are promoted across tables and
+    low-cardinality strings re-encoded for the whole result.
+    """
+    decoded = []
+    for table in tables:
+        schema = pa.schema([
+            field.with_type(field.type.value_type) if pa.types.is_dictionary(field.type) else field
+            for field in table.schema
+        ])
+        decoded.append(table.cast(schema))
+    try:
+        table = pa.concat_tables(decoded, promote_options='permissive')
+    except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+        raise ValueError(f"Query result types differ between tables: {error}") from error
+    if dictionary_ratio is not None:
+        table = dictionary_encode_strings(table, dictionary_ratio)
+    return table
+
+
+def _pandas_type(arrow_type: pa.DataType) -> Optional[pd.api.extensions.ExtensionDtype]:
+    # Dictionary columns become pandas categoricals; everything else stays Arrow.
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
+
+
+def table_to_pandas(table: pa.Table) -> pd.DataFrame:
+    """Arrow-backed DataFrame (``dtype_backend='pyarrow'``) sharing the table's buffers."""
+    return table.to_pandas(types_mapper=_pandas_type)
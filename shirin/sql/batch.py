@@ -0,0 +1,149 @@
+"""Run many SQL queries concurrently over one connection pool."""
+
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from .cache import QueryCache
+from .helpers import load_db_config
+from .parquet import ParquetOptions
+
+
+@dataclass
+class QueryResult:
+    """Outcome of one query in ``run_sql_queries``.
+
+    ``data`` holds the DataFrame (or pyarrow Table for ``fetch='table'``)
+    when no output directory was given, otherwise
+    ``path`` is the Parquet file written. ``error`` is the formatted traceback
+    of a failed query and ``duration`` its wall time in seconds, including
+    any wait for a free connection.
+    """
+    name: str
+    data: Union[pd.DataFrame, pa.Table, None] = None
+    path: Optional[Path] = None
+    error: Optional[str] = None
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _run_one(
+    name: str,
+    sql_query: Union[str, Path],
+    db_config: Dict[str, str],
+    output_dir: Optional[Path],
+    **options: Any,
+) -> QueryResult:
+    # Imported here to avoid a cycle: the package __init__ re-exports this module.
+    from . import run_sql_query
+
+    result = QueryResult(name=name)
+    start = time.perf_counter()
+    try:
+        if output_dir is None:
+            result.data = run_sql_query(sql_query, db_config, **options)
+        else:
+            path = output_dir / f"{name}.parquet"
+            run_sql_query(sql_query, db_config, output_path=path, **options)
+            result.path = path
+    except Exception:
+        result.error = traceback.format_exc()
+    result.duration = time.perf_counter() - start
+    return result
+
+
+def run_sql_queries(
+    queries: Dict[str, Union[str, Path]],
+    db_config: Union[Dict[str, str], Path],
+    max_workers: int = 4,
+    max_connections: Optional[int] = None,
+    output_dir: Optional[Union[str, Path]] = None,
+    batch_size: Optional[int] = None,
+    cache: Optional[QueryCache] = None,
+    params: Optional[Dict[str, Sequence[Any]]] = None,
+    fetch: str = 'pandas',
+    parquet: Optional[ParquetOptions] = None,
+) -> Dict[str, QueryResult]:
+    """Execute independent SQL queries concurrently on a thread pool.
+
+    All queries share one engine whose pool holds at most ``max_connections``
+    connections (no overflow), so the database never sees more than that many
+    sessions from this call; threads beyond the cap wait for a free
+    connection. A failing query is reported in its result and does not stop
+    the others.
+
+    Args:
+        queries: Query name -> SQL string or Path to SQL file.
+        db_config: Database configuration dict or Path to JSON config file.
+        max_workers: Number of queries run at the same time.
+        max_connections: Cap on open database connections. Defaults to
+                         ``max_workers``.
+        output_dir: If given, each result is saved as
+                    ``<output_dir>/<name>.parquet`` instead of returned.
+        batch_size: Stream saved results in batches of this many rows
+                    (see ``run_sql_query``). Requires ``output_dir``.
+        cache: Optional QueryCache shared by all queries (see
+               ``run_sql_query``).
+        params: Optional query name -> positional parameters for that
+                query's ``?`` placeholders.
+        fetch: Fetch mode for every query (see ``run_sql_query``).
+        parquet: Optional ParquetOptions for the saved files.
+
+    Returns:
+        Dict of query name -> QueryResult, in the order of ``queries``.
+
+    Raises:
+        ValueError: If max_workers or max_connections is below 1, or
+                    batch_size is given without output_dir or with cache.
+
+    Examples:
+        >>> results = run_sql_queries(
+        ...     {"sales": "SELECT * FROM sales", "stock": Path("stock.sql")},
+        ...     db_config,
+        ...     max_workers=8,
+        ... )
+        >>> sales = results["sales"].data
+        >>> failed = {name: r.error for name, r in results.items() if not r.ok}
+    """
+    if max_connections is None:
+        max_connections = max_workers
+    if max_workers < 1 or max_connections < 1:
+        raise ValueError("max_workers and max_connections must be at least 1.")
+    if batch_size is not None and output_dir is None:
+        raise ValueError("batch_size requires output_dir.")
+    if batch_size is not None and cache is not None:
+        raise ValueError("cache can't be used with batch_size.")
+
+    params = params or {}
+    # The pool settings are part of the engine cache key, so every query
+    # (and later calls with the same cap) shares one capped engine. Queued
+    # queries wait for a connection however long the running ones take.
+    config = {
+        **load_db_config(db_config),
+        'pool_size': max_connections,
+        'max_overflow': 0,
+        'pool_timeout': None,
+    }
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {
+            name: pool.submit(
+                _run_one, name, query, config, output_dir,
+                batch_size=batch_size, cache=cache, params=params.get(name), fetch=fetch,
+                parquet=parquet,
+            )
+            for name, query in queries.items()
+        }
+        return {name: future.result() for name, future in futures.items()}
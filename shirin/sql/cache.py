@@ -0,0 +1,279 @@
+"""Opt-in cache of query results, in memory and optionally on disk."""
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence
+
+import pandas as pd
+import pyarrow as pa
+
+from .arrow import table_to_pandas
+from .ipc import IPC_COMPRESSIONS, read_arrow_table, save_arrow
+
+
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2
+DEFAULT_MAX_DISK_BYTES = 4 * 1024 ** 3
+
+# Connection settings that decide which data a query sees. The password is
+# deliberately absent: it never enters a key or a file name.
+FINGERPRINT_KEYS = ['host', 'port', 'db_name', 'schema', 'user']
+
+DISK_FORMATS = ('parquet', 'arrow')
+
+# run_sql_query fetch modes whose DataFrames can be cached; each is a separate
+# entry because their dtypes differ.
+CACHED_FETCH_MODES = ('pandas', 'arrow')
+
+# Quoted literals/identifiers are kept verbatim; whitespace elsewhere collapses.
+_TOKENS = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|\s+")
+
+
+def normalize_query(sql_query: str) -> str:
+    """Collapse whitespace outside quotes and drop a trailing semicolon."""
+    normalized = _TOKENS.sub(lambda match: match.group(1) or ' ', sql_query).strip()
+    return normalized.rstrip(';').rstrip()
+
+
+def config_fingerprint(db_config: Dict[str, Any]) -> str:
+    """Hash of the non-secret connection settings (host, port, db, schema, user)."""
+    identity = tuple(str(db_config.get(key)) for key in FINGERPRINT_KEYS)
+    return hashlib.blake2b(repr(identity).encode(), digest_size=16).hexdigest()
+
+
+def query_key(
+    sql_query: str,
+    db_config: Dict[str, Any],
+    params: Optional[Sequence[Any]] = None,
+    fetch: str = 'pandas',
+) -> str:
+    """Cache key of a query: normalized SQL, parameters, config fingerprint and fetch mode."""
+    parts = (
+        normalize_query(sql_query),
+        None if params is None else tuple(repr(value) for value in params),
+        config_fingerprint(db_config),
+        fetch,
+    )
+    return hashlib.blake2b(repr(parts).encode(), digest_size=20).hexdigest()
+
+
+def _mapped_frame(table: pa.Table) -> pd.DataFrame:
+    # A frame that was Arrow-backed when stored is rebuilt on the mapped
+    # buffers (columns are paged in from disk when touched); to_pandas
+    # would copy every column into NumPy.
+    columns = (table.schema.pandas_metadata or {}).get('columns', [])
+    arrow_backed = bool(columns) and all(
+        column['numpy_type'].endswith('[pyarrow]') or column['pandas_type'] == 'categorical'
+        for column in columns
+    )
+    return table_to_pandas(table) if arrow_backed else table.to_pandas()
+
+
+@dataclass
+class _Entry:
+    df: pd.DataFrame
+    stored_at: float
+    nbytes: int
+
+
+class QueryCache:
+    """LRU cache of query results with a time-to-live.
+
+    Results are kept in memory up to ``max_bytes``. With ``directory`` set,
+    every result is also written there, so it survives restarts and memory
+    eviction; ``max_disk_bytes`` (4 GiB by default, None for no limit)
+    bounds that directory, least recently used files going first. Files
+    that can't be read are deleted and count as misses. Entries older than ``ttl`` seconds are treated as
+    misses and removed.
+
+    ``disk_format`` picks the file type: ``'parquet'`` (compact) or
+    ``'arrow'``, Arrow IPC files that are memory-mapped on load. Arrow-backed
+    results (``fetch='arrow'``) then keep their columns on the mapping, so a
+    kernel restart reopens even large results almost instantly; NumPy-backed
+    frames are still copied into memory, without the Parquet decoding.
+    ``compression`` ('lz4' or 'zstd') applies to Arrow files only and
+    means columns are decompressed on load.
+
+    Results are copied once when stored; lookups return a shallow copy that
+    shares the cached columns, so a hit costs no memory. With pandas'
+    copy-on-write (``pd.options.mode.copy_on_write = True``) modifying a
+    returned DataFrame never changes the cached result; without it, adding
+    or replacing columns is safe but in-place edits (``df.loc[...] = ...``)
+    must be made on a ``df.copy()``.
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        directory: Optional[str] = None,
+        max_disk_bytes: Optional[int] = DEFAULT_MAX_DISK_BYTES,
+        disk_format: str = 'parquet',
+        compression: Optional[str] = None,
+    ):
+        if max_bytes < 0 or (max_disk_bytes is not None and max_disk_bytes < 0):
+            raise ValueError("max_bytes cannot be negative")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("ttl must be positive")
+        if disk_format not in DISK_FORMATS:
+            raise ValueError(f"Invalid disk_format '{disk_format}'. Valid options are: {DISK_FORMATS}.")
+        if compression not in IPC_COMPRESSIONS:
+            raise ValueError(f"Invalid compression '{compression}'. Valid options are: {IPC_COMPRESSIONS}.")
+        self.disk_format = disk_format
+        self.compression = compression
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.directory = os.path.expanduser(directory) if directory is not None else None
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._lock = threading.RLock()
+        if self.directory is not None:
+            os.makedirs(self.directory, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(entry.nbytes for entry in self._entries.values())
+
+    def get(self, key: str) -> Optional[pd.DataFrame]:
+        """Cached result for ``key``, or None on a miss or an expired entry."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self._expired(entry.stored_at):
+                self.invalidate_key(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+            else:
+                entry = self._read_disk(key)
+                if entry is not None:
+                    self._store(key, entry)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry.df.copy(deep=False)
+
+    def put(self, key: str, df: pd.DataFrame) -> None:
+        entry = _Entry(df=df.copy(), stored_at=time.time(), nbytes=int(df.memory_usage(deep=True).sum()))
+        with self._lock:
+            self._store(key, entry)
+            self._write_disk(key, entry)
+
+    def invalidate(
+        self,
+        sql_query: str,
+        db_config: Dict[str, Any],
+        params: Optional[Sequence[Any]] = None,
+    ) -> None:
+        """Drop the cached results of one query from memory and disk."""
+        for fetch in CACHED_FETCH_MODES:
+            self.invalidate_key(query_key(sql_query, db_config, params, fetch))
+
+    def invalidate_key(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            path = self._disk_path(key)
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            for path, _, _ in self._disk_files():
+                os.remove(path)
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and time.time() - stored_at > self.ttl
+
+    def _store(self, key: str, entry: _Entry) -> None:
+        if entry.nbytes > self.max_bytes:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while self.memory_bytes > self.max_bytes:
+            self._entries.popitem(last=False)
+
+    def _disk_path(self, key: str) -> Optional[str]:
+        if self.directory is None:
+            return None
+        return os.path.join(self.directory, f'{key}.{self.disk_format}')
+
+    def _write_disk(self, key: str, entry: _Entry) -> None:
+        if self.directory is None:
+            return
+        # Local import: the package __init__ imports this module.
+        from .helpers import convert_extension_types
+
+        # Write under a temporary name so readers never see partial files.
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        try:
+            if self.disk_format == 'arrow':
+                save_arrow(entry.df, tmp_path, compression=self.compression)
+            else:
+                convert_extension_types(entry.df).to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, self._disk_path(key))
+        except Exception:
+            # Frames Arrow can't represent stay memory-only.
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        self._evict_disk()
+
+    def _read_disk(self, key: str) -> Optional[_Entry]:
+        path = self._disk_path(key)
+        if path is None:
+            return None
+        try:
+            # mtime is when the result was stored; atime tracks use for eviction.
+            stored_at = os.stat(path).st_mtime
+        except FileNotFoundError:
+            return None
+        if self._expired(stored_at):
+            os.remove(path)
+            return None
+        try:
+            if self.disk_format == 'arrow':
+                df = _mapped_frame(read_arrow_table(path))
+            else:
+                df = pd.read_parquet(path)
+        except (OSError, ValueError, pa.ArrowException):
+            # Truncated or corrupt file: drop it and query the database again.
+            os.remove(path)
+            return None
+        os.utime(path, (time.time(), stored_at))
+        return _Entry(df=df, stored_at=stored_at, nbytes=int(df.memory_usage(deep=True).sum()))
+
+    def _disk_files(self) -> list:
+        if self.directory is None:
+            return []
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.is_file() and entry.name.endswith(f'.{self.disk_format}'):
+                stat = entry.stat()
+                files.append((entry.path, stat.st_atime, stat.st_size))
+        return files
+
+    def _evict_disk(self) -> None:
+        if self.max_disk_bytes is None:
+            return
+        files = sorted(self._disk_files(), key=lambda item: item[1])
+        total = sum(size for _, _, size in files)
+        for path, _, size in files:
+            if total <= self.max_disk_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
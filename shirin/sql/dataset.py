@@ -0,0 +1,105 @@
+"""Read saved results, touching only the columns and row groups a caller needs."""
+
+from pathlib import Path
+from typing import Any, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+import pyarrow.parquet as pq
+
+from .ipc import is_ipc_path
+from .parquet import METADATA_FILE
+
+# DNF filters as accepted by pandas/pyarrow: [(column, op, value), ...] for
+# AND, or a list of such lists for OR.
+Filters = Union[pc.Expression, List[Tuple[str, str, Any]], List[List[Tuple[str, str, Any]]]]
+
+# Partition directory values are kept as strings unless they look numeric;
+# no dictionary types, so partition columns compare like ordinary ones.
+_HIVE = ds.HivePartitioning.discover(infer_dictionary=False)
+
+
+def _has_null_fields(schema: pa.Schema) -> bool:
+    return any(pa.types.is_null(field.type) for field in schema)
+
+
+def open_result(path: Union[str, Path]) -> ds.Dataset:
+    """Open a saved result as a ``pyarrow.dataset.Dataset`` without reading data.
+
+    Handles what ``run_sql_query`` writes: single Parquet files,
+    Hive-partitioned and partition/incremental dataset directories (through
+    their ``_metadata`` summary when present) and Arrow IPC files, which
+    are memory-mapped.
+
+    Raises:
+        ValueError: If path doesn't exist.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise ValueError(f"Result not found: {path}")
+
+    if path.is_file():
+        if is_ipc_path(path):
+            return ds.dataset(str(path), format='ipc', filesystem=pafs.LocalFileSystem(use_mmap=True))
+        return ds.dataset(str(path), format='parquet')
+
+    if (path / METADATA_FILE).exists():
+        # All row-group statistics in one file: planning opens no data file.
+        return ds.parquet_dataset(str(path / METADATA_FILE), partitioning=_HIVE)
+
+    dataset = ds.dataset(str(path), format='parquet', partitioning=_HIVE)
+    if _has_null_fields(dataset.schema):
+        # The schema came from one file, where some column was all NULL;
+        # take every file's types into account.
+        schemas = [fragment.physical_schema for fragment in dataset.get_fragments()]
+        partition_fields = [field for field in dataset.schema if field.name not in schemas[0].names]
+        schema = pa.unify_schemas(schemas + [pa.schema(partition_fields)], promote_options='permissive')
+        dataset = ds.dataset(str(path), schema=schema, format='parquet', partitioning=_HIVE)
+    return dataset
+
+
+def load_result(
+    path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    filters: Optional[Filters] = None,
+    as_table: bool = False,
+) -> Union[pd.DataFrame, pa.Table]:
+    """Load a saved query result, reading only what ``columns`` and ``filters`` need.
+
+    Only the requested columns are read from disk. Filters are pushed down:
+    Hive partition directories and row groups whose min/max statistics
+    can't match are skipped without being read, so sorted or partitioned
+    results load a fraction of their size.
+
+    Args:
+        path: Parquet file, dataset directory or Arrow IPC file written by
+              ``run_sql_query``.
+        columns: Optional columns to load, including partition columns.
+        filters: Row filter as a ``pyarrow.compute`` expression (e.g.
+                 ``pc.field("year") >= 2023``) or in DNF form:
+                 ``[("year", ">=", 2023), ("region", "in", ["EU", "US"])]``,
+                 a list of such lists meaning OR.
+        as_table: Return the pyarrow Table instead of a DataFrame.
+
+    Returns:
+        DataFrame (dtypes restored as saved) or pyarrow Table.
+
+    Raises:
+        ValueError: If path doesn't exist or filters are malformed.
+
+    Examples:
+        >>> df = load_result(
+        ...     "sales/",
+        ...     columns=["region", "revenue"],
+        ...     filters=[("year", "=", 2024), ("revenue", ">", 0)],
+        ... )
+    """
+    dataset = open_result(path)
+    expression = filters
+    if filters is not None and not isinstance(filters, pc.Expression):
+        expression = pq.filters_to_expression(filters)
+    table = dataset.to_table(columns=None if columns is None else list(columns), filter=expression)
+    return table if as_table else table.to_pandas()
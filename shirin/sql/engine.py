@@ -0,0 +1,121 @@
+"""Process-wide cache of SQLAlchemy engines and their connection pools."""
+
+import hashlib
+import threading
+from typing import Any, Dict, Tuple
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import URL, Engine
+
+
+REQUIRED_KEYS = ['user', 'password', 'host', 'port', 'db_name', 'schema']
+
+POOL_DEFAULTS: Dict[str, Any] = {
+    'pool_size': 5,
+    'max_overflow': 5,
+    'pool_pre_ping': True,
+    'pool_recycle': 1800,
+    'pool_timeout': 30,
+}
+
+SET_SCHEMA_SQL = "SET SCHEMA {schema}"
+
+_engines: Dict[Tuple, Engine] = {}
+_lock = threading.Lock()
+
+
+def validate_db_config(db_config: Dict[str, Any]) -> None:
+    """Check that all connection keys are present.
+
+    Raises:
+        KeyError: If required database config keys are missing.
+    """
+    missing_keys = [key for key in REQUIRED_KEYS if key not in db_config]
+    if missing_keys:
+        raise KeyError(
+            f"Missing required database config keys: {missing_keys}"
+        )
+
+
+def connection_url(db_config: Dict[str, Any]) -> URL:
+    """Build the DB2 connection URL; credentials are escaped by SQLAlchemy."""
+    return URL.create(
+        'ibm_db_sa',
+        username=db_config['user'],
+        password=db_config['password'],
+        host=db_config['host'],
+        port=int(db_config['port']),
+        database=db_config['db_name'],
+    )
+
+
+def pool_settings(db_config: Dict[str, Any], **overrides: Any) -> Dict[str, Any]:
+    """Resolve pool settings: ``overrides``, then db_config keys, then POOL_DEFAULTS."""
+    return {
+        name: overrides.get(name, db_config.get(name, default))
+        for name, default in POOL_DEFAULTS.items()
+    }
+
+
+def _engine_key(db_config: Dict[str, Any], settings: Dict[str, Any]) -> Tuple:
+    # The password only enters the key as a digest.
+    password_digest = hashlib.sha256(str(db_config['password']).encode()).hexdigest()
+    identity = tuple(
+        str(db_config[key]) for key in REQUIRED_KEYS if key != 'password'
+    )
+    return identity + (password_digest, tuple(sorted(settings.items())))
+
+
+def get_engine(db_config: Dict[str, Any], **pool_options: Any) -> Engine:
+    """Return the shared engine for ``db_config``, creating it on first use.
+
+    Engines are cached per process, keyed by the connection settings and pool
+    settings, so repeated queries reuse pooled connections instead of
+    connecting each time. ``SET SCHEMA`` runs once per new pooled connection.
+
+    Args:
+        db_config: Database configuration dict with required keys:
+                   user, password, host, port, db_name, schema.
+                   Optional keys: pool_size, max_overflow, pool_pre_ping,
+                   pool_recycle and pool_timeout (seconds, ``None`` to
+                   wait indefinitely for a connection).
+        **pool_options: Pool settings taking precedence over db_config.
+
+    Returns:
+        SQLAlchemy Engine.
+
+    Raises:
+        KeyError: If required database config keys are missing.
+    """
+    validate_db_config(db_config)
+    settings = pool_settings(db_config, **pool_options)
+    key = _engine_key(db_config, settings)
+
+    with _lock:
+        engine = _engines.get(key)
+        if engine is None:
+            engine = create_engine(connection_url(db_config), **settings)
+            _set_schema_on_connect(engine, db_config['schema'])
+            _engines[key] = engine
+    return engine
+
+
+def _set_schema_on_connect(engine: Engine, schema: str) -> None:
+    statement = SET_SCHEMA_SQL.format(schema=schema)
+
+    @event.listens_for(engine, 'connect')
+    def set_schema(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def dispose_engines() -> None:
+    """Close all pooled connections and forget the cached engines."""
+    with _lock:
+        engines = list(_engines.values())
+        _engines.clear()
+    for engine in engines:
+        engine.dispose()
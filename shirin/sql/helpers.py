@@ -2,9 +2,19 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Union
+from typing import Any, Dict, Optional, Sequence, Union
 import pandas as pd
-from sqlalchemy import create_engine, text
+import pyarrow as pa
+
+from .arrow import (
+    DICTIONARY_MAX_RATIO,
+    batches_to_table,
+    dictionary_encode_strings,
+    iter_record_batches
+)
+from .engine import get_engine
+from .ipc import is_ipc_path, write_batches_to_arrow
+from .parquet import ParquetOptions, write_batches_to_parquet
 
 
 def load_sql_query(sql_query: Union[str, Path]) -> str:
@@ -86,7 +96,10 @@ def convert_extension_types(df: pd.DataFrame) -> pd.DataFrame:
     for col in df.columns:
         dtype = df[col].dtype
         
-        if pd.api.types.is_extension_array_dtype(dtype):
+        if isinstance(dtype, (pd.ArrowDtype, pd.CategoricalDtype)):
+            # Arrow data and categoricals (dictionaries) are written as-is.
+            df_converted[col] = df[col]
+        elif pd.api.types.is_extension_array_dtype(dtype):
             if hasattr(df[col], 'to_numpy'):
                 df_converted[col] = pd.Series(df[col].to_numpy(), index=df.index)
             else:
@@ -97,13 +110,21 @@ def convert_extension_types(df: pd.DataFrame) -> pd.DataFrame:
     return df_converted
 
 
-def execute_query(sql_query: str, db_config: Dict[str, str]) -> pd.DataFrame:
+def execute_query(
+    sql_query: str,
+    db_config: Dict[str, str],
+    params: Optional[Sequence[Any]] = None
+) -> pd.DataFrame:
     """Execute SQL query against IBM DB2 database.
     
+    Uses the shared, pooled engine for ``db_config`` (see ``get_engine``),
+    so the connection and ``SET SCHEMA`` are reused across queries.
+
     Args:
         sql_query: SQL query string.
         db_config: Database configuration dict with required keys:
                    user, password, host, port, db_name, schema.
+        params: Optional positional parameters for ``?`` placeholders.
                    
     Returns:
         DataFrame with query results.
@@ -111,21 +132,97 @@ def execute_query(sql_query: str, db_config: Dict[str, str]) -> pd.DataFrame:
     Raises:
         KeyError: If required database config keys are missing.
     """
-    required_keys = ['user', 'password', 'host', 'port', 'db_name', 'schema']
-    missing_keys = [key for key in required_keys if key not in db_config]
-    if missing_keys:
-        raise KeyError(
-            f"Missing required database config keys: {missing_keys}"
+    engine = get_engine(db_config)
+
+    with engine.connect() as connection:
+        df = pd.read_sql(
+            sql_query,
+            con=connection,
+            params=None if params is None else tuple(params)
         )
 
-    connection_string = (
-        f"ibm_db_sa://{db_config['user']}:{db_config['password']}"
-        f"@{db_config['host']}:{db_config['port']}/{db_config['db_name']}"
-    )
-    engine = create_engine(connection_string)
+    return df
+
+
+def fetch_arrow_table(
+    sql_query: str,
+    db_config: Dict[str, str],
+    params: Optional[Sequence[Any]] = None,
+    batch_size: int = 100_000,
+    dictionary_ratio: Optional[float] = DICTIONARY_MAX_RATIO
+) -> pa.Table:
+    """Execute SQL query and build a pyarrow Table straight from the cursor.
+
+    Rows are converted to Arrow record batches of ``batch_size`` as they are
+    fetched, so strings never become a column of Python objects in pandas.
+    The table can be written to Parquet with ``pyarrow.parquet.write_table``
+    without further conversion.
+
+    Args:
+        sql_query: SQL query string.
+        db_config: Database configuration dict with required keys:
+                   user, password, host, port, db_name, schema.
+        params: Optional positional parameters for ``?`` placeholders.
+        batch_size: Rows converted per record batch.
+        dictionary_ratio: Dictionary-encode string columns whose distinct
+                          values are at most this share of their values.
+                          None disables encoding.
+
+    Returns:
+        pyarrow Table with query results.
+
+    Raises:
+        KeyError: If required database config keys are missing.
+    """
+    engine = get_engine(db_config)
 
     with engine.connect() as connection:
-        connection.execute(text(f"SET SCHEMA {db_config['schema']}"))
-        df = pd.read_sql(sql_query, con=connection)
+        table = batches_to_table(iter_record_batches(connection, sql_query, batch_size, params))
+
+    if dictionary_ratio is not None:
+        table = dictionary_encode_strings(table, dictionary_ratio)
+    return table
+
+
+def stream_query_to_parquet(
+    sql_query: str,
+    db_config: Dict[str, str],
+    output_path: Union[str, Path],
+    batch_size: int = 100_000,
+    schema: Optional[pa.Schema] = None,
+    params: Optional[Sequence[Any]] = None,
+    options: Optional[ParquetOptions] = None
+) -> int:
+    """Execute SQL query and stream the result into a Parquet file.
+
+    Rows are fetched with a server-side cursor in batches of ``batch_size``
+    and each batch is appended to the file as a row group, so memory use
+    stays flat regardless of the result size. No pandas DataFrame is built.
+    Paths ending in ``.arrow``, ``.feather`` or ``.ipc`` get an uncompressed
+    Arrow IPC file instead (``options`` don't apply).
 
-    return df
+    Args:
+        sql_query: SQL query string.
+        db_config: Database configuration dict with required keys:
+                   user, password, host, port, db_name, schema.
+        output_path: Destination Parquet file.
+        batch_size: Rows fetched and written per row group.
+        schema: Optional Arrow schema fixing the types of some or all columns.
+        params: Optional positional parameters for ``?`` placeholders.
+        options: Optional ParquetOptions for layout and encoding.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        KeyError: If required database config keys are missing.
+        ValueError: If column types change between batches in a way that
+                    can't be reconciled (pass ``schema`` in that case).
+    """
+    engine = get_engine(db_config)
+
+    with engine.connect() as connection:
+        batches = iter_record_batches(connection, sql_query, batch_size, params)
+        if is_ipc_path(output_path):
+            return write_batches_to_arrow(batches, output_path, schema=schema)
+        return write_batches_to_parquet(batches, output_path, schema=schema, options=options)
@@ -0,0 +1,149 @@
+"""Append only new rows of a query to a Parquet dataset directory."""
+
+import datetime
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .parquet import remove_metadata_files, summarize_dataset
+
+# Names starting with "_" or "." are skipped by Parquet dataset readers, so
+# neither the watermark nor unfinished files show up as data.
+WATERMARK_FILE = '_watermark.json'
+INCREMENT_PREFIX = 'increment-'
+
+
+def _encode_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, datetime.datetime):
+        return {'type': 'datetime', 'value': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'type': 'date', 'value': value.isoformat()}
+    return {'type': type(value).__name__, 'value': value}
+
+
+def _decode_value(encoded: Dict[str, Any]) -> Any:
+    if encoded['type'] == 'datetime':
+        return pd.Timestamp(encoded['value']).to_pydatetime()
+    if encoded['type'] == 'date':
+        return datetime.date.fromisoformat(encoded['value'])
+    return encoded['value']
+
+
+def read_watermark(output_dir: Union[str, Path]) -> Optional[Dict[str, Any]]:
+    """State of an incremental dataset, or None before its first run.
+
+    Returns:
+        Dict with ``column``, ``value`` (highest key extracted so far) and
+        ``files`` (data files, oldest first).
+    """
+    path = Path(output_dir) / WATERMARK_FILE
+    if not path.exists():
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        state = json.load(f)
+    state['value'] = _decode_value(state['value'])
+    return state
+
+
+def _write_watermark(output_dir: Path, column: str, value: Any, files: List[str]) -> None:
+    path = output_dir / WATERMARK_FILE
+    tmp_path = output_dir / f'.{WATERMARK_FILE}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'column': column, 'value': _encode_value(value), 'files': files}, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _recover(output_dir: Path, files: List[str]) -> None:
+    # A run that stopped after recording its file but before moving it into
+    # place is finished here; files no watermark refers to are dropped.
+    for name in files:
+        hidden = output_dir / f'.{name}'
+        if not (output_dir / name).exists() and hidden.exists():
+            os.replace(hidden, output_dir / name)
+    for hidden in output_dir.glob(f'.{INCREMENT_PREFIX}*'):
+        hidden.unlink()
+
+
+def _key_column(path: Path, column: str) -> str:
+    names = pq.read_schema(path).names
+    if column in names:
+        return column
+    matches = [name for name in names if name.lower() == column.lower()]
+    if not matches:
+        raise KeyError(f"Watermark column '{column}' is not in the query result: {names}")
+    return matches[0]
+
+
+def run_incremental(
+    sql_query: str,
+    params: Optional[Sequence[Any]],
+    column: str,
+    output_dir: Union[str, Path],
+    write: Callable[[str, List[Any], Path], None],
+    summarize: bool = True,
+) -> Optional[Path]:
+    """Extract the rows of ``sql_query`` above the stored watermark.
+
+    ``write(query, params, path)`` runs the query and saves it as Parquet
+    (``run_sql_query`` passes itself with the caller's fetch options). The
+    new rows become one more file in ``output_dir``; the watermark is then
+    moved to the highest ``column`` value written. Rows whose key is NULL
+    are only picked up by the first run. Only one run per directory may
+    be in progress at a time. With ``summarize`` the dataset's ``_metadata``
+    file is rebuilt from the footers of all files after each new file;
+    without it any earlier summary is removed.
+
+    Returns:
+        Path of the new file, or None when there were no new rows.
+
+    Raises:
+        ValueError: If the dataset was built with a different column.
+        KeyError: If ``column`` is missing from the query result.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state = read_watermark(output_dir)
+    files: List[str] = []
+    base = sql_query.strip().rstrip(';')
+    params = list(params or [])
+
+    if state is not None:
+        if state['column'] != column:
+            raise ValueError(
+                f"Dataset is tracked by column '{state['column']}', not '{column}'."
+            )
+        files = state['files']
+        _recover(output_dir, files)
+        base = f"SELECT * FROM ({base}) AS incremental WHERE {column} > ?"
+        params.append(state['value'])
+
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+    name = f'{INCREMENT_PREFIX}{stamp}-{uuid.uuid4().hex[:8]}.parquet'
+    hidden = output_dir / f'.{name}'
+    try:
+        write(base, params, hidden)
+        keys = pq.read_table(hidden, columns=[_key_column(hidden, column)]).column(0)
+        if len(keys) == 0:
+            return None
+        high = pc.max(keys).as_py()
+        if state is not None and (high is None or not high > state['value']):
+            high = state['value']
+        if high is None:
+            raise ValueError(f"Column '{column}' is NULL in every row; no watermark to store.")
+        _write_watermark(output_dir, column, high, files + [name])
+        os.replace(hidden, output_dir / name)
+    finally:
+        if hidden.exists():
+            hidden.unlink()
+    if summarize:
+        summarize_dataset(output_dir, files + [name])
+    else:
+        # A summary from an earlier run wouldn't list the new file.
+        remove_metadata_files(output_dir)
+    return output_dir / name
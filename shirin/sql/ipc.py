@@ -0,0 +1,142 @@
+"""Persist results as Arrow IPC (Feather v2) files and load them memory-mapped."""
+
+import os
+from pathlib import Path
+from typing import Iterable, Optional, Sequence, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from .arrow import table_to_pandas
+from .parquet import unify_batches
+
+IPC_COMPRESSIONS = (None, 'lz4', 'zstd')
+IPC_SUFFIXES = ('.arrow', '.feather', '.ipc')
+
+
+def is_ipc_path(path: Union[str, Path]) -> bool:
+    """Whether ``path`` names an Arrow IPC file by its suffix."""
+    return Path(path).suffix.lower() in IPC_SUFFIXES
+
+
+def save_arrow(
+    data: Union[pd.DataFrame, pa.Table],
+    path: Union[str, Path],
+    compression: Optional[str] = None,
+) -> None:
+    """Write a query result as an Arrow IPC file.
+
+    Uncompressed files (the default) are loaded zero-copy by ``load_arrow``;
+    ``'lz4'`` roughly halves typical files for a fast per-column
+    decompression on load. The file is written under a temporary name and
+    moved into place once complete.
+
+    Args:
+        data: DataFrame or pyarrow Table.
+        path: Destination file, conventionally ``*.arrow`` or ``*.feather``.
+        compression: None, 'lz4' or 'zstd'.
+
+    Raises:
+        ValueError: If compression is unknown.
+    """
+    if compression not in IPC_COMPRESSIONS:
+        raise ValueError(f"Invalid compression '{compression}'. Valid options are: {IPC_COMPRESSIONS}.")
+    if isinstance(data, pd.DataFrame):
+        # Local import: helpers imports the Arrow modules this one builds on.
+        from .helpers import convert_extension_types
+
+        data = pa.Table.from_pandas(convert_extension_types(data), preserve_index=False)
+
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    options = pa.ipc.IpcWriteOptions(compression=compression)
+    try:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, data.schema, options=options) as writer:
+                writer.write_table(data)
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+
+def write_batches_to_arrow(
+    batches: Iterable[pa.RecordBatch],
+    path: Union[str, Path],
+    schema: Optional[pa.Schema] = None,
+    compression: Optional[str] = None,
+) -> int:
+    """Stream record batches into one Arrow IPC file, keeping memory flat.
+
+    Batch types are unified as for Parquet (see ``write_batches_to_parquet``).
+
+    Returns:
+        Number of rows written.
+    """
+    if compression not in IPC_COMPRESSIONS:
+        raise ValueError(f"Invalid compression '{compression}'. Valid options are: {IPC_COMPRESSIONS}.")
+    merged, tables = unify_batches(batches, schema)
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    rows = 0
+    try:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            options = pa.ipc.IpcWriteOptions(compression=compression)
+            with pa.ipc.new_file(sink, merged, options=options) as writer:
+                for table in tables:
+                    writer.write_table(table)
+                    rows += table.num_rows
+        os.replace(tmp_path, path)
+    finally:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return rows
+
+
+def read_arrow_table(path: Union[str, Path], columns: Optional[Sequence[str]] = None) -> pa.Table:
+    """Memory-map an Arrow IPC file as a pyarrow Table.
+
+    Nothing is copied for uncompressed files: columns are views on the
+    mapping and pages are read from disk only when touched. Compressed
+    files decompress just the selected ``columns``.
+
+    Raises:
+        KeyError: If a requested column is not in the file.
+    """
+    source = pa.memory_map(str(path))
+    schema = pa.ipc.open_file(source).schema
+    options = None
+    if columns is not None:
+        missing = [name for name in columns if name not in schema.names]
+        if missing:
+            raise KeyError(f"Columns not in {path}: {missing}")
+        options = pa.ipc.IpcReadOptions(included_fields=[schema.get_field_index(name) for name in columns])
+    table = pa.ipc.open_file(source, options=options).read_all()
+    if columns is not None:
+        table = table.select(list(columns))
+    return table
+
+
+def load_arrow(
+    path: Union[str, Path],
+    columns: Optional[Sequence[str]] = None,
+    as_table: bool = False,
+) -> Union[pd.DataFrame, pa.Table]:
+    """Load a result saved with ``save_arrow`` (or any Arrow IPC/Feather file).
+
+    Args:
+        path: Arrow IPC file.
+        columns: Optional subset of columns to load.
+        as_table: Return the pyarrow Table instead of a DataFrame.
+
+    Returns:
+        Arrow-backed DataFrame (``dtype_backend='pyarrow'``, dictionary
+        columns as categoricals) whose columns share the memory-mapped
+        buffers, or the Table itself.
+
+    Examples:
+        >>> run_sql_query(query, db_config, output_path=Path("extract.arrow"))
+        >>> df = load_arrow("extract.arrow", columns=["region", "revenue"])
+    """
+    table = read_arrow_table(path, columns)
+    return table if as_table else table_to_pandas(table)
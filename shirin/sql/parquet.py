@@ -0,0 +1,333 @@
+"""Write query results to Parquet."""
+
+import itertools
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+# Batches inspected for the type of columns that start out all NULL before
+# the Parquet schema is fixed.
+SCHEMA_SAMPLE_BATCHES = 10
+
+METADATA_FILE = '_metadata'
+COMMON_METADATA_FILE = '_common_metadata'
+# Written into every dataset directory shirin replaces as a whole, so a
+# rerun can tell its own earlier output from an unrelated directory.
+RESULT_MARKER_FILE = '_SUCCESS'
+
+
+def _has_null_columns(schema: pa.Schema) -> bool:
+    return any(pa.types.is_null(field.type) for field in schema)
+
+
+def _merge_schema(
+    schema: Optional[pa.Schema],
+    batch: pa.RecordBatch,
+    overrides: Optional[pa.Schema],
+) -> pa.Schema:
+    if schema is None:
+        merged = batch.schema
+    else:
+        merged = pa.unify_schemas([schema, batch.schema], promote_options='permissive')
+    for field in overrides or []:
+        index = merged.get_field_index(field.name)
+        if index != -1:
+            merged = merged.set(index, field)
+    return merged
+
+
+def _conform(batch: pa.RecordBatch, schema: pa.Schema) -> pa.Table:
+    table = pa.Table.from_batches([batch])
+    if table.schema.equals(schema):
+        return table
+    try:
+        return table.cast(schema)
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as error:
+        raise ValueError(
+            f"Query result types changed after the Parquet schema was fixed "
+            f"({error}). Pass `schema` to set the column types explicitly."
+        ) from error
+
+
+@dataclass
+class ParquetOptions:
+    """Layout and encoding of Parquet output.
+
+    Attributes:
+        partition_cols: Columns to split the output by, Hive style
+                        (``<dir>/year=2024/region=EU/part-0.parquet``). The
+                        output path is then a directory. Readers filtering
+                        on these columns skip whole directories.
+        row_group_size: Rows per row group. Smaller groups let readers skip
+                        more data using column statistics; larger ones
+                        compress better. None keeps pyarrow's default
+                        (or one row group per fetched batch when streaming).
+        compression: Codec: 'snappy', 'zstd', 'gzip', 'brotli', 'lz4' or 'none'.
+        compression_level: Codec level, e.g. 1-22 for zstd.
+        use_dictionary: Dictionary-encode all columns (True), none (False),
+                        or only the listed ones.
+        write_statistics: Store min/max statistics for all columns (True),
+                          none (False), or only the listed ones.
+        write_metadata: For directory outputs, also write ``_metadata`` (all
+                        row-group footers in one file) and
+                        ``_common_metadata`` (the schema), so readers can
+                        plan a scan without opening every file.
+    """
+    partition_cols: Optional[List[str]] = None
+    row_group_size: Optional[int] = None
+    compression: str = 'snappy'
+    compression_level: Optional[int] = None
+    use_dictionary: Union[bool, List[str]] = True
+    write_statistics: Union[bool, List[str]] = True
+    write_metadata: bool = True
+
+    def __post_init__(self):
+        if self.row_group_size is not None and self.row_group_size < 1:
+            raise ValueError("row_group_size must be at least 1.")
+
+    def writer_kwargs(self) -> Dict[str, Any]:
+        return {
+            'compression': self.compression,
+            'compression_level': self.compression_level,
+            'use_dictionary': self.use_dictionary,
+            'write_statistics': self.write_statistics,
+        }
+
+
+def unify_batches(
+    batches: Iterable[pa.RecordBatch],
+    overrides: Optional[pa.Schema] = None,
+) -> Tuple[pa.Schema, Iterator[pa.Table]]:
+    """Fix one schema for a stream of batches and cast every batch to it.
+
+    Columns that have only been NULL so far hold back the schema for up to
+    ``SCHEMA_SAMPLE_BATCHES`` batches while their type is found; types in
+    ``overrides`` win over inferred ones.
+
+    Returns:
+        The schema and an iterator of conformed single-batch tables.
+
+    Raises:
+        ValueError: If there are no batches, or a later batch can't be cast.
+    """
+    batches = iter(batches)
+    merged: Optional[pa.Schema] = None
+    pending: List[pa.RecordBatch] = []
+    for batch in batches:
+        pending.append(batch)
+        merged = _merge_schema(merged, batch, overrides)
+        if not _has_null_columns(merged) or len(pending) >= SCHEMA_SAMPLE_BATCHES:
+            break
+    if merged is None:
+        raise ValueError("No record batches to write.")
+
+    def conformed() -> Iterator[pa.Table]:
+        for batch in itertools.chain(pending, batches):
+            yield _conform(batch, merged)
+        pending.clear()
+
+    return merged, conformed()
+
+
+def replace_directory(tmp_dir: Path, output_dir: Path) -> None:
+    """Mark a fully written dataset directory as a result and move it into place.
+
+    ``output_dir`` is removed first if it holds an earlier result.
+
+    Raises:
+        ValueError: If output_dir is a non-empty directory that isn't one.
+    """
+    (tmp_dir / RESULT_MARKER_FILE).touch()
+    if output_dir.is_file():
+        output_dir.unlink()
+    elif output_dir.exists():
+        is_result = any((output_dir / name).exists() for name in (RESULT_MARKER_FILE, COMMON_METADATA_FILE))
+        if any(output_dir.iterdir()) and not is_result:
+            raise ValueError(
+                f"{output_dir} exists and is not a partitioned result; "
+                f"remove it or choose another output path."
+            )
+        shutil.rmtree(output_dir)
+    os.replace(tmp_dir, output_dir)
+
+
+def remove_metadata_files(root: Union[str, Path]) -> None:
+    """Delete ``_metadata``/``_common_metadata``, e.g. once they no longer match the files."""
+    for name in (METADATA_FILE, COMMON_METADATA_FILE):
+        (Path(root) / name).unlink(missing_ok=True)
+
+
+def write_metadata_files(root: Union[str, Path], metadata: List[pq.FileMetaData]) -> bool:
+    """Write ``_metadata`` and ``_common_metadata`` summarizing a dataset.
+
+    Args:
+        root: Dataset directory.
+        metadata: Footers of the data files, each with its path relative to
+                  ``root`` set (``FileMetaData.set_file_path``).
+
+    Returns:
+        False (and nothing written, stale summaries removed) when the files
+        don't share one schema.
+    """
+    root = Path(root)
+    remove_metadata_files(root)
+    if not metadata:
+        return False
+    summary = metadata[0]
+    try:
+        for item in metadata[1:]:
+            summary.append_row_groups(item)
+    except RuntimeError:
+        return False
+    summary.write_metadata_file(root / METADATA_FILE)
+    pq.write_metadata(summary.schema.to_arrow_schema(), root / COMMON_METADATA_FILE)
+    return True
+
+
+def summarize_dataset(root: Union[str, Path], files: Iterable[str]) -> bool:
+    """Write the ``_metadata`` summary for existing files of a dataset.
+
+    Only the footers of ``files`` (paths relative to ``root``) are read.
+    See ``write_metadata_files`` for the return value.
+    """
+    root = Path(root)
+    metadata = []
+    for name in files:
+        footer = pq.read_metadata(root / name)
+        footer.set_file_path(name)
+        metadata.append(footer)
+    return write_metadata_files(root, metadata)
+
+
+def _write_dataset(
+    schema: pa.Schema,
+    tables: Iterator[pa.Table],
+    output_dir: Path,
+    options: ParquetOptions,
+) -> None:
+    tmp_dir = output_dir.with_name(f".{output_dir.name}.tmp")
+    if tmp_dir.exists():
+        shutil.rmtree(tmp_dir)
+    collected: List[pq.FileMetaData] = []
+
+    def visit(written_file) -> None:
+        metadata = written_file.metadata
+        metadata.set_file_path(Path(written_file.path).relative_to(tmp_dir).as_posix())
+        collected.append(metadata)
+
+    partitioning = ds.partitioning(
+        pa.schema([schema.field(name) for name in options.partition_cols]), flavor='hive'
+    )
+    reader = pa.RecordBatchReader.from_batches(
+        schema, (batch for table in tables for batch in table.to_batches())
+    )
+    group_size = {}
+    if options.row_group_size is not None:
+        group_size = {
+            'min_rows_per_group': options.row_group_size,
+            'max_rows_per_group': options.row_group_size,
+        }
+    try:
+        ds.write_dataset(
+            reader,
+            tmp_dir,
+            format='parquet',
+            partitioning=partitioning,
+            file_options=ds.ParquetFileFormat().make_write_options(**options.writer_kwargs()),
+            basename_template='part-{i}.parquet',
+            file_visitor=visit,
+            existing_data_behavior='overwrite_or_ignore',
+            **group_size,
+        )
+        if options.write_metadata:
+            write_metadata_files(tmp_dir, collected)
+        replace_directory(tmp_dir, output_dir)
+    finally:
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+
+
+def write_table_to_parquet(
+    table: pa.Table,
+    output_path: Union[str, Path],
+    options: Optional[ParquetOptions] = None,
+) -> None:
+    """Write an in-memory table with ``options`` (see ``ParquetOptions``)."""
+    options = options or ParquetOptions()
+    output_path = Path(output_path)
+    if options.partition_cols:
+        _write_dataset(table.schema, iter([table]), output_path, options)
+        return
+    pq.write_table(table, output_path, row_group_size=options.row_group_size, **options.writer_kwargs())
+
+
+def write_batches_to_parquet(
+    batches: Iterable[pa.RecordBatch],
+    output_path: Union[str, Path],
+    schema: Optional[pa.Schema] = None,
+    options: Optional[ParquetOptions] = None,
+) -> int:
+    """Stream record batches into one Parquet file, one row group per batch.
+
+    Only the current batch is held in memory, except while the types of
+    columns that have only been NULL so far are still unknown: up to
+    ``SCHEMA_SAMPLE_BATCHES`` batches are buffered to find them. Later batches
+    are cast to the resulting schema, so e.g. integer columns that turn out
+    to hold decimals become doubles. The output is written under a temporary
+    name and moved into place once complete.
+
+    With ``options.partition_cols`` the output is a Hive-partitioned
+    directory instead; ``options.row_group_size`` then sets the row-group
+    size exactly, otherwise it caps batches that are larger.
+
+    Args:
+        batches: Record batches sharing the same column names and order.
+        output_path: Destination Parquet file (or directory, when partitioned).
+        schema: Optional Arrow schema with types for some or all columns,
+                taking precedence over the inferred ones.
+        options: Optional ParquetOptions for layout and encoding.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If a later batch can't be cast to the fixed schema.
+    """
+    options = options or ParquetOptions()
+    output_path = Path(output_path)
+    merged, tables = unify_batches(batches, schema)
+    rows = 0
+
+    def counted() -> Iterator[pa.Table]:
+        nonlocal rows
+        for table in tables:
+            rows += table.num_rows
+            yield table
+
+    if options.partition_cols:
+        _write_dataset(merged, counted(), output_path, options)
+        return rows
+
+    tmp_path = output_path.with_name(f".{output_path.name}.tmp")
+    writer: Optional[pq.ParquetWriter] = None
+    try:
+        writer = pq.ParquetWriter(tmp_path, merged, **options.writer_kwargs())
+        for table in counted():
+            if table.num_rows:
+                writer.write_table(table, row_group_size=options.row_group_size)
+        writer.close()
+        writer = None
+        os.replace(tmp_path, output_path)
+    finally:
+        if writer is not None:
+            writer.close()
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return rows
@@ -0,0 +1,162 @@
+"""Split one query into key ranges that are extracted in parallel."""
+
+import datetime
+import numbers
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+
+from .arrow import concat_tables, table_to_pandas
+from .batch import run_sql_queries
+from .parquet import ParquetOptions, replace_directory, summarize_dataset
+
+Bound = Union[int, float, datetime.date, datetime.datetime, pd.Timestamp]
+
+PART_PREFIX = 'part-'
+
+
+@dataclass
+class PartitionSpec:
+    """How ``run_sql_query`` splits a query into range partitions.
+
+    The key range [``lower``, ``upper``) is cut into ``num_partitions``
+    equal-width ranges. Bounds only decide where the cuts are: the first
+    partition also takes rows below ``lower`` and NULL keys, the last one
+    rows from ``upper`` on, so no row is lost when the bounds are off.
+
+    Attributes:
+        column: Numeric or date/timestamp column of the query result to
+                split on, inserted into SQL as-is.
+        lower: Lowest expected key value.
+        upper: Highest expected key value.
+        num_partitions: Number of range subqueries.
+        max_workers: Subqueries run at the same time; this is also the cap
+                     on open connections.
+    """
+    column: str
+    lower: Bound
+    upper: Bound
+    num_partitions: int
+    max_workers: int = 4
+
+    def __post_init__(self):
+        if self.num_partitions < 1:
+            raise ValueError("num_partitions must be at least 1.")
+        if not self.upper > self.lower:
+            raise ValueError("upper must be greater than lower.")
+
+
+def partition_bounds(spec: PartitionSpec) -> List[Bound]:
+    """Inner cut points between partitions, ascending and without repeats.
+
+    Integer keys are cut at integers and dates at whole days, so fewer than
+    ``num_partitions - 1`` points come back for narrow ranges.
+    """
+    span = spec.upper - spec.lower
+    cuts = []
+    for index in range(1, spec.num_partitions):
+        if isinstance(span, numbers.Integral):
+            cut = spec.lower + span * index // spec.num_partitions
+        else:
+            cut = spec.lower + span * index / spec.num_partitions
+        if not cuts or cut > cuts[-1]:
+            cuts.append(cut)
+    return cuts
+
+
+def partition_queries(
+    sql_query: str,
+    spec: PartitionSpec,
+    params: Optional[Sequence[Any]] = None,
+) -> List[Tuple[str, List[Any]]]:
+    """Range-predicated subqueries covering every row of ``sql_query``.
+
+    Returns:
+        List of (SQL, parameters); the query's own ``params`` come first,
+        followed by the range bounds.
+    """
+    base = sql_query.strip().rstrip(';')
+    params = list(params or [])
+    cuts = partition_bounds(spec)
+    if not cuts:
+        return [(base, params)]
+
+    column = spec.column
+    ranges = [(f"{column} < ? OR {column} IS NULL", [cuts[0]])]
+    ranges += [(f"{column} >= ? AND {column} < ?", [low, high]) for low, high in zip(cuts, cuts[1:])]
+    ranges.append((f"{column} >= ?", [cuts[-1]]))
+    return [
+        (f"SELECT * FROM ({base}) AS partitioned WHERE {predicate}", params + bounds)
+        for predicate, bounds in ranges
+    ]
+
+
+def run_partitioned(
+    sql_query: str,
+    db_config: Dict[str, str],
+    spec: PartitionSpec,
+    output_dir: Optional[Union[str, Path]] = None,
+    params: Optional[Sequence[Any]] = None,
+    batch_size: Optional[int] = None,
+    fetch: str = 'pandas',
+    parquet: Optional[ParquetOptions] = None,
+) -> Union[pd.DataFrame, pa.Table, None]:
+    """Run the partitions of ``sql_query`` concurrently; see ``run_sql_query``.
+
+    With ``output_dir`` each partition is written to
+    ``<output_dir>/part-NNNNN.parquet`` and, unless ``parquet.write_metadata``
+    is off, summarized in ``_metadata``; otherwise the partitions are
+    concatenated in memory. Files are written to a temporary sibling
+    directory that replaces ``output_dir`` only once every partition has
+    succeeded, so a failed run leaves an earlier result untouched.
+
+    Raises:
+        RuntimeError: If any partition fails.
+        ValueError: If output_dir is a non-empty directory that doesn't
+                    hold an earlier result.
+    """
+    subqueries = partition_queries(sql_query, spec, params)
+    names = [f"{PART_PREFIX}{index:05d}" for index in range(len(subqueries))]
+    tmp_dir = None
+    if output_dir is not None:
+        output_dir = Path(output_dir)
+        tmp_dir = output_dir.with_name(f".{output_dir.name}.tmp")
+        if tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+
+    try:
+        results = run_sql_queries(
+            {name: query for name, (query, _) in zip(names, subqueries)},
+            db_config,
+            max_workers=spec.max_workers,
+            output_dir=tmp_dir,
+            batch_size=batch_size,
+            params={name: bounds for name, (_, bounds) in zip(names, subqueries)},
+            fetch='table' if fetch == 'arrow' else fetch,
+            parquet=parquet,
+        )
+
+        failed = [result for result in results.values() if not result.ok]
+        if failed:
+            raise RuntimeError(
+                f"{len(failed)} of {len(results)} partitions failed; first error:\n{failed[0].error}"
+            )
+
+        if tmp_dir is not None:
+            if parquet is None or parquet.write_metadata:
+                summarize_dataset(tmp_dir, [f"{name}.parquet" for name in names])
+            replace_directory(tmp_dir, output_dir)
+            return None
+    finally:
+        if tmp_dir is not None and tmp_dir.exists():
+            shutil.rmtree(tmp_dir)
+
+    parts = [result.data for result in results.values()]
+    if fetch == 'pandas':
+        return pd.concat(parts, ignore_index=True)
+    table = concat_tables(parts)
+    return table if fetch == 'table' else table_to_pandas(table)
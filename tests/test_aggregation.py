@@ -0,0 +1,56 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot.common.aggregation import COUNT_COLUMN, aggregate_counts
+from shirin.plot.common.data_filtering import filter_top_n_categories
+from shirin.plot.core import CountPlotOptions, create_plot
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _events() -> pd.DataFrame:
+    return pd.DataFrame({
+        'category': ['b', 'a', 'b', 'c', 'b', 'a'],
+        'group': ['x', 'y', 'x', 'x', 'y', 'y'],
+    })
+
+
+def test_aggregate_counts_keeps_first_appearance_order():
+    counts = aggregate_counts(_events(), 'category')
+
+    assert counts['category'].tolist() == ['b', 'a', 'c']
+    assert counts[COUNT_COLUMN].tolist() == [3, 2, 1]
+
+
+def test_aggregate_counts_with_hue():
+    counts = aggregate_counts(_events(), 'category', 'group')
+    result = counts.set_index(['category', 'group'])[COUNT_COLUMN].to_dict()
+
+    assert result == {('b', 'x'): 2, ('b', 'y'): 1, ('a', 'y'): 2, ('c', 'x'): 1}
+
+
+def test_filter_top_n_on_aggregate_matches_row_level():
+    df = _events()
+    counts = aggregate_counts(df, 'category', 'group')
+
+    from_rows = filter_top_n_categories(df, 'category', 2)
+    from_counts = filter_top_n_categories(counts, 'category', 2, value_column=COUNT_COLUMN)
+
+    assert set(from_rows['category']) == set(from_counts['category']) == {'a', 'b'}
+
+
+def test_countplot_draws_bars_from_aggregate():
+    options = CountPlotOptions(df=_events(), axis_column='category', top_n=2)
+    plot = create_plot('count', options)
+    plot.render()
+
+    assert len(plot._counts) == 2
+    heights = [patch.get_height() for patch in plot.plot_object.patches]
+    assert heights == [3, 2]
+    tick_labels = [tick.get_text() for tick in plot.plot_object.get_xticklabels()]
+    assert tick_labels == ['b', 'a']
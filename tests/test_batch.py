@@ -0,0 +1,100 @@
+import os
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot import PlotGraphs
+from shirin.plot.batch import unique_output_names
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _events() -> pd.DataFrame:
+    return pd.DataFrame({
+        'category': ['b', 'a', 'b', 'c', 'b', 'a'],
+        'value': [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+        'date': pd.date_range('2024-01-01', periods=6, freq='D'),
+    })
+
+
+def test_unique_output_names_suffixes_repeats_in_order():
+    assert unique_output_names(['a', 'b', 'a', 'a_2', 'a']) == ['a', 'b', 'a_3', 'a_2', 'a_4']
+
+
+@pytest.mark.parametrize('max_workers, executor', [(1, 'process'), (2, 'process'), (2, 'thread')])
+def test_batch_exports_every_plot_and_reports_failures(tmp_path, max_workers, executor):
+    graphs = PlotGraphs(export=True, output_dir=str(tmp_path), prefix='report')
+
+    with graphs.batch(max_workers=max_workers, executor=executor) as batch:
+        graphs.countplot_x(_events(), x='category')
+        graphs.countplot_x(_events(), x='category')
+        graphs.countplot_x(_events(), x='missing', output_name='broken')
+        graphs.timeplot(_events(), x='date', output_name='events')
+
+    assert [result.output_name for result in batch.results] == [
+        'countplot_x', 'countplot_x_2', 'broken', 'events'
+    ]
+    assert [result.output_name for result in batch.errors] == ['broken']
+    assert 'KeyError' in batch.errors[0].error
+    assert sorted(os.listdir(tmp_path)) == [
+        'report_countplot_x.png', 'report_countplot_x_2.png', 'report_events.png'
+    ]
+    assert batch.results[0].path == os.path.join(str(tmp_path), 'report_countplot_x.png')
+    assert plt.get_fignums() == []
+
+
+def test_render_many_dispatches_to_plot_methods(tmp_path):
+    graphs = PlotGraphs(export=True, output_dir=str(tmp_path), instrument=True)
+
+    results = graphs.render_many([
+        {'plot': 'countplot_y', 'df': _events(), 'y': 'category', 'output_name': 'counts'},
+        {'plot': 'barplot_x', 'df': _events(), 'x': 'category', 'value': 'value', 'output_name': 'values'},
+    ], max_workers=1)
+
+    assert all(result.ok for result in results)
+    assert sorted(os.listdir(tmp_path)) == ['counts.png', 'values.png']
+    assert [stats.name for stats in graphs.render_stats] == ['counts', 'values']
+
+
+def test_shared_frame_loads_only_requested_columns(tmp_path):
+    from shirin.plot.shared_frame import publish_frame
+
+    df = _events().set_index('category')
+    frame = publish_frame(df, str(tmp_path))
+    loaded = frame.load(['value'])
+
+    assert loaded.columns.tolist() == ['value']
+    assert frame.load(['missing']).columns.tolist() == df.columns.tolist()
+    assert loaded.index.tolist() == df.index.tolist()
+    assert not loaded['value'].to_numpy().flags.writeable  # view on the mapped file
+
+
+@pytest.mark.parametrize('missing, label', [(None, 'None'), (float('nan'), 'nan')])
+def test_shared_frame_labels_match_serial_rendering(tmp_path, missing, label):
+    from shirin.plot.core import CountPlotOptions, create_plot
+    from shirin.plot.core.renderer import AggRenderer
+    from shirin.plot.shared_frame import publish_frame
+
+    df = pd.DataFrame({'category': ['a', missing, 'b', 'a'], 'value': [1.0, 2.0, 3.0, 4.0]})
+    frame = publish_frame(df, str(tmp_path))
+
+    def labels(data):
+        plot = create_plot('count', CountPlotOptions(df=data, axis_column='category'), AggRenderer())
+        plot.render()
+        return [tick.get_text() for tick in plot.plot_object.get_xticklabels()]
+
+    assert labels(frame.load(['category'])) == labels(df)
+    assert label in labels(df)
+
+
+def test_shared_frame_falls_back_for_mixed_nulls(tmp_path):
+    from shirin.plot.shared_frame import publish_frame
+
+    df = pd.DataFrame({'category': ['a', None, float('nan')]})
+
+    assert publish_frame(df, str(tmp_path)) is None
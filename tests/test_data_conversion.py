@@ -1,7 +1,17 @@
 """
 Tests for data conversion utilities, specifically boolean label_map fix
 """
-from shirin.plot.common.data_conversion import convert_dict_keys_to_string
+import numpy as np
+import pandas as pd
+import pytest
+
+from shirin.plot.common.data_conversion import (
+    convert_dict_keys_to_string,
+    ensure_column_is_categorical,
+    ensure_column_is_string,
+    project_columns,
+)
+from shirin.plot.core import CountPlotOptions, create_plot
 
 
 def test_convert_dict_keys_boolean():
@@ -79,3 +89,70 @@ def test_convert_dict_keys_mixed():
     assert "key" in converted, "String key should remain"
     assert "2.5" in converted, "Float key should be converted"
     assert converted["True"] == "Boolean True", "Values should be preserved"
+
+
+
+def test_project_columns_keeps_only_requested_columns():
+    """Test that projection drops unused columns and de-duplicates names"""
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": [5, 6]})
+
+    projected = project_columns(df, ["b", "a", "b"])
+
+    assert projected.columns.tolist() == ["b", "a"]
+    assert df.columns.tolist() == ["a", "b", "c"], "Input frame must be untouched"
+
+
+def test_ensure_column_is_string_leaves_input_untouched():
+    """Test that conversion does not write into the caller's frame"""
+    df = pd.DataFrame({"a": [1, 2], "b": [3, 4]})
+
+    converted = ensure_column_is_string(df, "a")
+
+    assert converted["a"].tolist() == ["1", "2"]
+    assert df["a"].tolist() == [1, 2], "Original column should keep its dtype"
+
+
+def test_countplot_preprocess_projects_used_columns():
+    """Test that the plot pipeline only carries the columns it reads"""
+    df = pd.DataFrame({
+        "category": ["a", "b", "a"],
+        "group": ["x", "y", "x"],
+        "unused": [0.1, 0.2, 0.3],
+    })
+    options = CountPlotOptions(df=df, axis_column="category", hue="group")
+    plot = create_plot("count", options)
+
+    preprocessed = plot.preprocess()
+
+    assert preprocessed.columns.tolist() == ["category", "group"]
+    assert "unused" in df.columns
+
+
+
+@pytest.mark.parametrize("values", [
+    [True, False, True],
+    [1, 20, 3, 1],
+    [1.0, np.nan, 2.5],
+    ["a", None, "b", np.nan, "a"],
+    [1, "1", 2.0, "x"],
+    pd.to_datetime(["2020-01-01", None, "2021-05-03"]),
+])
+def test_ensure_column_is_categorical_matches_string_labels(values):
+    """Test that categorical labels are exactly what astype(str) produces"""
+    df = pd.DataFrame({"col": values})
+    expected = df["col"].astype(str)
+
+    encoded = ensure_column_is_categorical(df, "col")["col"]
+
+    assert encoded.astype(object).tolist() == expected.tolist()
+    assert list(encoded.cat.categories) == list(pd.unique(expected))
+
+
+def test_ensure_column_is_categorical_keys_match_converted_palette():
+    """Test that boolean data lines up with string-normalized palette keys"""
+    df = pd.DataFrame({"flag": [True, False, True]})
+    palette = convert_dict_keys_to_string({True: "#00FF00", False: "#FF0000"})
+
+    encoded = ensure_column_is_categorical(df, "flag")["flag"]
+
+    assert set(encoded.cat.categories) == set(palette)
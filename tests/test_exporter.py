@@ -0,0 +1,191 @@
+import os
+import threading
+import time
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot import PlotGraphs
+from shirin.plot.core import ExportError, PlotExporter
+from shirin.plot.core.renderer import AggRenderer
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _figure():
+    figure = AggRenderer().create_figure((2, 2))
+    figure.add_subplot().plot([0, 1], [0, 1])
+    return figure
+
+
+def test_background_export_writes_files_on_flush(tmp_path):
+    exporter = PlotExporter(output_dir=str(tmp_path), auto_show=False, background=True)
+    released = []
+
+    with exporter:
+        for name in ('a', 'b', 'c'):
+            exporter.export_only(name, _figure(), on_complete=lambda name=name: released.append(name))
+
+    assert sorted(os.listdir(tmp_path)) == ['a.png', 'b.png', 'c.png']
+    assert sorted(released) == ['a', 'b', 'c']
+
+
+def test_background_export_surfaces_errors_on_flush(tmp_path):
+    exporter = PlotExporter(output_dir=str(tmp_path), auto_show=False, background=True)
+    exporter.export_only('ok', _figure())
+    exporter.export_only('missing_dir/broken', _figure())
+
+    with pytest.raises(ExportError) as excinfo:
+        exporter.flush()
+
+    assert [os.path.basename(path) for path, _ in excinfo.value.failures] == ['broken.png']
+    assert os.path.exists(tmp_path / 'ok.png')
+    exporter.flush()  # failures are reported once
+
+
+def test_background_export_applies_backpressure(tmp_path, monkeypatch):
+    exporter = PlotExporter(output_dir=str(tmp_path), auto_show=False, background=True,
+                            max_workers=1, max_pending=1)
+    gate = threading.Event()
+    monkeypatch.setattr(exporter, '_save', lambda figure, filepath: gate.wait(5))
+
+    exporter.export_only('first', _figure())
+    blocked = threading.Thread(target=exporter.export_only, args=('second', _figure()))
+    blocked.start()
+    time.sleep(0.1)
+    assert blocked.is_alive()
+
+    gate.set()
+    blocked.join(5)
+    assert not blocked.is_alive()
+    exporter.close()
+
+
+def test_plot_graphs_background_export(tmp_path, monkeypatch):
+    from shirin.plot.core import exporter as exporter_module
+
+    displayed = []
+    monkeypatch.setattr(exporter_module, '_notebook_display', lambda: displayed.append)
+    registered = []
+    monkeypatch.setattr(plt, 'show', lambda *args, **kwargs: registered.append(plt.get_fignums()))
+    df = pd.DataFrame({'category': ['a', 'b', 'a']})
+    with PlotGraphs(export=True, output_dir=str(tmp_path), background_export=True) as graphs:
+        graphs.countplot_x(df, x='category', output_name='first')
+        graphs.countplot_y(df, y='category', output_name='second')
+        # Export threads only ever see figures pyplot doesn't track.
+        assert plt.get_fignums() == []
+
+    assert sorted(os.listdir(tmp_path)) == ['first.png', 'second.png']
+    assert [image.data[:4] for image in displayed] == [b'\x89PNG'] * 2
+    assert registered == []
+
+
+@pytest.mark.parametrize('format, magic', [('png', b'\x89PNG'), ('svg', b'<?xml'), ('pdf', b'%PDF')])
+def test_to_bytes_encodes_without_touching_disk(tmp_path, format, magic):
+    exporter = PlotExporter(enabled=False, output_dir=str(tmp_path / 'unused'), auto_show=False)
+
+    data = exporter.to_bytes(_figure(), format=format)
+
+    assert data.startswith(magic)
+    assert not (tmp_path / 'unused').exists()
+
+
+def test_to_bytes_rejects_unknown_format():
+    with pytest.raises(ValueError, match='Unsupported format'):
+        PlotExporter(enabled=False).to_bytes(_figure(), format='gif')
+
+
+def test_to_rgba_buffer_is_a_view_on_the_canvas():
+    figure = _figure()
+
+    pixels = PlotExporter.to_rgba_buffer(figure)
+
+    assert pixels.shape == (200, 200, 4)
+    assert pixels.dtype == 'uint8'
+    assert pixels.base is not None
+    assert (pixels[..., 3] == 255).all()
+
+
+def test_multiple_formats_share_one_layout_pass(tmp_path, monkeypatch):
+    exporter = PlotExporter(output_dir=str(tmp_path), format=['png', 'SVG', 'png'], auto_show=False)
+    figure = _figure()
+    layouts = []
+    original = figure.draw_without_rendering
+    monkeypatch.setattr(figure, 'draw_without_rendering', lambda: layouts.append(1) or original())
+    saved = []
+
+    path = exporter.export_only('chart', figure, on_saved=saved.append)
+
+    assert exporter.formats == ['png', 'svg']
+    assert path == str(tmp_path / 'chart.png')
+    assert sorted(os.listdir(tmp_path)) == ['chart.png', 'chart.svg']
+    assert [os.path.basename(path) for path in saved] == ['chart.png', 'chart.svg']
+    assert len(layouts) == 1
+
+
+def test_notebook_display_reuses_exported_png(tmp_path, monkeypatch):
+    from shirin.plot.core import exporter as exporter_module
+
+    displayed = []
+    monkeypatch.setattr(exporter_module, '_notebook_display', lambda: displayed.append)
+    exporter = PlotExporter(output_dir=str(tmp_path), format=['svg', 'png'])
+    figure = _figure()
+    closed = []
+
+    exporter.export_and_show('chart', figure, on_complete=lambda: closed.append(figure))
+
+    [image] = displayed
+    assert image.data == (tmp_path / 'chart.png').read_bytes()
+    assert image.width == pytest.approx(2 * figure.dpi, abs=10)  # on-screen size, not 300 dpi
+    assert closed == [figure]
+
+
+def test_notebook_display_without_export_encodes_once(tmp_path, monkeypatch):
+    from shirin.plot.core import exporter as exporter_module
+
+    displayed = []
+    monkeypatch.setattr(exporter_module, '_notebook_display', lambda: displayed.append)
+    exporter = PlotExporter(enabled=False, output_dir=str(tmp_path / 'unused'))
+
+    assert exporter.export_and_show('chart', _figure(), on_complete=lambda: None) is None
+    [image] = displayed
+    assert image.data.startswith(b'\x89PNG')
+    assert not (tmp_path / 'unused').exists()
+
+
+@pytest.mark.parametrize('layout, draws', [('tight', 2), ('fast', 1)])
+def test_fast_layout_draws_each_export_once(tmp_path, layout, draws):
+    exporter = PlotExporter(output_dir=str(tmp_path), auto_show=False, layout=layout)
+    figure = _figure()
+    calls = []
+    draw = figure.draw
+    figure.draw = lambda renderer: calls.append(1) or draw(renderer)
+
+    exporter.export_only('chart', figure)
+
+    assert len(calls) == draws
+    assert (tmp_path / 'chart.png').read_bytes().startswith(b'\x89PNG')
+
+
+def test_fast_layout_skips_timeplot_tight_layout(tmp_path, monkeypatch):
+    from matplotlib.figure import Figure
+
+    calls = []
+    monkeypatch.setattr(Figure, 'tight_layout', lambda self, *args, **kwargs: calls.append(self))
+    df = pd.DataFrame({'date': pd.date_range('2024-01-01', periods=60, freq='D')})
+    graphs = PlotGraphs(export=True, output_dir=str(tmp_path), export_layout='fast')
+
+    graphs.timeplot(df, x='date', group_by='month', output_name='events')
+
+    assert calls == []
+    assert os.path.exists(tmp_path / 'events.png')
+
+
+def test_unknown_layout_is_rejected():
+    with pytest.raises(ValueError, match='Invalid layout'):
+        PlotExporter(enabled=False, layout='snug')
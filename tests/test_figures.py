@@ -0,0 +1,91 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot import FigurePool, PlotGraphs
+from shirin.plot.core import CountPlotOptions, SeabornRenderer, create_plot
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _events() -> pd.DataFrame:
+    return pd.DataFrame({
+        'category': ['b', 'a', 'b', 'c', 'b', 'a'],
+        'group': ['x', 'y', 'x', 'x', 'y', 'y'],
+    })
+
+
+def test_pool_reuses_released_figures_of_the_same_size():
+    pool = FigurePool(max_figures=1)
+    first = pool.acquire((4, 3))
+    first.subplots_adjust(bottom=0.4)
+    pool.release(first)
+
+    assert plt.get_fignums() == []
+    assert pool.acquire((6, 3)) is not first
+    reused = pool.acquire((4, 3))
+    assert reused is first
+    assert plt.gcf() is first
+    assert reused.subplotpars.bottom == plt.rcParams['figure.subplot.bottom']
+
+
+def test_pool_closes_figures_beyond_its_size():
+    pool = FigurePool(max_figures=1)
+    pool.release(pool.acquire((4, 3)))
+    pool.release(pool.acquire((5, 3)))
+
+    assert len(pool) == 1
+
+
+def test_plot_close_releases_figure_and_intermediates():
+    plot = create_plot(
+        'count',
+        CountPlotOptions(df=_events(), axis_column='category', hue='group', stacked=True,
+                         palette={'x': '#000000', 'y': '#cccccc'}),
+    )
+    plot.render()
+    assert plot.figure is not None and plot._df_unlabeled is not None
+
+    plot.close()
+
+    assert plt.get_fignums() == []
+    assert plot.figure is None
+    assert plot._preprocessed_df is None and plot._counts is None and plot._df_unlabeled is None
+
+
+def test_pooled_render_matches_fresh_render():
+    fresh = create_plot('count', CountPlotOptions(df=_events(), axis_column='category'))
+    fresh.render()
+    expected = [patch.get_height() for patch in fresh.plot_object.patches]
+    fresh.close()
+
+    renderer = SeabornRenderer(figure_pool=FigurePool())
+    for _ in range(2):
+        plot = create_plot('count', CountPlotOptions(df=_events(), axis_column='category'), renderer)
+        plot.render()
+        assert [patch.get_height() for patch in plot.plot_object.patches] == expected
+        assert len(plot.figure.axes) == 1
+        plot.close()
+
+
+def test_plot_graphs_does_not_leave_figures_open():
+    graphs = PlotGraphs(figure_pool=FigurePool())
+    for _ in range(3):
+        graphs.countplot_x(_events(), x='category')
+
+    assert plt.get_fignums() == []
+    assert graphs.last_plot is None
+
+
+def test_plot_graphs_keep_plots_holds_only_the_latest():
+    graphs = PlotGraphs(keep_plots=True)
+    graphs.countplot_x(_events(), x='category')
+    graphs.countplot_y(_events(), y='category')
+
+    assert len(plt.get_fignums()) == 1
+    assert graphs.last_plot.figure is plt.gcf()
+    assert graphs.last_plot._counts is not None
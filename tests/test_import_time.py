@@ -0,0 +1,78 @@
+import subprocess
+import sys
+import textwrap
+
+
+HEAVY_MODULES = ('pandas', 'matplotlib', 'matplotlib.pyplot', 'seaborn', 'shirin.plot.plots.countplot')
+
+
+def _loaded_after(code: str) -> set:
+    """Run ``code`` in a fresh interpreter and return which HEAVY_MODULES it imported."""
+    script = textwrap.dedent(code) + textwrap.dedent(f"""
+        import sys
+        print(','.join(name for name in {HEAVY_MODULES!r} if name in sys.modules))
+    """)
+    result = subprocess.run([sys.executable, '-c', script], capture_output=True, text=True, check=True)
+    return set(filter(None, result.stdout.strip().split(',')))
+
+
+def test_importing_shirin_plot_does_no_work():
+    assert _loaded_after('import shirin.plot') == set()
+
+
+def test_plot_graphs_defers_seaborn_pyplot_and_plot_modules():
+    assert _loaded_after('from shirin.plot import PlotGraphs') == {'pandas', 'matplotlib'}
+
+
+def test_style_is_applied_when_plotting_starts():
+    script = """
+        import matplotlib as mpl
+        from shirin.plot import PlotGraphs
+        from shirin.plot.config import FontSizes
+
+        before = mpl.rcParams['legend.fontsize']
+        PlotGraphs()
+        assert before != FontSizes.LEGEND == mpl.rcParams['legend.fontsize']
+    """
+    assert 'seaborn' not in _loaded_after(script)
+
+
+def test_rcparams_set_after_import_survive_the_style():
+    script = """
+        import matplotlib as mpl
+        import pandas as pd
+        from shirin.plot import PlotGraphs
+        from shirin.plot.config import FontSizes
+
+        mpl.rcParams['axes.titlesize'] = 31
+        PlotGraphs()
+        assert mpl.rcParams['axes.titlesize'] == 31
+        assert mpl.rcParams['xtick.labelsize'] == FontSizes.TICKS
+
+        pd.set_option('display.width', 120)
+        PlotGraphs()
+        assert pd.get_option('display.width') == 120
+    """
+    _loaded_after(script)
+
+
+def test_plot_classes_and_seaborn_load_on_first_use():
+    script = """
+        import matplotlib
+        matplotlib.use('Agg')
+        import pandas as pd
+        from shirin.plot.core import CountPlotOptions, create_plot
+
+        create_plot('count', CountPlotOptions(df=pd.DataFrame({'x': ['a']}), axis_column='x')).render()
+    """
+    assert {'seaborn', 'shirin.plot.plots.countplot'} <= _loaded_after(script)
+
+
+def test_fake_data_is_generated_on_first_access():
+    script = """
+        import shirin.assets.fake_data as fake_data
+        assert 'df' not in vars(fake_data)
+        assert len(fake_data.df_accuracy) == 3
+        assert 'df' not in vars(fake_data)
+    """
+    _loaded_after(script)
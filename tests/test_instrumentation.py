@@ -0,0 +1,84 @@
+import tracemalloc
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot import PlotGraphs
+from shirin.plot.core import CountPlotOptions, create_plot
+
+
+PIPELINE_STAGES = ['validate', 'preprocess', 'transform', 'draw', 'format_plot', 'finalize']
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _events() -> pd.DataFrame:
+    return pd.DataFrame({
+        'category': ['a', 'b', 'a', 'c', 'a', 'b'],
+        'group': ['x', 'y', 'x', 'x', 'y', 'y'],
+        'unused': range(6),
+    })
+
+
+def test_render_without_instrumentation_records_nothing():
+    plot = create_plot('count', CountPlotOptions(df=_events(), axis_column='category'))
+    plot.render()
+
+    assert plot.render_stats is None
+
+
+def test_render_records_every_stage_with_row_counts():
+    plot = create_plot('count', CountPlotOptions(df=_events(), axis_column='category', hue='group'))
+    plot.render(instrument=True)
+
+    stats = plot.render_stats
+    assert [stage.name for stage in stats.stages] == PIPELINE_STAGES
+    assert stats.plot_type == 'CountPlot'
+
+    preprocess = stats.stage('preprocess')
+    assert preprocess.rows_in == 6
+    assert preprocess.rows_out == 6
+    transform = stats.stage('transform')
+    assert transform.rows_in == 6
+    assert transform.rows_out == 4  # one row per observed category/group pair
+
+    for stage in stats.stages:
+        assert stage.wall_time >= 0
+        assert stage.peak_memory is not None
+
+
+def test_instrumentation_keeps_an_outer_tracemalloc_peak():
+    tracemalloc.start()
+    try:
+        block = bytearray(16 * 1024 ** 2)
+        del block
+        peak = tracemalloc.get_traced_memory()[1]
+
+        plot = create_plot('count', CountPlotOptions(df=_events(), axis_column='category'))
+        plot.render(instrument=True)
+
+        assert tracemalloc.is_tracing()
+        assert tracemalloc.get_traced_memory()[1] >= peak
+        assert all(stage.peak_memory is not None for stage in plot.render_stats.stages)
+    finally:
+        tracemalloc.stop()
+
+
+def test_plot_graphs_collects_stats_per_plot(tmp_path):
+    graphs = PlotGraphs(export=True, output_dir=str(tmp_path), instrument=True)
+
+    graphs.countplot_x(_events(), x='category', output_name='first')
+    graphs.countplot_y(_events(), y='category', output_name='second')
+
+    assert [stats.name for stats in graphs.render_stats] == ['first', 'second']
+    assert graphs.render_stats[0].stage('export') is not None
+
+    frame = graphs.render_stats_frame()
+    assert len(frame) == 2 * (len(PIPELINE_STAGES) + 2)
+    assert set(frame['name']) == {'first', 'second'}
+    assert frame.loc[frame['name'] == 'first', 'stage'].tolist() == PIPELINE_STAGES + ['export', 'show']
@@ -0,0 +1,81 @@
+import os
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot import PlotGraphs, RenderCache
+from shirin.plot.core import CountPlotOptions
+from shirin.plot.core.render_cache import render_key
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _events() -> pd.DataFrame:
+    return pd.DataFrame({'category': ['b', 'a', 'b', 'c'], 'unused': range(4)})
+
+
+def _key(**overrides):
+    options = dict(df=_events(), axis_column='category')
+    options.update(overrides)
+    return render_key('count', CountPlotOptions(**options), ('png', 300, 'tight'))
+
+
+def test_render_key_tracks_options_data_and_style():
+    base = _key()
+
+    assert _key() == base
+    assert _key(df=_events().assign(unused=9)) == base
+    assert _key(xlabel='Category') != base
+    assert _key(df=_events().assign(category='z')) != base
+    with plt.rc_context({'font.size': 31}):
+        assert _key() != base
+
+
+def test_render_key_ignores_interactive_rcparams():
+    base = _key()
+    backend = plt.rcParams['backend']
+    try:
+        with plt.rc_context({'backend': 'svg', 'interactive': True, 'keymap.save': ['w']}):
+            assert _key() == base
+    finally:
+        plt.rcParams['backend'] = backend
+
+
+def test_plot_graphs_copies_cached_chart_instead_of_rendering(tmp_path, monkeypatch):
+    cache = RenderCache(str(tmp_path / 'cache'))
+    first = PlotGraphs(export=True, output_dir=str(tmp_path / 'first'), render_cache=cache)
+    first.countplot_x(_events(), x='category', output_name='counts')
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    import shirin.plot.all_plots as all_plots
+    monkeypatch.setattr(all_plots, 'create_plot', lambda *args, **kwargs: pytest.fail('rendered'))
+    second = PlotGraphs(export=True, output_dir=str(tmp_path / 'second'), render_cache=cache)
+    second.countplot_x(_events(), x='category', output_name='counts')
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    first_bytes = (tmp_path / 'first' / 'counts.png').read_bytes()
+    assert (tmp_path / 'second' / 'counts.png').read_bytes() == first_bytes
+
+
+def test_render_cache_evicts_least_recently_used(tmp_path):
+    cache = RenderCache(str(tmp_path / 'cache'), max_bytes=10)
+    source = tmp_path / 'chart.png'
+    source.write_bytes(b'x' * 6)
+
+    cache.store('old', 'png', str(source))
+    os.utime(os.path.join(cache.directory, 'old.png'), (0, 0))
+    cache.store('new', 'png', str(source))
+
+    assert sorted(os.listdir(cache.directory)) == ['new.png']
+    assert not cache.restore('old', 'png', str(tmp_path / 'out.png'))
+    assert cache.restore('new', 'png', str(tmp_path / 'out.png'))
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_render_cache_is_bounded_by_default(tmp_path):
+    assert RenderCache(str(tmp_path / 'cache')).max_bytes == 1024 ** 3
@@ -0,0 +1,55 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot.core import CountPlotOptions, PiePlotOptions, TimePlotOptions, create_plot
+from shirin.plot.core.renderer import AggRenderer
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _render(plot_type, options):
+    plot = create_plot(plot_type, options, AggRenderer())
+    plot.render()
+    return plot
+
+
+def test_agg_renderer_never_touches_pyplot():
+    df = pd.DataFrame({
+        'category': ['b', 'a', 'b', 'c'],
+        'group': ['x', 'y', 'x', 'y'],
+        'date': pd.date_range('2024-01-01', periods=4, freq='MS'),
+    })
+    plots = [
+        _render('count', CountPlotOptions(df=df, axis_column='category', hue='group', xlabel='Category')),
+        _render('time', TimePlotOptions(df=df, x='date', group_by='month')),
+        _render('pie', PiePlotOptions(df=pd.DataFrame({'n': [3, 5]}, index=['a', 'b']), col='n')),
+    ]
+
+    assert plt.get_fignums() == []
+    count = plots[0]
+    assert count.ax.get_xlabel() == 'Category'
+    assert count.ax.get_legend() is not None
+    assert [text.get_text() for text in count.ax.texts] != []
+    assert plots[2].ax.get_legend() is not None
+
+
+def test_threads_render_independent_figures():
+    frames = [pd.DataFrame({'category': list('a' * size + 'b')}) for size in range(1, 9)]
+
+    def heights(df):
+        plot = _render('count', CountPlotOptions(df=df, axis_column='category'))
+        return [patch.get_height() for patch in plot.ax.patches], len(plot.ax.texts)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(heights, frames))
+
+    for size, (bar_heights, n_labels) in enumerate(results, start=1):
+        assert bar_heights == [size, 1]
+        assert n_labels == 2
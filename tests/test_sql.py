@@ -0,0 +1,660 @@
+import datetime
+import os
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import event
+
+from shirin.sql import engine as sql_engine
+from shirin.sql import (
+    ParquetOptions,
+    PartitionSpec,
+    QueryCache,
+    get_engine,
+    load_arrow,
+    load_result,
+    run_sql_queries,
+    run_sql_query,
+    save_arrow,
+    stream_query_to_parquet,
+)
+from shirin.sql.dataset import open_result
+from shirin.sql.incremental import read_watermark
+from shirin.sql.partition import partition_bounds
+from shirin.sql.cache import normalize_query, query_key
+from shirin.sql.parquet import write_batches_to_parquet
+
+
+@pytest.fixture
+def db_config(tmp_path, monkeypatch):
+    """A config whose engine points at a local SQLite file instead of DB2."""
+    database = tmp_path / 'warehouse.db'
+    with sqlite3.connect(database) as connection:
+        connection.execute('CREATE TABLE events (id INTEGER, category TEXT, value REAL, created_at TEXT)')
+        connection.executemany(
+            'INSERT INTO events VALUES (?, ?, ?, ?)',
+            [(i, f'cat_{i % 3}', i * 1.5, f'2024-01-{i % 28 + 1:02d}') for i in range(1, 101)],
+        )
+    monkeypatch.setattr(sql_engine, 'connection_url', lambda config: f'sqlite:///{database}')
+    # SQLite has no SET SCHEMA; any statement proves the connect hook runs.
+    monkeypatch.setattr(sql_engine, 'SET_SCHEMA_SQL', "SELECT '{schema}'")
+    yield {'user': 'u', 'password': 'secret', 'host': 'h', 'port': '50000', 'db_name': 'db', 'schema': 'main'}
+    sql_engine.dispose_engines()
+
+
+def test_run_sql_query_returns_dataframe(db_config):
+    df = run_sql_query('SELECT category, COUNT(*) AS n FROM events GROUP BY category', db_config)
+
+    assert df.sort_values('category')['n'].tolist() == [33, 34, 33]
+
+
+def test_engine_is_cached_per_config_and_pool_settings(db_config):
+    engine = get_engine(db_config)
+
+    assert get_engine(dict(db_config)) is engine
+    assert get_engine(db_config, pool_size=2) is not engine
+    assert get_engine({**db_config, 'password': 'other'}) is not engine
+
+
+def test_repeated_queries_reuse_pooled_connections(db_config):
+    connects = []
+    event.listen(get_engine(db_config), 'connect', lambda *args: connects.append(1))
+
+    for i in range(200):
+        run_sql_query(f'SELECT value FROM events WHERE id = {i % 100 + 1}', db_config)
+
+    assert 1 <= len(connects) <= sql_engine.POOL_DEFAULTS['pool_size']
+
+
+def test_missing_config_keys_raise_key_error():
+    with pytest.raises(KeyError, match='password'):
+        get_engine({'user': 'u', 'host': 'h', 'port': 1, 'db_name': 'db', 'schema': 's'})
+
+
+def test_connection_url_escapes_credentials():
+    url = sql_engine.connection_url(
+        {'user': 'u', 'password': 'p@ss:word', 'host': 'h', 'port': '50000', 'db_name': 'db'}
+    )
+
+    assert url.password == 'p@ss:word'
+    assert url.render_as_string(hide_password=True) == 'ibm_db_sa://u:***@h:50000/db'
+
+
+def test_set_schema_runs_when_a_connection_is_opened(db_config, monkeypatch):
+    monkeypatch.setattr(sql_engine, 'SET_SCHEMA_SQL', 'SET SCHEMA {schema}')
+
+    with pytest.raises(Exception, match='SET'):
+        run_sql_query('SELECT 1', db_config)
+
+
+def test_streamed_parquet_matches_dataframe_path(db_config, tmp_path):
+    query = 'SELECT * FROM events ORDER BY id'
+    run_sql_query(query, db_config, output_path=tmp_path / 'full.parquet')
+    run_sql_query(query, db_config, output_path=tmp_path / 'streamed.parquet', batch_size=30)
+
+    streamed = pq.ParquetFile(tmp_path / 'streamed.parquet')
+    assert streamed.metadata.num_row_groups == 4
+    pd.testing.assert_frame_equal(
+        streamed.read().to_pandas(), pd.read_parquet(tmp_path / 'full.parquet')
+    )
+
+
+def test_streaming_unifies_columns_null_in_early_batches(db_config, tmp_path):
+    query = "SELECT id, CASE WHEN id > 50 THEN category END AS late FROM events ORDER BY id"
+    rows = stream_query_to_parquet(query, db_config, tmp_path / 'out.parquet', batch_size=20)
+
+    table = pq.read_table(tmp_path / 'out.parquet')
+    assert rows == 100
+    assert table.schema.field('late').type == pa.string()
+    assert table.column('late').null_count == 50
+
+
+def test_streaming_empty_result_writes_columns(db_config, tmp_path):
+    rows = stream_query_to_parquet('SELECT * FROM events WHERE id < 0', db_config, tmp_path / 'empty.parquet')
+
+    table = pq.read_table(tmp_path / 'empty.parquet')
+    assert rows == 0
+    assert table.column_names == ['id', 'category', 'value', 'created_at']
+
+
+def test_streaming_failure_leaves_no_partial_file(tmp_path):
+    def batches():
+        yield pa.record_batch({'id': [1, 2]})
+        yield pa.record_batch({'id': ['not', 'an int']})
+
+    with pytest.raises(ValueError, match='schema'):
+        write_batches_to_parquet(batches(), tmp_path / 'out.parquet')
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_batch_size_requires_output_path(db_config):
+    with pytest.raises(ValueError, match='output_path'):
+        run_sql_query('SELECT 1', db_config, batch_size=10)
+
+
+def test_run_sql_queries_returns_results_by_name(db_config):
+    queries = {f'q{i}': f'SELECT COUNT(*) AS n FROM events WHERE id <= {i}' for i in range(1, 21)}
+    queries['broken'] = 'SELECT * FROM missing_table'
+
+    results = run_sql_queries(queries, db_config, max_workers=4)
+
+    assert list(results) == list(queries)
+    assert [results[f'q{i}'].data['n'].iloc[0] for i in range(1, 21)] == list(range(1, 21))
+    assert all(result.duration > 0 for result in results.values())
+    assert not results['broken'].ok and 'missing_table' in results['broken'].error
+    assert results['broken'].data is None
+
+
+def test_run_sql_queries_caps_open_connections(db_config):
+    engine = get_engine({**db_config, 'pool_size': 2, 'max_overflow': 0, 'pool_timeout': None})
+    connects = []
+    event.listen(engine, 'connect', lambda *args: connects.append(1))
+
+    results = run_sql_queries(
+        {f'q{i}': 'SELECT * FROM events' for i in range(30)}, db_config, max_workers=8, max_connections=2
+    )
+
+    assert all(result.ok for result in results.values())
+    assert 1 <= len(connects) <= 2
+    assert engine.pool.checkedout() == 0
+
+
+def test_run_sql_queries_waits_past_pool_timeout_for_a_connection(db_config):
+    engine = get_engine({**db_config, 'pool_size': 1, 'max_overflow': 0, 'pool_timeout': None})
+    # Each query holds its connection longer than the configured pool_timeout.
+    event.listen(engine, 'connect', lambda connection, record: connection.create_function(
+        'pause', 0, lambda: time.sleep(0.2)))
+
+    results = run_sql_queries(
+        {f'q{i}': 'SELECT pause(), COUNT(*) AS n FROM events' for i in range(3)},
+        {**db_config, 'pool_timeout': 0.05},
+        max_workers=3,
+        max_connections=1,
+    )
+
+    assert [result.error for result in results.values()] == [None] * 3
+
+
+def test_run_sql_queries_writes_parquet_files(db_config, tmp_path):
+    results = run_sql_queries(
+        {'all': 'SELECT * FROM events', 'first': 'SELECT * FROM events WHERE id = 1'},
+        db_config,
+        output_dir=tmp_path / 'out',
+        batch_size=40,
+    )
+
+    assert results['all'].path == tmp_path / 'out' / 'all.parquet'
+    assert results['all'].data is None
+    assert pq.read_metadata(results['all'].path).num_rows == 100
+    assert pq.read_metadata(results['first'].path).num_rows == 1
+
+
+def _delete_events(db_config):
+    with get_engine(db_config).begin() as connection:
+        connection.exec_driver_sql('DELETE FROM events')
+
+
+def test_cached_query_skips_the_database(db_config):
+    cache = QueryCache()
+    first = run_sql_query('SELECT * FROM events WHERE id <= ?', db_config, params=[10], cache=cache)
+    _delete_events(db_config)
+
+    again = run_sql_query('SELECT *\n  FROM events\n WHERE id <= ?;', db_config, params=[10], cache=cache)
+    other = run_sql_query('SELECT * FROM events WHERE id <= ?', db_config, params=[20], cache=cache)
+
+    pd.testing.assert_frame_equal(again, first)
+    assert len(first) == 10 and other.empty
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_cache_returns_copies(db_config):
+    cache = QueryCache()
+    df = run_sql_query('SELECT * FROM events', db_config, cache=cache)
+    df['value'] = 0
+
+    assert run_sql_query('SELECT * FROM events', db_config, cache=cache)['value'].sum() > 0
+
+
+def test_cache_hits_share_the_cached_columns(db_config):
+    cache = QueryCache()
+    run_sql_query('SELECT * FROM events', db_config, cache=cache)
+    first = run_sql_query('SELECT * FROM events', db_config, cache=cache)
+    second = run_sql_query('SELECT * FROM events', db_config, cache=cache)
+
+    assert np.shares_memory(first['value'].to_numpy(), second['value'].to_numpy())
+    with pd.option_context('mode.copy_on_write', True):
+        first.loc[0, 'value'] = -1.0
+        assert run_sql_query('SELECT * FROM events', db_config, cache=cache)['value'].min() > 0
+
+
+def test_query_key_ignores_password_but_not_connection():
+    config = {'user': 'u', 'password': 'secret', 'host': 'h', 'port': '1', 'db_name': 'db', 'schema': 's'}
+    key = query_key('SELECT 1', config)
+
+    assert query_key('SELECT 1', {**config, 'password': 'rotated'}) == key
+    assert query_key('SELECT 1', {**config, 'schema': 'other'}) != key
+    assert query_key('SELECT 1', config, params=[1]) != key
+    assert 'secret' not in repr(vars(QueryCache()))
+
+
+def test_normalize_query_keeps_quoted_whitespace():
+    assert normalize_query("SELECT  a,\n b FROM t WHERE c = 'x  y' ;") == "SELECT a, b FROM t WHERE c = 'x  y'"
+
+
+def test_cache_entries_expire_after_ttl(db_config):
+    cache = QueryCache(ttl=0.05)
+    run_sql_query('SELECT * FROM events', db_config, cache=cache)
+    _delete_events(db_config)
+    time.sleep(0.1)
+
+    assert run_sql_query('SELECT * FROM events', db_config, cache=cache).empty
+
+
+def test_disk_tier_survives_a_new_cache(db_config, tmp_path):
+    directory = tmp_path / 'cache'
+    first = run_sql_query('SELECT * FROM events', db_config, cache=QueryCache(directory=str(directory)))
+    _delete_events(db_config)
+
+    cache = QueryCache(directory=str(directory))
+    pd.testing.assert_frame_equal(run_sql_query('SELECT * FROM events', db_config, cache=cache), first)
+    assert cache.hits == 1
+
+    cache.invalidate('SELECT * FROM events', db_config)
+    assert run_sql_query('SELECT * FROM events', db_config, cache=cache).empty
+
+
+@pytest.mark.parametrize('disk_format', ['parquet', 'arrow'])
+def test_corrupt_cache_file_is_a_miss(db_config, tmp_path, disk_format):
+    cache = QueryCache(directory=str(tmp_path / 'cache'), disk_format=disk_format)
+    run_sql_query('SELECT * FROM events', db_config, cache=cache)
+    [path] = (tmp_path / 'cache').iterdir()
+    path.write_bytes(path.read_bytes()[:20])
+
+    cache = QueryCache(directory=str(tmp_path / 'cache'), disk_format=disk_format)
+    df = run_sql_query('SELECT * FROM events', db_config, cache=cache)
+
+    assert len(df) == 100
+    assert (cache.hits, cache.misses) == (0, 1)
+    # The fresh result replaced the broken file.
+    fresh = QueryCache(directory=str(tmp_path / 'cache'), disk_format=disk_format)
+    run_sql_query('SELECT * FROM events', db_config, cache=fresh)
+    assert fresh.hits == 1
+
+
+def test_arrow_disk_tier_keeps_arrow_results_mapped(tmp_path):
+    directory = str(tmp_path / 'cache')
+    df = pd.DataFrame({'x': pd.array(range(1_000_000), dtype=pd.ArrowDtype(pa.int64()))})
+    QueryCache(directory=directory, disk_format='arrow').put('key', df)
+    allocated = pa.total_allocated_bytes()
+
+    cached = QueryCache(directory=directory, disk_format='arrow').get('key')
+
+    assert pa.total_allocated_bytes() - allocated < 100_000
+    pd.testing.assert_frame_equal(cached, df)
+
+
+def test_disk_tier_is_bounded_by_default():
+    assert QueryCache().max_disk_bytes == 4 * 1024 ** 3
+
+
+def test_disk_tier_evicts_least_recently_used(db_config, tmp_path):
+    directory = tmp_path / 'cache'
+    cache = QueryCache(directory=str(directory))
+    run_sql_query('SELECT * FROM events WHERE id = 1', db_config, cache=cache)
+    cache.max_disk_bytes = int(1.5 * cache._disk_files()[0][2])
+    run_sql_query('SELECT * FROM events WHERE id = 2', db_config, cache=cache)
+
+    assert os.listdir(directory) == [query_key('SELECT * FROM events WHERE id = 2', db_config) + '.parquet']
+
+
+def test_memory_tier_is_bounded():
+    cache = QueryCache(max_bytes=3000)
+    for i in range(10):
+        cache.put(str(i), pd.DataFrame({'x': range(100)}))
+
+    assert 0 < len(cache) < 10
+    assert cache.memory_bytes <= 3000
+    assert cache.get('9') is not None and cache.get('0') is None
+
+
+def test_arrow_fetch_returns_table_with_dictionary_strings(db_config):
+    query = "SELECT id, category, value, 'row_' || id AS label FROM events ORDER BY id"
+    table = run_sql_query(query, db_config, fetch='table')
+    df = run_sql_query(query, db_config)
+
+    assert isinstance(table, pa.Table)
+    assert pa.types.is_dictionary(table.schema.field('category').type)
+    assert table.schema.field('label').type == pa.string()
+    assert table.column('category').to_pylist() == df['category'].tolist()
+    assert table.column('value').to_pylist() == df['value'].tolist()
+
+
+def test_arrow_fetch_returns_arrow_backed_dataframe(db_config):
+    df = run_sql_query('SELECT * FROM events WHERE id > ? ORDER BY id', db_config, params=[90], fetch='arrow')
+
+    assert df['id'].dtype == pd.ArrowDtype(pa.int64())
+    assert isinstance(df['category'].dtype, pd.CategoricalDtype)
+    assert df['id'].tolist() == list(range(91, 101))
+
+
+def test_arrow_fetch_writes_parquet_directly(db_config, tmp_path):
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'out.parquet', fetch='table')
+
+    table = pq.read_table(tmp_path / 'out.parquet')
+    assert table.num_rows == 100
+    assert pa.types.is_dictionary(table.schema.field('category').type)
+
+
+def test_arrow_fetch_promotes_columns_null_in_early_batches(db_config):
+    from shirin.sql.helpers import fetch_arrow_table
+
+    table = fetch_arrow_table(
+        'SELECT id, CASE WHEN id > 50 THEN value END AS late FROM events ORDER BY id', db_config, batch_size=10
+    )
+
+    assert table.schema.field('late').type == pa.float64()
+    assert table.column('late').null_count == 50
+
+
+def test_cache_keeps_arrow_dtypes_on_disk(db_config, tmp_path):
+    directory = str(tmp_path / 'cache')
+    first = run_sql_query('SELECT * FROM events', db_config, fetch='arrow', cache=QueryCache(directory=directory))
+
+    cached = run_sql_query('SELECT * FROM events', db_config, fetch='arrow', cache=QueryCache(directory=directory))
+
+    pd.testing.assert_frame_equal(cached, first)
+
+
+def test_unknown_fetch_mode_raises(db_config):
+    with pytest.raises(ValueError, match='fetch'):
+        run_sql_query('SELECT 1', db_config, fetch='numpy')
+
+
+NULLABLE_KEY_QUERY = 'SELECT CASE WHEN id % 10 = 0 THEN NULL ELSE id END AS k, value FROM events WHERE id > ?'
+
+
+def test_partition_bounds_cut_numbers_and_dates():
+    assert partition_bounds(PartitionSpec('k', 0, 100, 4)) == [25, 50, 75]
+    assert partition_bounds(PartitionSpec('k', 0, 2, 4)) == [0, 1]
+    assert partition_bounds(PartitionSpec('d', datetime.date(2024, 1, 1), datetime.date(2024, 1, 31), 3)) == [
+        datetime.date(2024, 1, 11), datetime.date(2024, 1, 21)
+    ]
+    with pytest.raises(ValueError):
+        PartitionSpec('k', 10, 10, 4)
+
+
+@pytest.mark.parametrize('fetch', ['pandas', 'arrow'])
+def test_partitioned_query_returns_every_row(db_config, fetch):
+    spec = PartitionSpec('k', 20, 60, num_partitions=4, max_workers=3)
+
+    df = run_sql_query(NULLABLE_KEY_QUERY, db_config, params=[5], partition=spec, fetch=fetch)
+    expected = run_sql_query(NULLABLE_KEY_QUERY, db_config, params=[5])
+
+    assert len(df) == len(expected) == 95
+    assert df['k'].isna().sum() == 10
+    assert sorted(df['value'].tolist()) == sorted(expected['value'].tolist())
+
+
+def test_partitioned_query_writes_dataset_directory(db_config, tmp_path):
+    output_dir = tmp_path / 'events'
+    run_sql_query(NULLABLE_KEY_QUERY, db_config, output_path=output_dir, params=[0],
+                  partition=PartitionSpec('k', 0, 100, num_partitions=9))
+    spec = PartitionSpec('k', 0, 100, num_partitions=5)
+
+    assert run_sql_query(NULLABLE_KEY_QUERY, db_config, output_path=output_dir, params=[0], partition=spec,
+                         parquet=ParquetOptions(write_metadata=False)) is None
+
+    files = sorted(path.name for path in output_dir.iterdir())
+    assert files == ['_SUCCESS'] + [f'part-{i:05d}.parquet' for i in range(5)]
+    assert len(load_result(output_dir)) == 100
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['events', 'warehouse.db']
+
+
+def test_failed_partition_keeps_previous_result(db_config, tmp_path):
+    output_dir = tmp_path / 'out'
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir,
+                  partition=PartitionSpec('id', 0, 100, num_partitions=3))
+    before = sorted(path.name for path in output_dir.iterdir())
+    spec = PartitionSpec('missing_column', 0, 100, num_partitions=3)
+
+    with pytest.raises(RuntimeError, match='3 of 3 partitions failed'):
+        run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, partition=spec)
+
+    assert sorted(path.name for path in output_dir.iterdir()) == before
+    assert len(load_result(output_dir)) == 100
+    assert sorted(path.name for path in tmp_path.iterdir()) == ['out', 'warehouse.db']
+
+
+def _insert_events(db_config, ids):
+    with get_engine(db_config).begin() as connection:
+        for i in ids:
+            connection.exec_driver_sql(
+                'INSERT INTO events VALUES (?, ?, ?, ?)', (i, 'cat_new', i * 1.5, '2024-02-01')
+            )
+
+
+def test_incremental_runs_append_only_new_rows(db_config, tmp_path):
+    output_dir = tmp_path / 'events'
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, incremental='id')
+    assert read_watermark(output_dir)['value'] == 100
+
+    _insert_events(db_config, range(101, 111))
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, incremental='id', batch_size=4)
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, incremental='id', fetch='table')
+
+    state = read_watermark(output_dir)
+    assert state['value'] == 110
+    assert len(state['files']) == 2
+    assert pq.read_metadata(output_dir / state['files'][1]).num_rows == 10
+    assert sorted(pq.ParquetDataset(output_dir).read().column('id').to_pylist()) == list(range(1, 111))
+
+
+def test_incremental_watermark_keeps_key_type(db_config, tmp_path):
+    output_dir = tmp_path / 'events'
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, incremental='created_at')
+    _insert_events(db_config, [101])
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, incremental='created_at')
+
+    assert read_watermark(output_dir)['value'] == '2024-02-01'
+    assert pq.ParquetDataset(output_dir).read().num_rows == 101
+
+
+def test_incremental_drops_files_of_unfinished_runs(db_config, tmp_path):
+    output_dir = tmp_path / 'events'
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, incremental='id')
+    (output_dir / '.increment-crashed.parquet').write_bytes(b'partial')
+    _insert_events(db_config, [101])
+
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, incremental='id')
+
+    assert not (output_dir / '.increment-crashed.parquet').exists()
+    assert pq.ParquetDataset(output_dir).read().num_rows == 101
+
+
+def test_incremental_rejects_a_different_column(db_config, tmp_path):
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path, incremental='id')
+
+    with pytest.raises(ValueError, match="tracked by column 'id'"):
+        run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path, incremental='created_at')
+
+
+@pytest.mark.parametrize('batch_size', [None, 7])
+def test_hive_partitioned_output_with_metadata_summary(db_config, tmp_path, batch_size):
+    output_dir = tmp_path / 'events'
+    options = ParquetOptions(partition_cols=['category'], row_group_size=10, compression='zstd', compression_level=3)
+
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, batch_size=batch_size, parquet=options)
+
+    assert sorted(path.name for path in output_dir.iterdir()) == [
+        '_SUCCESS', '_common_metadata', '_metadata', 'category=cat_0', 'category=cat_1', 'category=cat_2'
+    ]
+    summary = pq.read_metadata(output_dir / '_metadata')
+    assert summary.num_rows == 100
+    assert max(summary.row_group(i).num_rows for i in range(summary.num_row_groups)) == 10
+    assert summary.row_group(0).column(0).compression == 'ZSTD'
+
+    dataset = ds.parquet_dataset(output_dir / '_metadata', partitioning='hive')
+    selected = dataset.to_table(filter=ds.field('category') == 'cat_1')
+    assert selected.num_rows == 34
+
+
+def test_parquet_options_for_single_file(db_config, tmp_path):
+    options = ParquetOptions(row_group_size=25, compression='none', write_statistics=['id'])
+
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'out.parquet', parquet=options)
+
+    metadata = pq.read_metadata(tmp_path / 'out.parquet')
+    assert metadata.num_row_groups == 4
+    assert metadata.row_group(0).column(0).compression == 'UNCOMPRESSED'
+    assert metadata.row_group(0).column(0).is_stats_set
+    assert not metadata.row_group(0).column(1).is_stats_set
+
+
+def test_partitioned_output_replaces_only_previous_results(db_config, tmp_path):
+    options = ParquetOptions(partition_cols=['category'])
+    output_dir = tmp_path / 'events'
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir, parquet=options)
+    run_sql_query('SELECT * FROM events WHERE id <= 3', db_config, output_path=output_dir, parquet=options)
+
+    assert pq.read_metadata(output_dir / '_metadata').num_rows == 3
+    assert len(list(output_dir.glob('category=*'))) == 3
+
+    (tmp_path / 'other').mkdir()
+    (tmp_path / 'other' / 'notes.txt').write_text('keep me')
+    with pytest.raises(ValueError, match='not a partitioned result'):
+        run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'other', parquet=options)
+    assert (tmp_path / 'other' / 'notes.txt').exists()
+
+
+def test_rewriting_without_summary_drops_stale_metadata(db_config, tmp_path):
+    no_summary = ParquetOptions(partition_cols=['category'], write_metadata=False)
+    hive_dir = tmp_path / 'hive'
+    run_sql_query('SELECT * FROM events', db_config, output_path=hive_dir, parquet=ParquetOptions(partition_cols=['category']))
+    run_sql_query('SELECT * FROM events', db_config, output_path=hive_dir, parquet=no_summary)
+    run_sql_query('SELECT * FROM events WHERE id <= 10', db_config, output_path=hive_dir, parquet=no_summary)
+
+    assert not (hive_dir / '_metadata').exists()
+    assert len(load_result(hive_dir)) == 10
+
+    inc_dir = tmp_path / 'inc'
+    run_sql_query('SELECT * FROM events', db_config, output_path=inc_dir, incremental='id')
+    _insert_events(db_config, [101])
+    run_sql_query('SELECT * FROM events', db_config, output_path=inc_dir, incremental='id',
+                  parquet=ParquetOptions(write_metadata=False))
+
+    assert not (inc_dir / '_metadata').exists()
+    assert len(load_result(inc_dir)) == 101
+
+
+def test_partition_and_incremental_datasets_get_metadata(db_config, tmp_path):
+    spec = PartitionSpec('id', 0, 100, num_partitions=4)
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'parts', partition=spec)
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'inc', incremental='id')
+    _insert_events(db_config, [101, 102])
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'inc', incremental='id')
+
+    assert pq.read_metadata(tmp_path / 'parts' / '_metadata').num_rows == 100
+    assert pq.read_metadata(tmp_path / 'inc' / '_metadata').num_rows == 102
+
+
+@pytest.mark.parametrize('compression', [None, 'lz4'])
+def test_arrow_files_round_trip(db_config, tmp_path, compression):
+    df = run_sql_query('SELECT * FROM events ORDER BY id', db_config)
+    save_arrow(df, tmp_path / 'events.arrow', compression=compression)
+
+    loaded = load_arrow(tmp_path / 'events.arrow', columns=['value', 'id'])
+
+    assert loaded.columns.tolist() == ['value', 'id']
+    assert loaded['id'].dtype == pd.ArrowDtype(pa.int64())
+    assert loaded['value'].tolist() == df['value'].tolist()
+
+
+def test_uncompressed_arrow_file_loads_without_copying(tmp_path):
+    save_arrow(pa.table({'x': pa.array(range(1_000_000), pa.int64())}), tmp_path / 'big.arrow')
+    allocated = pa.total_allocated_bytes()
+
+    table = load_arrow(tmp_path / 'big.arrow', as_table=True)
+
+    assert table.num_rows == 1_000_000
+    assert pa.total_allocated_bytes() - allocated < 100_000
+
+
+@pytest.mark.parametrize('batch_size', [None, 30])
+def test_run_sql_query_writes_arrow_files(db_config, tmp_path, batch_size):
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'events.feather', batch_size=batch_size)
+
+    table = load_arrow(tmp_path / 'events.feather', as_table=True)
+    assert table.num_rows == 100
+    assert table.column_names == ['id', 'category', 'value', 'created_at']
+
+
+def test_cache_with_arrow_disk_format(db_config, tmp_path):
+    directory = str(tmp_path / 'cache')
+    first = run_sql_query('SELECT * FROM events', db_config, cache=QueryCache(directory=directory, disk_format='arrow'))
+    _delete_events(db_config)
+
+    cache = QueryCache(directory=directory, disk_format='arrow', compression=None)
+    cached = run_sql_query('SELECT * FROM events', db_config, cache=cache)
+
+    pd.testing.assert_frame_equal(cached, first)
+    assert cache.hits == 1
+    assert all(name.endswith('.arrow') for name in os.listdir(directory))
+
+
+def test_load_result_projects_columns_and_skips_row_groups(db_config, tmp_path):
+    path = tmp_path / 'events.parquet'
+    run_sql_query('SELECT * FROM events ORDER BY id', db_config, output_path=path,
+                  parquet=ParquetOptions(row_group_size=10))
+
+    df = load_result(path, columns=['id', 'value'], filters=[('id', '>', 95), ('category', '!=', 'cat_0')])
+
+    assert df.columns.tolist() == ['id', 'value']
+    assert df['id'].tolist() == [97, 98, 100]
+    fragment = next(open_result(path).get_fragments())
+    assert len(fragment.split_by_row_group(ds.field('id') > 95)) == 1
+
+
+def test_load_result_prunes_hive_partitions(db_config, tmp_path):
+    output_dir = tmp_path / 'events'
+    run_sql_query('SELECT * FROM events', db_config, output_path=output_dir,
+                  parquet=ParquetOptions(partition_cols=['category']))
+    # Unreadable data in a partition the filter excludes is never opened.
+    for data_file in (output_dir / 'category=cat_0').iterdir():
+        data_file.write_bytes(b'corrupt')
+
+    df = load_result(output_dir, filters=[[('category', '=', 'cat_1')], [('category', '=', 'cat_2')]])
+
+    assert len(df) == 67
+    assert set(df['category']) == {'cat_1', 'cat_2'}
+
+
+def test_load_result_unifies_file_schemas(tmp_path):
+    pq.write_table(pa.table({'id': [1, 2], 'note': pa.nulls(2)}), tmp_path / 'increment-1.parquet')
+    pq.write_table(pa.table({'id': [3], 'note': ['late']}), tmp_path / 'increment-2.parquet')
+    (tmp_path / '_watermark.json').write_text('{}')
+
+    table = load_result(tmp_path, filters=pc.field('id') >= 2, as_table=True)
+
+    assert table.schema.field('note').type == pa.string()
+    assert sorted(table.column('note').to_pylist(), key=str) == [None, 'late']
+
+
+def test_load_result_reads_arrow_files(db_config, tmp_path):
+    run_sql_query('SELECT * FROM events', db_config, output_path=tmp_path / 'events.arrow')
+
+    df = load_result(tmp_path / 'events.arrow', columns=['id'], filters=[('id', '<=', 3)])
+
+    assert df['id'].tolist() == [1, 2, 3]
+
+
+def test_load_result_missing_path_raises(tmp_path):
+    with pytest.raises(ValueError, match='not found'):
+        load_result(tmp_path / 'missing.parquet')
@@ -0,0 +1,122 @@
+import matplotlib.pyplot as plt
+import pandas as pd
+import pytest
+
+from shirin.plot import PlotGraphs, TransformCache
+from shirin.plot.core import CountPlotOptions, create_plot
+from shirin.plot.core.cache import fingerprint_frame
+
+
+@pytest.fixture(autouse=True)
+def close_plots():
+    yield
+    plt.close('all')
+
+
+def _events() -> pd.DataFrame:
+    return pd.DataFrame({
+        'category': ['b', 'a', 'b', 'c', 'b', 'a'],
+        'group': ['x', 'y', 'x', 'x', 'y', 'y'],
+        'unused': range(6),
+    })
+
+
+def _heights(plot) -> list:
+    return [patch.get_height() for patch in plot.plot_object.patches]
+
+
+def test_fingerprint_ignores_unused_columns():
+    df = _events()
+    changed = df.assign(unused=df['unused'] * 10)
+
+    assert fingerprint_frame(df, ['category']) == fingerprint_frame(changed, ['category'])
+    assert fingerprint_frame(df, ['category', 'unused']) != fingerprint_frame(changed, ['category', 'unused'])
+
+
+def test_cosmetic_rerender_skips_preprocess_and_transform():
+    cache = TransformCache()
+    first = create_plot('count', CountPlotOptions(df=_events(), axis_column='category'))
+    first.render(cache=cache)
+
+    second = create_plot('count', CountPlotOptions(
+        df=_events(), axis_column='category', xlabel='Category', palette='#ff0000'))
+    second.render(instrument=True, cache=cache)
+
+    assert (cache.hits, cache.misses) == (1, 1)
+    stages = [stage.name for stage in second.render_stats.stages]
+    assert 'preprocess' not in stages and 'transform' not in stages
+    assert _heights(second) == _heights(first) == [3, 2, 1]
+    assert second.plot_object.get_xlabel() == 'Category'
+
+
+def test_data_options_change_the_key():
+    cache = TransformCache()
+    create_plot('count', CountPlotOptions(df=_events(), axis_column='category')).render(cache=cache)
+    plot = create_plot('count', CountPlotOptions(df=_events(), axis_column='category', top_n=2))
+    plot.render(cache=cache)
+
+    assert cache.misses == 2
+    assert _heights(plot) == [3, 2]
+
+
+def test_memory_bound_evicts_least_recently_used():
+    cache = TransformCache(max_bytes=0)
+    plot = create_plot('count', CountPlotOptions(df=_events(), axis_column='category'))
+    plot.render(cache=cache)
+
+    assert len(cache) == 0
+    assert _heights(plot) == [3, 2, 1]
+
+
+def test_disk_tier_survives_new_cache(tmp_path):
+    options = dict(df=_events(), axis_column='category', hue='group')
+    first = create_plot('count', CountPlotOptions(**options))
+    first.render(cache=TransformCache(directory=str(tmp_path)))
+
+    cache = TransformCache(directory=str(tmp_path))
+    plot = create_plot('count', CountPlotOptions(**options))
+    plot.render(cache=cache)
+
+    assert cache.hits == 1
+    assert _heights(plot) == _heights(first)
+
+
+def test_plot_graphs_shares_cache_between_calls():
+    cache = TransformCache()
+    graphs = PlotGraphs(transform_cache=cache)
+
+    graphs.countplot_x(_events(), x='category', xlabel='first')
+    graphs.countplot_x(_events(), x='category', xlabel='second')
+
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_corrupt_disk_entry_is_a_miss(tmp_path):
+    options = dict(df=_events(), axis_column='category')
+    create_plot('count', CountPlotOptions(**options)).render(cache=TransformCache(directory=str(tmp_path)))
+    for path in tmp_path.glob('*.out.parquet'):
+        path.write_bytes(b'truncated')
+
+    cache = TransformCache(directory=str(tmp_path))
+    plot = create_plot('count', CountPlotOptions(**options))
+    plot.render(cache=cache)
+
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert _heights(plot) == [3, 2, 1]
+    assert not list(tmp_path.glob('*.tmp'))
+    assert TransformCache(directory=str(tmp_path)).get(next(tmp_path.glob('*.state.pkl')).name.split('.')[0])
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    first = tmp_path / 'first'
+    create_plot('count', CountPlotOptions(df=_events(), axis_column='category')).render(
+        cache=TransformCache(directory=str(first)))
+    entry_bytes = sum(path.stat().st_size for path in first.iterdir())
+
+    cache = TransformCache(directory=str(tmp_path / 'bounded'), max_disk_bytes=entry_bytes * 3 // 2)
+    create_plot('count', CountPlotOptions(df=_events(), axis_column='category')).render(cache=cache)
+    create_plot('count', CountPlotOptions(df=_events(), axis_column='group')).render(cache=cache)
+
+    kept = [path.name for path in (tmp_path / 'bounded').glob('*.state.pkl')]
+    assert len(kept) == 1 and kept[0] not in {path.name for path in first.iterdir()}
+    assert TransformCache(directory=str(first)).max_disk_bytes == 1024 ** 3